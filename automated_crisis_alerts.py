@@ -21,6 +21,7 @@ class CrisisAlertSystem:
         self.portfolio_value = portfolio_value
         self.alert_history = []
         self.last_check = None
+        self.last_market_data = None
         self.crisis_thresholds = {
             'vix_critical': 40,
             'treasury_10yr_critical': 5.0,
@@ -292,6 +293,7 @@ IMMEDIATE PROTECTIVE ACTIONS REQUIRED:
         # Get current market data
         print("Fetching real-time market data...")
         market_data = self.get_current_market_data()
+        self.last_market_data = market_data
         
         if market_data is None:
             print("❌ Unable to fetch market data. Please check internet connection.")
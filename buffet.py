@@ -13,19 +13,83 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 import logging
-from dataclasses import dataclass
+import csv
+from dataclasses import dataclass, field
+from collections.abc import Mapping
+from functools import lru_cache
+from itertools import chain
 from datetime import datetime, timedelta
 import yfinance as yf
+import sys
 import time
+import math
+import heapq
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
 import requests
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Category codes returned by the metric categorizer, indexed by code
+CATEGORY_LABELS = ("excellent", "good", "fair", "poor")
+
+# Recommendation codes returned by recommend_many, indexed by code
+RECOMMENDATION_LABELS = ("Strong Buy", "Buy", "Hold", "Sell")
+
+# Risk-assessment findings, in the column order used by compute_risk_masks
+RISK_LABELS = (
+    "High debt levels create financial risk",
+    "High valuation leaves little margin of safety",
+    "Volatile earnings make future performance unpredictable",
+    "Low profit margins indicate competitive pressures"
+)
+
+def _mean_std(values: List[float]) -> Tuple[float, float]:
+    """
+    Mean and population standard deviation of a short list in pure Python
+    
+    NumPy's per-call dispatch costs more than the arithmetic on 3-5 EPS growth rates.
+    """
+    n = len(values)
+    avg = math.fsum(values) / n
+    variance = math.fsum((v - avg) * (v - avg) for v in values) / n
+    return avg, variance ** 0.5
+
+def _band(value: float, cutoffs: Tuple[float, ...], higher_is_better: bool = True,
+          inclusive: bool = False) -> int:
+    """
+    Category code of a value against ordered (excellent, good, fair) cutoffs
+
+    Comparisons are strict unless inclusive is set. NaN never reaches a cutoff, so it is poor (3).
+    """
+    for code, cutoff in enumerate(cutoffs):
+        if higher_is_better:
+            reached = value >= cutoff if inclusive else value > cutoff
+        else:
+            reached = value <= cutoff if inclusive else value < cutoff
+        if reached:
+            return code
+    return 3
+
+def _categorize(values: np.ndarray, thresholds: np.ndarray, reverse: np.ndarray) -> np.ndarray:
+    """
+    Categorize a (n_metrics, N) value matrix into int8 codes 0..3 (excellent..poor)
+
+    The code is the number of excellent/good/fair thresholds the value fails to reach,
+    which needs no branching because the thresholds are ordered. NaN values are poor (3),
+    matching categorize_metric.
+    """
+    lower = values[:, :, None] < thresholds[:, None, :3]
+    higher = values[:, :, None] > thresholds[:, None, :3]
+    crossed = np.where(reverse[:, None, None], higher, lower)
+    codes = crossed.sum(axis=2).astype(np.int8)
+    return np.where(np.isnan(values), np.int8(3), codes)
+
+@dataclass(slots=True, frozen=True)
 class StockMetrics:
-    """Data class to hold stock financial metrics"""
+    """Data class to hold stock financial metrics (slotted and immutable to keep large universes compact)"""
     symbol: str
     return_on_equity: float
     operating_margin: float
@@ -48,6 +112,131 @@ class StockMetrics:
     current_price: float
     market_cap: float
 
+@dataclass
+class StockUniverse:
+    """
+    Struct-of-arrays view of a stock universe (one NumPy column per metric)
+
+    EPS growth histories are packed into an (N, 5) matrix padded with NaN,
+    with eps_years holding the number of valid years for each row.
+    """
+    symbols: np.ndarray
+    roe: np.ndarray
+    op_margin: np.ndarray
+    fcf: np.ndarray
+    d2e: np.ndarray
+    int_cov: np.ndarray
+    pe: np.ndarray
+    p_fcf: np.ndarray
+    peg: np.ndarray
+    gross_margin: np.ndarray
+    industry_gm: np.ndarray
+    roic: np.ndarray
+    brand_value: np.ndarray
+    network_effect: np.ndarray
+    insider: np.ndarray
+    ceo_tenure: np.ndarray
+    current_price: np.ndarray
+    market_cap: np.ndarray
+    eps_growth_5yr: np.ndarray
+    eps_years: np.ndarray
+
+    # Display-scaled columns used by the plain-English analysis, derived once per universe
+    roe_pct: np.ndarray = field(init=False)
+    op_margin_pct: np.ndarray = field(init=False)
+    roic_pct: np.ndarray = field(init=False)
+    fcf_b: np.ndarray = field(init=False)
+    margin_advantage: np.ndarray = field(init=False)
+
+    EPS_YEARS = 5
+
+    def __post_init__(self):
+        self.roe_pct = self.roe * 100
+        self.op_margin_pct = self.op_margin * 100
+        self.roic_pct = self.roic * 100
+        self.fcf_b = self.fcf / 1_000_000_000
+        self.margin_advantage = (self.gross_margin - self.industry_gm) * 100
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    @classmethod
+    def from_stockmetrics(cls, stocks: List[StockMetrics]) -> 'StockUniverse':
+        """
+        Build the universe column-wise from a list of StockMetrics
+        """
+        n = len(stocks)
+
+        def column(attr: str, dtype=np.float64) -> np.ndarray:
+            return np.fromiter((getattr(s, attr) for s in stocks), dtype=dtype, count=n)
+
+        eps_matrix = np.full((n, cls.EPS_YEARS), np.nan, dtype=np.float64)
+        eps_years = np.zeros(n, dtype=np.int64)
+        for i, stock in enumerate(stocks):
+            history = stock.eps_growth_5yr[:cls.EPS_YEARS]
+            eps_matrix[i, :len(history)] = history
+            eps_years[i] = len(history)
+
+        return cls(
+            symbols=np.array([s.symbol for s in stocks], dtype=object),
+            roe=column('return_on_equity'),
+            op_margin=column('operating_margin'),
+            fcf=column('free_cash_flow'),
+            d2e=column('debt_to_equity'),
+            int_cov=column('interest_coverage'),
+            pe=column('price_to_earnings'),
+            p_fcf=column('price_to_fcf'),
+            peg=column('peg_ratio'),
+            gross_margin=column('gross_margin'),
+            industry_gm=column('industry_avg_gross_margin'),
+            roic=column('roic'),
+            brand_value=column('brand_value_score'),
+            network_effect=column('network_effect_flag', dtype=bool),
+            insider=column('insider_ownership'),
+            ceo_tenure=column('ceo_tenure'),
+            current_price=column('current_price'),
+            market_cap=column('market_cap'),
+            eps_growth_5yr=eps_matrix,
+            eps_years=eps_years
+        )
+
+    def eps_mean(self) -> np.ndarray:
+        """
+        Mean EPS growth per stock (0 where no history is available)
+        """
+        totals = np.nansum(self.eps_growth_5yr, axis=1)
+        return np.divide(totals, self.eps_years, out=np.zeros(len(self)), where=self.eps_years > 0)
+
+    def eps_std(self) -> np.ndarray:
+        """
+        Population standard deviation of EPS growth per stock (matches np.std)
+        """
+        deviations = self.eps_growth_5yr - self.eps_mean()[:, None]
+        sq_totals = np.nansum(deviations * deviations, axis=1)
+        variance = np.divide(sq_totals, self.eps_years, out=np.zeros(len(self)), where=self.eps_years > 0)
+        return np.sqrt(variance)
+
+@dataclass
+class UniverseStats:
+    """
+    EPS growth statistics computed once for every stock in a StockUniverse
+    """
+    eps_mean: np.ndarray
+    eps_std: np.ndarray
+    neg_years: np.ndarray
+
+    @classmethod
+    def from_universe(cls, universe: StockUniverse) -> 'UniverseStats':
+        """
+        Compute mean, volatility and negative-year counts from the (N, 5) EPS matrix
+        """
+        return cls(
+            eps_mean=universe.eps_mean(),
+            eps_std=universe.eps_std(),
+            # NaN padding compares False, so only real history is counted
+            neg_years=(universe.eps_growth_5yr <= 0).sum(axis=1)
+        )
+
 class BuffettScreener:
     """
     Implements Warren Buffett's investment screening criteria
@@ -177,9 +366,13 @@ class BuffettScreener:
         
         return False, f"REJECT: D/E {stock.debt_to_equity:.2f} >= 0.5 AND Interest Coverage {stock.interest_coverage:.1f} <= 5"
 
-    def filter_consistency_predictability(self, stock: StockMetrics) -> Tuple[bool, str]:
+    def filter_consistency_predictability(self, stock: StockMetrics,
+                                          eps_volatility: Optional[float] = None) -> Tuple[bool, str]:
         """
         Filter 3: Consistency and Predictability
+
+        Args:
+            eps_volatility: Precomputed EPS growth std (from StockUniverse), computed here if None
         """
         # Require at least 3 years of EPS growth data (instead of 5)
         min_years_required = 3
@@ -198,7 +391,8 @@ class BuffettScreener:
             all_positive_enough = negative_years == 0
         
         # Calculate standard deviation of EPS growth
-        eps_volatility = np.std(stock.eps_growth_5yr)
+        if eps_volatility is None:
+            eps_volatility = _mean_std(stock.eps_growth_5yr)[1]
         
         if all_positive_enough and eps_volatility < self.consistency_threshold['eps_growth_volatility_max']:
             criteria = "2025-adjusted" if self.market_adjusted else "traditional"
@@ -286,15 +480,19 @@ class BuffettScreener:
         
         return True, f"FLAG: Review alignment - Insider {stock.insider_ownership:.1%}, CEO tenure {stock.ceo_tenure:.1f}y"
 
-    def calculate_composite_score(self, stock: StockMetrics) -> float:
+    def calculate_composite_score(self, stock: StockMetrics, avg_eps_growth: Optional[float] = None) -> float:
         """
         Calculate composite score for ranking
+
+        Args:
+            avg_eps_growth: Precomputed mean EPS growth (from StockUniverse), computed here if None
         """
         # Calculate FCF Yield
         fcf_yield = stock.free_cash_flow / stock.market_cap if stock.market_cap > 0 else 0
         
         # Calculate average EPS growth rate
-        avg_eps_growth = np.mean(stock.eps_growth_5yr) if stock.eps_growth_5yr else 0
+        if avg_eps_growth is None:
+            avg_eps_growth = _mean_std(stock.eps_growth_5yr)[0] if stock.eps_growth_5yr else 0
         
         # Calculate moat score (0-100)
         margin_advantage = max(0, stock.gross_margin - stock.industry_avg_gross_margin)
@@ -315,9 +513,14 @@ class BuffettScreener:
         
         return composite_score
 
-    def screen_stock(self, stock: StockMetrics) -> Dict:
+    def screen_stock(self, stock: StockMetrics, eps_mean: Optional[float] = None,
+                     eps_std: Optional[float] = None) -> Dict:
         """
         Apply all screening filters to a single stock
+
+        Args:
+            eps_mean: Precomputed mean EPS growth, passed through to the composite score
+            eps_std: Precomputed EPS growth volatility, passed through to the consistency filter
         """
         result = {
             'symbol': stock.symbol,
@@ -331,7 +534,7 @@ class BuffettScreener:
         filters = [
             ('profitability', self.filter_profitability_quality),
             ('stability', self.filter_financial_stability),
-            ('consistency', self.filter_consistency_predictability),
+            ('consistency', lambda s: self.filter_consistency_predictability(s, eps_std)),
             ('management', self.filter_shareholder_management),
             ('valuation', self.filter_fair_valuation),
             ('moat', self.check_durable_moat),
@@ -352,16 +555,30 @@ class BuffettScreener:
         
         # Calculate composite score only for stocks that passed all filters
         if result['passed']:
-            result['composite_score'] = self.calculate_composite_score(stock)
+            result['composite_score'] = self.calculate_composite_score(stock, eps_mean)
         
         return result
 
-    def screen_universe(self, stocks: List[StockMetrics]) -> Dict:
+    def screen_universe(self, stocks: List[StockMetrics], universe: Optional[StockUniverse] = None,
+                        stats: Optional[UniverseStats] = None) -> Dict:
         """
         Screen entire universe of stocks
+
+        Args:
+            stocks: Stocks to screen
+            universe: Struct-of-arrays view of the same stocks (built here if not supplied)
+            stats: Precomputed EPS statistics for the universe (computed here if not supplied)
         """
         logger.info(f"Starting screening of {len(stocks)} stocks...")
         
+        # EPS statistics for the whole universe in one vectorized pass
+        if stats is None:
+            if universe is None:
+                universe = StockUniverse.from_stockmetrics(stocks)
+            stats = UniverseStats.from_universe(universe)
+        eps_mean = stats.eps_mean
+        eps_std = stats.eps_std
+        
         results = {
             'passed': [],
             'rejected': [],
@@ -369,8 +586,8 @@ class BuffettScreener:
             'top_candidates': []
         }
         
-        for stock in stocks:
-            screening_result = self.screen_stock(stock)
+        for i, stock in enumerate(stocks):
+            screening_result = self.screen_stock(stock, float(eps_mean[i]), float(eps_std[i]))
             
             if screening_result['passed']:
                 results['passed'].append(screening_result)
@@ -385,7 +602,12 @@ class BuffettScreener:
         # Get top 20 candidates
         results['top_candidates'] = results['passed'][:20]
         
-        logger.info(f"Screening complete: {len(results['passed'])} passed, {len(results['rejected'])} rejected")
+        # Counts are fixed once screening is done, so record them for the report printers
+        results['passed_count'] = len(results['passed'])
+        results['rejected_count'] = len(results['rejected'])
+        results['flagged_count'] = len(results['flagged'])
+        
+        logger.info(f"Screening complete: {results['passed_count']} passed, {results['rejected_count']} rejected")
         
         return results
 
@@ -526,14 +748,14 @@ def calculate_eps_growth_rates(income_stmt: pd.DataFrame) -> List[float]:
         # Sort by date (most recent first)
         eps_data = eps_data.sort_index(ascending=False)
         
-        # Calculate year-over-year growth rates
-        growth_rates = []
-        for i in range(1, min(6, len(eps_data))):  # Last 5 years
-            if eps_data.iloc[i] != 0:
-                growth_rate = (eps_data.iloc[i-1] - eps_data.iloc[i]) / abs(eps_data.iloc[i])
-                growth_rates.append(growth_rate)
+        # Calculate year-over-year growth rates over the last 5 years in one array pass,
+        # skipping years whose prior EPS is zero
+        eps = eps_data.to_numpy(dtype=np.float64)[:6]
+        current, previous = eps[:-1], eps[1:]
+        mask = previous != 0
+        growth_rates = (current[mask] - previous[mask]) / np.abs(previous[mask])
         
-        return growth_rates[:5]  # Return last 5 years
+        return growth_rates.tolist()
     except Exception as e:
         logger.warning(f"Error calculating EPS growth: {e}")
         return []
@@ -699,6 +921,25 @@ def fetch_stock_data(symbol: str) -> Optional[StockMetrics]:
         logger.error(f"Error processing {symbol}: {e}")
         return None
 
+def fetch_stocks_concurrently(symbols: List[str], max_workers: int = 8) -> List[StockMetrics]:
+    """
+    Fetch several symbols with fetch_stock_data in a thread pool
+    
+    The fetches are network-bound, so threads overlap the yfinance round-trips.
+    
+    Args:
+        symbols: Ticker symbols to fetch
+        max_workers: Maximum number of concurrent fetches
+    
+    Returns:
+        StockMetrics for the symbols that returned usable data, in input order
+    """
+    for symbol in symbols:
+        print(f"Fetching {symbol}...")
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(symbols)))) as executor:
+        return [stock for stock in executor.map(fetch_stock_data, symbols) if stock]
+
 def load_real_market_data(max_stocks: int = 50) -> List[StockMetrics]:
     """
     Load real market data from Yahoo Finance API
@@ -737,14 +978,17 @@ def load_real_market_data(max_stocks: int = 50) -> List[StockMetrics]:
 def load_market_data_from_api() -> List[StockMetrics]:
     
     print("INFO: Using sample data. To use real market data, call load_market_data_from_api(use_real_data=True)")
-    return create_sample_data()
+    return list(create_sample_data())
 
-def create_sample_data() -> List[StockMetrics]:
+@lru_cache(maxsize=1)
+def create_sample_data() -> Tuple[StockMetrics, ...]:
     """
     Create expanded sample stock data for testing the screener
     This simulates a more realistic universe with various stock types
+    
+    The data is pure literals, so it is built once and returned as a cached tuple.
     """
-    sample_stocks = [
+    sample_stocks = (
         StockMetrics(
             symbol="AAPL",
             return_on_equity=0.25,
@@ -959,7 +1203,7 @@ def create_sample_data() -> List[StockMetrics]:
             current_price=58.0,
             market_cap=250000000000
         )
-    ]
+    )
     
     return sample_stocks
 
@@ -972,9 +1216,9 @@ def print_screening_results(results: Dict):
     print("="*80)
     
     print(f"\nSUMMARY:")
-    print(f"  Stocks Passed: {len(results['passed'])}")
-    print(f"  Stocks Rejected: {len(results['rejected'])}")
-    print(f"  Stocks Flagged for Review: {len(results['flagged'])}")
+    print(f"  Stocks Passed: {results['passed_count']}")
+    print(f"  Stocks Rejected: {results['rejected_count']}")
+    print(f"  Stocks Flagged for Review: {results['flagged_count']}")
     
     if results['top_candidates']:
         print(f"\nTOP 20 MODERN BUFFETT CANDIDATES:")
@@ -988,7 +1232,7 @@ def print_screening_results(results: Dict):
                 for flag in candidate['flags']:
                     print(f"     → {flag}")
     
-    if results['rejected']:
+    if results['rejected_count']:
         print(f"\nREJECTED STOCKS (Sample):")
         print("-" * 80)
         for rejected in results['rejected'][:5]:  # Show first 5
@@ -997,11 +1241,239 @@ def print_screening_results(results: Dict):
                 print(f"  → {rejection}")
             print()
 
+@dataclass
+class ProfitBlock:
+    """Profitability figures (in display units) and category codes for one stock"""
+    roe_pct: float
+    roe_category: int
+    margin_pct: float
+    margin_category: int
+    fcf_billions: float
+    fcf_category: int
+
+@dataclass
+class StabilityBlock:
+    """Financial stability figures and category codes for one stock"""
+    debt_to_equity: float
+    debt_category: int
+    interest_coverage: float
+    coverage_category: int
+
+@dataclass
+class ValuationBlock:
+    """Valuation figures and category codes for one stock"""
+    price_to_earnings: float
+    pe_category: int
+    price_to_fcf: float
+    p_fcf_category: int
+    peg_ratio: float
+    peg_category: int
+
+@dataclass
+class GrowthBlock:
+    """EPS growth statistics and category codes for one stock (years == 0 means no history)"""
+    years: int
+    avg_growth: float
+    volatility: float
+    negative_years: int
+    growth_category: int
+    volatility_category: int
+    negative_years_category: int
+
+@dataclass
+class MoatBlock:
+    """Competitive moat figures (in display units) and category codes for one stock"""
+    roic_pct: float
+    roic_category: int
+    margin_advantage: float
+    margin_advantage_category: int
+    brand_value_score: float
+    brand_category: int
+    network_effect: bool
+
+@dataclass
+class FundamentalReport:
+    """
+    Structured result of FundamentalAnalyzer.analyze, rendered to text only on demand
+
+    Category codes index CATEGORY_LABELS, risks index RISK_LABELS and
+    recommendation indexes RECOMMENDATION_LABELS.
+    """
+    symbol: str
+    current_price: float
+    market_cap: float
+    composite_score: float
+    passed_traditional: bool
+    passed_adjusted: bool
+    recommendation: int
+    profitability: ProfitBlock
+    stability: StabilityBlock
+    valuation: ValuationBlock
+    growth: GrowthBlock
+    moat: MoatBlock
+    risks: List[int]
+
+# Upper-case category labels used in section headings
+_CATEGORY_HEADINGS = tuple(label.upper() for label in CATEGORY_LABELS)
+
+# Plain-English verdicts per category code (excellent, good, fair, poor), built once at import
+_ROE_PHRASES = (
+    "✅ This is excellent - the company is very efficient with shareholder money.",
+    "✅ This is solid - the company uses shareholder money well.",
+    "⚠️ This is acceptable but not impressive.",
+    "❌ This is concerning - the company struggles to generate returns."
+)
+
+_MARGIN_PHRASES = (
+    "✅ Excellent margins indicate strong pricing power and cost control.",
+    "✅ Good margins show the company runs an efficient operation.",
+    "⚠️ Fair margins suggest the business is competitive but not exceptional.",
+    "❌ Poor margins indicate pricing pressure or inefficient operations."
+)
+
+# Free cash flow is only banded strong / positive / negative, so fair shares the negative text
+_FCF_PHRASES = (
+    "✅ Strong positive cash flow means the company generates real money, not just accounting profits.",
+    "✅ Positive cash flow is good - the company generates actual cash.",
+    "❌ Negative cash flow is concerning - the company is burning cash.",
+    "❌ Negative cash flow is concerning - the company is burning cash."
+)
+
+_DEBT_PHRASES = (
+    "✅ Excellent - very conservative debt levels provide financial flexibility.",
+    "✅ Good - manageable debt levels that shouldn't cause problems.",
+    "⚠️ Fair - moderate debt levels that need monitoring.",
+    "❌ Poor - high debt levels create financial risk."
+)
+
+_COVERAGE_PHRASES = (
+    "✅ Excellent coverage - no concerns about meeting debt obligations.",
+    "✅ Good coverage - comfortable ability to service debt.",
+    "⚠️ Adequate coverage but should be monitored.",
+    "❌ Poor coverage - potential difficulty paying interest."
+)
+
+_PE_PHRASES = (
+    "✅ Excellent value - you're getting earnings at a discount.",
+    "✅ Good value - reasonable price for the earnings.",
+    "⚠️ Fair value - not cheap but not expensive.",
+    "❌ Expensive - you're paying a premium for earnings."
+)
+
+_P_FCF_PHRASES = (
+    "✅ Excellent - getting cash generation at a great price.",
+    "✅ Good - reasonable price for the cash generation.",
+    "⚠️ Fair - not a bargain but not overpriced.",
+    "❌ Expensive - paying a high price for cash flow."
+)
+
+_PEG_PHRASES = (
+    "✅ Excellent - great value considering growth potential.",
+    "✅ Good - fair value considering growth.",
+    "⚠️ Fair - paying for growth but not excessive.",
+    "❌ Expensive - paying too much for the growth rate."
+)
+
+_GROWTH_PHRASES = (
+    "✅ Excellent growth rate showing strong business momentum.",
+    "✅ Good growth rate indicating a healthy business.",
+    "⚠️ Modest growth - steady but not spectacular.",
+    "❌ Poor growth - business may be struggling."
+)
+
+_VOLATILITY_PHRASES = (
+    "✅ Very consistent growth - predictable business model.",
+    "✅ Reasonably consistent - some variation but manageable.",
+    "⚠️ Moderate volatility - growth can be unpredictable.",
+    "❌ High volatility - very unpredictable earnings."
+)
+
+_NEGATIVE_YEARS_PHRASES = (
+    "✅ No down years - remarkably consistent performance.",
+    "✅ Only one down year - generally reliable performance.",
+    "⚠️ Multiple down years - business faces challenges.",
+    "❌ Many down years - inconsistent performance."
+)
+
+_ROIC_PHRASES = (
+    "✅ Excellent ROIC indicates strong competitive advantages.",
+    "✅ Good ROIC suggests solid competitive positioning.",
+    "⚠️ Fair ROIC - company has some competitive advantages.",
+    "❌ Poor ROIC - limited competitive advantages."
+)
+
+_MARGIN_ADVANTAGE_PHRASES = (
+    "✅ Significant margin advantage indicates strong pricing power.",
+    "✅ Good margin advantage shows competitive strength.",
+    "⚠️ Similar margins to competitors - limited pricing power.",
+    "❌ Below-average margins suggest competitive weakness."
+)
+
+_BRAND_PHRASES = (
+    "✅ Excellent brand strength provides pricing power and customer loyalty.",
+    "✅ Strong brand helps differentiate from competitors.",
+    "⚠️ Moderate brand strength - some competitive protection.",
+    "❌ Weak brand - limited protection from competition."
+)
+
+# Indexed by the network-effect flag (False, True)
+_NETWORK_PHRASES = (
+    "⚠️ No network effects - growth depends on traditional competitive advantages.",
+    "✅ Network effects make the product more valuable as more people use it."
+)
+
 class FundamentalAnalyzer:
     """
     Provides detailed fundamental analysis in plain English
     """
     
+    # Action-plan text per recommendation, with {symbol} filled in at render time
+    ACTION_TEMPLATES = {
+        "Strong Buy": """
+🎯 ACTION PLAN:
+   
+   📈 IMMEDIATE: Consider building a position in {symbol}
+   💰 TARGET ALLOCATION: 3-5% of portfolio for individual investors
+   📊 ENTRY STRATEGY: Can buy at current levels or on any weakness
+   🎯 PRICE TARGET: Monitor for 15-25% appreciation over 12-18 months
+   ⏰ TIMELINE: Suitable for long-term hold (3+ years)
+   
+   🔄 MONITORING: Review quarterly earnings and annual metrics
+""",
+        "Buy": """
+🎯 ACTION PLAN:
+   
+   📈 STRATEGY: Consider accumulating {symbol} on market weakness
+   💰 TARGET ALLOCATION: 2-3% of portfolio
+   📊 ENTRY STRATEGY: Wait for 5-10% pullback or buy gradually
+   🎯 EXPECTATIONS: Modest outperformance over 2-3 years
+   ⏰ TIMELINE: Medium to long-term investment
+   
+   🔄 MONITORING: Watch quarterly results and debt levels
+""",
+        "Hold": """
+🎯 ACTION PLAN:
+   
+   📊 STRATEGY: Hold current position but don't add new money
+   🔍 MONITORING: Watch closely for improvement or deterioration
+   ⚖️ REVIEW: Consider selling if better opportunities arise
+   📉 EXIT TRIGGERS: Sell if fundamentals worsen or valuation becomes excessive
+   
+   🔄 DECISION POINT: Reassess in 6 months
+""",
+        "Sell": """
+🎯 ACTION PLAN:
+   
+   🚫 RECOMMENDATION: Avoid {symbol} at current levels
+   📉 EXISTING POSITION: Consider reducing or exiting
+   🔍 ALTERNATIVE: Look for higher-quality companies
+   ⚠️ RISK: High probability of underperformance
+   
+   🔄 FUTURE REVIEW: Reassess if fundamentals improve significantly
+"""
+    }
+    ACTION_FOOTER = "\n" + "="*80 + "\n"
+    
     def __init__(self):
         self.metric_ranges = {
             'roe': {'excellent': 0.20, 'good': 0.15, 'fair': 0.10, 'poor': 0.05},
@@ -1011,6 +1483,26 @@ class FundamentalAnalyzer:
             'price_to_fcf': {'excellent': 12, 'good': 18, 'fair': 25, 'poor': 35},
             'roic': {'excellent': 0.15, 'good': 0.12, 'fair': 0.08, 'poor': 0.05}
         }
+        
+        # Packed thresholds for the categorizer: one row per metric, lower-is-better flags alongside
+        self.metric_index = {name: row for row, name in enumerate(self.metric_ranges)}
+        self.thresholds = np.array([
+            [ranges['excellent'], ranges['good'], ranges['fair'], ranges['poor']]
+            for ranges in self.metric_ranges.values()
+        ], dtype=np.float64)
+        self.reverse_scale = np.array([
+            name in ('debt_to_equity', 'pe_ratio', 'price_to_fcf') for name in self.metric_ranges
+        ], dtype=np.bool_)
+        
+        # Universe column backing each metric, used by categorize_many
+        self.metric_columns = {
+            'roe': 'roe',
+            'operating_margin': 'op_margin',
+            'debt_to_equity': 'd2e',
+            'pe_ratio': 'pe',
+            'price_to_fcf': 'p_fcf',
+            'roic': 'roic'
+        }
     
     def categorize_metric(self, value: float, metric_type: str, reverse_scale: bool = False) -> str:
         """
@@ -1021,31 +1513,33 @@ class FundamentalAnalyzer:
             metric_type: Type of metric (roe, debt_to_equity, etc.)
             reverse_scale: True if lower values are better (like debt ratios)
         """
-        ranges = self.metric_ranges.get(metric_type, {})
+        row = self.metric_index.get(metric_type)
         
-        if not ranges:
+        if row is None:
             return "fair"
         
-        if reverse_scale:
-            # For debt ratios, P/E, etc. where lower is better
-            if value <= ranges['excellent']:
-                return "excellent"
-            elif value <= ranges['good']:
-                return "good"
-            elif value <= ranges['fair']:
-                return "fair"
-            else:
-                return "poor"
-        else:
-            # For ROE, margins, etc. where higher is better
-            if value >= ranges['excellent']:
-                return "excellent"
-            elif value >= ranges['good']:
-                return "good"
-            elif value >= ranges['fair']:
-                return "fair"
-            else:
-                return "poor"
+        cutoffs = tuple(self.thresholds[row, :3].tolist())
+        return CATEGORY_LABELS[_band(value, cutoffs, higher_is_better=not reverse_scale, inclusive=True)]
+    
+    def categorize_many(self, universe: StockUniverse) -> Dict[str, np.ndarray]:
+        """
+        Categorize every metric for every stock in the universe in one pass
+        
+        Returns:
+            Dict of metric name -> int8 category codes (index into CATEGORY_LABELS)
+        """
+        values = np.vstack([getattr(universe, self.metric_columns[name]) for name in self.metric_ranges])
+        codes = _categorize(values, self.thresholds, self.reverse_scale)
+        return {name: codes[row] for name, row in self.metric_index.items()}
+    
+    def _category_code(self, categories: Optional[Dict[str, np.ndarray]], i: Optional[int],
+                       value: float, metric_type: str, reverse_scale: bool = False) -> int:
+        """
+        Category code from precomputed universe codes, falling back to categorize_metric
+        """
+        if categories is not None and i is not None:
+            return int(categories[metric_type][i])
+        return CATEGORY_LABELS.index(self.categorize_metric(value, metric_type, reverse_scale))
     
     def get_recommendation(self, stock: StockMetrics, composite_score: float, passed_traditional: bool, passed_adjusted: bool) -> str:
         """
@@ -1072,359 +1566,570 @@ class FundamentalAnalyzer:
         else:
             return "Sell"
     
-    def explain_profitability(self, stock: StockMetrics) -> str:
+    def recommend_many(self, universe: StockUniverse, composite_scores: np.ndarray,
+                       passed_traditional_mask: np.ndarray, passed_adjusted_mask: np.ndarray) -> np.ndarray:
         """
-        Explain profitability metrics in plain English
+        Vectorized get_recommendation for every stock in the universe
+        
+        Returns:
+            int8 recommendation codes (index into RECOMMENDATION_LABELS)
         """
-        roe_category = self.categorize_metric(stock.return_on_equity, 'roe')
-        margin_category = self.categorize_metric(stock.operating_margin, 'operating_margin')
+        top_tier = passed_traditional_mask | (passed_adjusted_mask & (composite_scores > 0.4))
+        quality = (universe.roe > 0.15) & (universe.pe < 25) & (universe.d2e < 0.5)
         
-        roe_pct = stock.return_on_equity * 100
-        margin_pct = stock.operating_margin * 100
-        fcf_billions = stock.free_cash_flow / 1_000_000_000
+        strong_buy_mask = top_tier & quality
+        buy_mask = top_tier | (passed_adjusted_mask & (composite_scores > 0.25))
+        hold_mask = passed_adjusted_mask & (composite_scores > 0.15)
+        sell_mask = ~(buy_mask | hold_mask)
         
-        explanation = f"""
-💰 PROFITABILITY ANALYSIS:
-   
-📈 Return on Equity (ROE): {roe_pct:.1f}% - {roe_category.upper()}
-   This shows how efficiently the company uses shareholder money to generate profits.
-   {roe_pct:.1f}% means for every $100 of shareholder equity, the company generates ${roe_pct:.1f} in profit.
-   {"✅ This is excellent - the company is very efficient with shareholder money." if roe_category == "excellent" 
-   else "✅ This is solid - the company uses shareholder money well." if roe_category == "good"
-   else "⚠️ This is acceptable but not impressive." if roe_category == "fair"
-   else "❌ This is concerning - the company struggles to generate returns."}
-
-🏭 Operating Margin: {margin_pct:.1f}% - {margin_category.upper()}
-   This shows what percentage of revenue becomes operating profit after expenses.
-   {margin_pct:.1f}% means the company keeps ${margin_pct:.1f} in operating profit for every $100 of sales.
-   {"✅ Excellent margins indicate strong pricing power and cost control." if margin_category == "excellent"
-   else "✅ Good margins show the company runs an efficient operation." if margin_category == "good" 
-   else "⚠️ Fair margins suggest the business is competitive but not exceptional." if margin_category == "fair"
-   else "❌ Poor margins indicate pricing pressure or inefficient operations."}
-
-💸 Free Cash Flow: ${fcf_billions:.1f}B {"per year" if fcf_billions > 0 else ""}
-   This is the actual cash the company generates that could be returned to shareholders.
-   {"✅ Strong positive cash flow means the company generates real money, not just accounting profits." if fcf_billions > 5
-   else "✅ Positive cash flow is good - the company generates actual cash." if fcf_billions > 0
-   else "❌ Negative cash flow is concerning - the company is burning cash."}
-"""
-        return explanation
+        codes = np.select([strong_buy_mask, buy_mask, hold_mask, sell_mask], [0, 1, 2, 3], default=3)
+        return codes.astype(np.int8)
     
-    def explain_financial_stability(self, stock: StockMetrics) -> str:
+    def compute_risk_masks(self, universe: StockUniverse, stats: UniverseStats) -> np.ndarray:
+        """
+        Evaluate the four risk-assessment checks for every stock at once
+        
+        Returns:
+            (N, 4) bool array, one column per entry of RISK_LABELS
+        """
+        return np.stack([
+            universe.d2e > 0.6,
+            universe.pe > 30,
+            (universe.eps_years > 0) & (stats.eps_std > 0.3),
+            universe.op_margin < 0.08
+        ], axis=1)
+    
+    def explain_profitability(self, stock: StockMetrics, categories: Optional[Dict[str, np.ndarray]] = None,
+                              i: Optional[int] = None, universe: Optional[StockUniverse] = None) -> str:
+        """
+        Explain profitability metrics in plain English
+        
+        Args:
+            universe: StockUniverse holding precomputed percentage columns, read at row i
+        """
+        return self._render_profitability(self._profitability_block(stock, categories, i, universe))
+    
+    def explain_financial_stability(self, stock: StockMetrics, categories: Optional[Dict[str, np.ndarray]] = None,
+                                    i: Optional[int] = None) -> str:
         """
         Explain financial stability metrics in plain English
         """
-        debt_category = self.categorize_metric(stock.debt_to_equity, 'debt_to_equity', reverse_scale=True)
-        
-        explanation = f"""
-🛡️ FINANCIAL STABILITY:
-
-💳 Debt-to-Equity Ratio: {stock.debt_to_equity:.2f} - {debt_category.upper()}
-   This shows how much debt the company has relative to shareholder equity.
-   A ratio of {stock.debt_to_equity:.2f} means the company has ${stock.debt_to_equity:.2f} of debt for every $1 of equity.
-   {"✅ Excellent - very conservative debt levels provide financial flexibility." if debt_category == "excellent"
-   else "✅ Good - manageable debt levels that shouldn't cause problems." if debt_category == "good"
-   else "⚠️ Fair - moderate debt levels that need monitoring." if debt_category == "fair"
-   else "❌ Poor - high debt levels create financial risk."}
-
-🔢 Interest Coverage: {stock.interest_coverage:.1f}x
-   This shows how easily the company can pay its interest expenses.
-   The company earns {stock.interest_coverage:.1f} times more than needed to cover interest payments.
-   {"✅ Excellent coverage - no concerns about meeting debt obligations." if stock.interest_coverage > 10
-   else "✅ Good coverage - comfortable ability to service debt." if stock.interest_coverage > 5
-   else "⚠️ Adequate coverage but should be monitored." if stock.interest_coverage > 3
-   else "❌ Poor coverage - potential difficulty paying interest."}
-"""
-        return explanation
+        return self._render_stability(self._stability_block(stock, categories, i))
     
-    def explain_valuation(self, stock: StockMetrics) -> str:
+    def explain_valuation(self, stock: StockMetrics, categories: Optional[Dict[str, np.ndarray]] = None,
+                          i: Optional[int] = None) -> str:
         """
         Explain valuation metrics in plain English
         """
-        pe_category = self.categorize_metric(stock.price_to_earnings, 'pe_ratio', reverse_scale=True)
-        fcf_category = self.categorize_metric(stock.price_to_fcf, 'price_to_fcf', reverse_scale=True)
-        
-        explanation = f"""
-💵 VALUATION ANALYSIS:
-
-📊 Price-to-Earnings (P/E): {stock.price_to_earnings:.1f} - {pe_category.upper()}
-   This shows how much investors pay for each dollar of annual earnings.
-   A P/E of {stock.price_to_earnings:.1f} means you pay ${stock.price_to_earnings:.1f} for every $1 of annual profit.
-   {"✅ Excellent value - you're getting earnings at a discount." if pe_category == "excellent"
-   else "✅ Good value - reasonable price for the earnings." if pe_category == "good"
-   else "⚠️ Fair value - not cheap but not expensive." if pe_category == "fair"
-   else "❌ Expensive - you're paying a premium for earnings."}
-
-💰 Price-to-Free Cash Flow: {stock.price_to_fcf:.1f} - {fcf_category.upper()}
-   This shows how much you pay for each dollar of actual cash the company generates.
-   A ratio of {stock.price_to_fcf:.1f} means you pay ${stock.price_to_fcf:.1f} for every $1 of annual cash flow.
-   {"✅ Excellent - getting cash generation at a great price." if fcf_category == "excellent"
-   else "✅ Good - reasonable price for the cash generation." if fcf_category == "good"
-   else "⚠️ Fair - not a bargain but not overpriced." if fcf_category == "fair"
-   else "❌ Expensive - paying a high price for cash flow."}
-
-🚀 PEG Ratio: {stock.peg_ratio:.2f}
-   This adjusts the P/E ratio for growth rate. A PEG under 1.0 suggests good value.
-   {"✅ Excellent - great value considering growth potential." if stock.peg_ratio < 1.0
-   else "✅ Good - fair value considering growth." if stock.peg_ratio < 1.5
-   else "⚠️ Fair - paying for growth but not excessive." if stock.peg_ratio < 2.0
-   else "❌ Expensive - paying too much for the growth rate."}
-"""
-        return explanation
+        return self._render_valuation(self._valuation_block(stock, categories, i))
     
-    def explain_growth_consistency(self, stock: StockMetrics) -> str:
+    def explain_growth_consistency(self, stock: StockMetrics, stats: Optional[UniverseStats] = None,
+                                   i: Optional[int] = None) -> str:
         """
         Explain growth and consistency metrics in plain English
+
+        Args:
+            stats: Precomputed universe EPS statistics; row i is used instead of recomputing
+            i: Index of the stock within the universe the stats were built from
         """
-        if not stock.eps_growth_5yr:
-            return "\n📈 GROWTH CONSISTENCY: No sufficient earnings history available.\n"
+        return self._render_growth(self._growth_block(stock, stats, i))
+    
+    def explain_competitive_moat(self, stock: StockMetrics, universe: Optional[StockUniverse] = None,
+                                 i: Optional[int] = None) -> str:
+        """
+        Explain competitive advantages in plain English
         
-        avg_growth = np.mean(stock.eps_growth_5yr) * 100
-        growth_volatility = np.std(stock.eps_growth_5yr)
-        negative_years = sum(1 for g in stock.eps_growth_5yr if g <= 0)
+        Args:
+            universe: StockUniverse holding precomputed percentage columns, read at row i
+        """
+        return self._render_moat(self._moat_block(stock, universe, i))
+    
+    def _profitability_block(self, stock: StockMetrics, categories: Optional[Dict[str, np.ndarray]],
+                             i: Optional[int], universe: Optional[StockUniverse] = None) -> ProfitBlock:
+        if universe is not None and i is not None:
+            roe_pct = universe.roe_pct[i]
+            margin_pct = universe.op_margin_pct[i]
+            fcf_billions = universe.fcf_b[i]
+        else:
+            roe_pct = stock.return_on_equity * 100
+            margin_pct = stock.operating_margin * 100
+            fcf_billions = stock.free_cash_flow / 1_000_000_000
+        
+        return ProfitBlock(
+            roe_pct=roe_pct,
+            roe_category=self._category_code(categories, i, stock.return_on_equity, 'roe'),
+            margin_pct=margin_pct,
+            margin_category=self._category_code(categories, i, stock.operating_margin, 'operating_margin'),
+            fcf_billions=fcf_billions,
+            fcf_category=_band(fcf_billions, (5, 0))
+        )
+    
+    def _stability_block(self, stock: StockMetrics, categories: Optional[Dict[str, np.ndarray]],
+                         i: Optional[int]) -> StabilityBlock:
+        return StabilityBlock(
+            debt_to_equity=stock.debt_to_equity,
+            debt_category=self._category_code(categories, i, stock.debt_to_equity, 'debt_to_equity', reverse_scale=True),
+            interest_coverage=stock.interest_coverage,
+            coverage_category=_band(stock.interest_coverage, (10, 5, 3))
+        )
+    
+    def _valuation_block(self, stock: StockMetrics, categories: Optional[Dict[str, np.ndarray]],
+                         i: Optional[int]) -> ValuationBlock:
+        return ValuationBlock(
+            price_to_earnings=stock.price_to_earnings,
+            pe_category=self._category_code(categories, i, stock.price_to_earnings, 'pe_ratio', reverse_scale=True),
+            price_to_fcf=stock.price_to_fcf,
+            p_fcf_category=self._category_code(categories, i, stock.price_to_fcf, 'price_to_fcf', reverse_scale=True),
+            peg_ratio=stock.peg_ratio,
+            peg_category=_band(stock.peg_ratio, (1.0, 1.5, 2.0), higher_is_better=False)
+        )
+    
+    def _growth_block(self, stock: StockMetrics, stats: Optional[UniverseStats], i: Optional[int]) -> GrowthBlock:
+        years = len(stock.eps_growth_5yr)
+        if not years:
+            return GrowthBlock(years=0, avg_growth=0.0, volatility=0.0, negative_years=0,
+                               growth_category=3, volatility_category=3, negative_years_category=3)
         
-        explanation = f"""
-📈 GROWTH CONSISTENCY:
-
-📊 Average Annual Earnings Growth: {avg_growth:.1f}%
-   Over the last {len(stock.eps_growth_5yr)} years, earnings grew an average of {avg_growth:.1f}% per year.
-   {"✅ Excellent growth rate showing strong business momentum." if avg_growth > 15
-   else "✅ Good growth rate indicating a healthy business." if avg_growth > 8
-   else "⚠️ Modest growth - steady but not spectacular." if avg_growth > 3
-   else "❌ Poor growth - business may be struggling."}
-
-📉 Growth Volatility: {growth_volatility:.3f}
-   This measures how consistent the growth has been (lower is better).
-   {"✅ Very consistent growth - predictable business model." if growth_volatility < 0.15
-   else "✅ Reasonably consistent - some variation but manageable." if growth_volatility < 0.25
-   else "⚠️ Moderate volatility - growth can be unpredictable." if growth_volatility < 0.35
-   else "❌ High volatility - very unpredictable earnings."}
-
-📅 Negative Growth Years: {negative_years} out of {len(stock.eps_growth_5yr)}
-   {"✅ No down years - remarkably consistent performance." if negative_years == 0
-   else "✅ Only one down year - generally reliable performance." if negative_years == 1
-   else "⚠️ Multiple down years - business faces challenges." if negative_years <= 2
-   else "❌ Many down years - inconsistent performance."}
-"""
-        return explanation
+        if stats is not None and i is not None:
+            avg_growth = stats.eps_mean[i] * 100
+            growth_volatility = stats.eps_std[i]
+            negative_years = int(stats.neg_years[i])
+        else:
+            avg_growth, growth_volatility = _mean_std(stock.eps_growth_5yr)
+            avg_growth *= 100
+            negative_years = sum(1 for g in stock.eps_growth_5yr if g <= 0)
+        
+        return GrowthBlock(
+            years=years,
+            avg_growth=avg_growth,
+            volatility=growth_volatility,
+            negative_years=negative_years,
+            growth_category=_band(avg_growth, (15, 8, 3)),
+            volatility_category=_band(growth_volatility, (0.15, 0.25, 0.35), higher_is_better=False),
+            negative_years_category=_band(negative_years, (1, 2, 3), higher_is_better=False)
+        )
+    
+    def _moat_block(self, stock: StockMetrics, universe: Optional[StockUniverse] = None,
+                    i: Optional[int] = None) -> MoatBlock:
+        if universe is not None and i is not None:
+            roic_pct = universe.roic_pct[i]
+            margin_advantage = universe.margin_advantage[i]
+        else:
+            roic_pct = stock.roic * 100
+            margin_advantage = (stock.gross_margin - stock.industry_avg_gross_margin) * 100
+        
+        return MoatBlock(
+            roic_pct=roic_pct,
+            roic_category=_band(stock.roic, (0.15, 0.12, 0.08)),
+            margin_advantage=margin_advantage,
+            margin_advantage_category=_band(margin_advantage, (5, 2, -2)),
+            brand_value_score=stock.brand_value_score,
+            brand_category=_band(stock.brand_value_score, (80, 65, 50)),
+            network_effect=bool(stock.network_effect_flag)
+        )
+    
+    def _render_profitability(self, block: ProfitBlock) -> str:
+        roe_pct = block.roe_pct
+        margin_pct = block.margin_pct
+        fcf_billions = block.fcf_billions
+        
+        parts = [
+            "",
+            "💰 PROFITABILITY ANALYSIS:",
+            "   ",
+            f"📈 Return on Equity (ROE): {roe_pct:.1f}% - {_CATEGORY_HEADINGS[block.roe_category]}",
+            "   This shows how efficiently the company uses shareholder money to generate profits.",
+            f"   {roe_pct:.1f}% means for every $100 of shareholder equity, the company generates ${roe_pct:.1f} in profit.",
+            "   " + _ROE_PHRASES[block.roe_category],
+            "",
+            f"🏭 Operating Margin: {margin_pct:.1f}% - {_CATEGORY_HEADINGS[block.margin_category]}",
+            "   This shows what percentage of revenue becomes operating profit after expenses.",
+            f"   {margin_pct:.1f}% means the company keeps ${margin_pct:.1f} in operating profit for every $100 of sales.",
+            "   " + _MARGIN_PHRASES[block.margin_category],
+            "",
+            f"💸 Free Cash Flow: ${fcf_billions:.1f}B {'per year' if fcf_billions > 0 else ''}",
+            "   This is the actual cash the company generates that could be returned to shareholders.",
+            "   " + _FCF_PHRASES[block.fcf_category],
+            ""
+        ]
+        return "\n".join(parts)
+    
+    def _render_stability(self, block: StabilityBlock) -> str:
+        parts = [
+            "",
+            "🛡️ FINANCIAL STABILITY:",
+            "",
+            f"💳 Debt-to-Equity Ratio: {block.debt_to_equity:.2f} - {_CATEGORY_HEADINGS[block.debt_category]}",
+            "   This shows how much debt the company has relative to shareholder equity.",
+            f"   A ratio of {block.debt_to_equity:.2f} means the company has ${block.debt_to_equity:.2f} of debt for every $1 of equity.",
+            "   " + _DEBT_PHRASES[block.debt_category],
+            "",
+            f"🔢 Interest Coverage: {block.interest_coverage:.1f}x",
+            "   This shows how easily the company can pay its interest expenses.",
+            f"   The company earns {block.interest_coverage:.1f} times more than needed to cover interest payments.",
+            "   " + _COVERAGE_PHRASES[block.coverage_category],
+            ""
+        ]
+        return "\n".join(parts)
+    
+    def _render_valuation(self, block: ValuationBlock) -> str:
+        parts = [
+            "",
+            "💵 VALUATION ANALYSIS:",
+            "",
+            f"📊 Price-to-Earnings (P/E): {block.price_to_earnings:.1f} - {_CATEGORY_HEADINGS[block.pe_category]}",
+            "   This shows how much investors pay for each dollar of annual earnings.",
+            f"   A P/E of {block.price_to_earnings:.1f} means you pay ${block.price_to_earnings:.1f} for every $1 of annual profit.",
+            "   " + _PE_PHRASES[block.pe_category],
+            "",
+            f"💰 Price-to-Free Cash Flow: {block.price_to_fcf:.1f} - {_CATEGORY_HEADINGS[block.p_fcf_category]}",
+            "   This shows how much you pay for each dollar of actual cash the company generates.",
+            f"   A ratio of {block.price_to_fcf:.1f} means you pay ${block.price_to_fcf:.1f} for every $1 of annual cash flow.",
+            "   " + _P_FCF_PHRASES[block.p_fcf_category],
+            "",
+            f"🚀 PEG Ratio: {block.peg_ratio:.2f}",
+            "   This adjusts the P/E ratio for growth rate. A PEG under 1.0 suggests good value.",
+            "   " + _PEG_PHRASES[block.peg_category],
+            ""
+        ]
+        return "\n".join(parts)
     
-    def explain_competitive_moat(self, stock: StockMetrics) -> str:
+    def _render_growth(self, block: GrowthBlock) -> str:
+        if not block.years:
+            return "\n📈 GROWTH CONSISTENCY: No sufficient earnings history available.\n"
+        
+        parts = [
+            "",
+            "📈 GROWTH CONSISTENCY:",
+            "",
+            f"📊 Average Annual Earnings Growth: {block.avg_growth:.1f}%",
+            f"   Over the last {block.years} years, earnings grew an average of {block.avg_growth:.1f}% per year.",
+            "   " + _GROWTH_PHRASES[block.growth_category],
+            "",
+            f"📉 Growth Volatility: {block.volatility:.3f}",
+            "   This measures how consistent the growth has been (lower is better).",
+            "   " + _VOLATILITY_PHRASES[block.volatility_category],
+            "",
+            f"📅 Negative Growth Years: {block.negative_years} out of {block.years}",
+            "   " + _NEGATIVE_YEARS_PHRASES[block.negative_years_category],
+            ""
+        ]
+        return "\n".join(parts)
+    
+    def _render_moat(self, block: MoatBlock) -> str:
+        margin_advantage = block.margin_advantage
+        
+        parts = [
+            "",
+            "🏰 COMPETITIVE MOAT:",
+            "",
+            f"🎯 Return on Invested Capital (ROIC): {block.roic_pct:.1f}%",
+            "   This shows how efficiently the company uses its invested capital to generate returns.",
+            "   " + _ROIC_PHRASES[block.roic_category],
+            "",
+            f"💪 Gross Margin Advantage: {margin_advantage:+.1f}% vs industry average",
+            f"   The company's gross margin is {abs(margin_advantage):.1f}% {'higher' if margin_advantage > 0 else 'lower'} than competitors.",
+            "   " + _MARGIN_ADVANTAGE_PHRASES[block.margin_advantage_category],
+            "",
+            f"🏆 Brand Value Score: {block.brand_value_score}/100",
+            "   " + _BRAND_PHRASES[block.brand_category],
+            "",
+            f"🌐 Network Effects: {'Yes' if block.network_effect else 'No'}",
+            "   " + _NETWORK_PHRASES[block.network_effect],
+            ""
+        ]
+        return "\n".join(parts)
+    
+    def analyze(self, stock: StockMetrics, composite_score: float,
+                passed_traditional: bool, passed_adjusted: bool,
+                stats: Optional[UniverseStats] = None, i: Optional[int] = None,
+                categories: Optional[Dict[str, np.ndarray]] = None,
+                recommendation: Optional[str] = None,
+                risk_masks: Optional[np.ndarray] = None,
+                universe: Optional[StockUniverse] = None) -> FundamentalReport:
         """
-        Explain competitive advantages in plain English
+        Compute the numbers and category codes behind a full analysis, without rendering text
+
+        Args:
+            stats: Precomputed universe EPS statistics, with i the stock's row in them
+            categories: Precomputed category codes from categorize_many, indexed by i
+            recommendation: Precomputed recommendation (from recommend_many), computed here if None
+            risk_masks: Precomputed risk checks from compute_risk_masks, indexed by i
+            universe: StockUniverse with precomputed percentage columns, indexed by i
         """
-        margin_advantage = (stock.gross_margin - stock.industry_avg_gross_margin) * 100
-        
-        explanation = f"""
-🏰 COMPETITIVE MOAT:
-
-🎯 Return on Invested Capital (ROIC): {stock.roic * 100:.1f}%
-   This shows how efficiently the company uses its invested capital to generate returns.
-   {"✅ Excellent ROIC indicates strong competitive advantages." if stock.roic > 0.15
-   else "✅ Good ROIC suggests solid competitive positioning." if stock.roic > 0.12
-   else "⚠️ Fair ROIC - company has some competitive advantages." if stock.roic > 0.08
-   else "❌ Poor ROIC - limited competitive advantages."}
-
-💪 Gross Margin Advantage: {margin_advantage:+.1f}% vs industry average
-   The company's gross margin is {abs(margin_advantage):.1f}% {"higher" if margin_advantage > 0 else "lower"} than competitors.
-   {"✅ Significant margin advantage indicates strong pricing power." if margin_advantage > 5
-   else "✅ Good margin advantage shows competitive strength." if margin_advantage > 2
-   else "⚠️ Similar margins to competitors - limited pricing power." if margin_advantage > -2
-   else "❌ Below-average margins suggest competitive weakness."}
-
-🏆 Brand Value Score: {stock.brand_value_score}/100
-   {"✅ Excellent brand strength provides pricing power and customer loyalty." if stock.brand_value_score > 80
-   else "✅ Strong brand helps differentiate from competitors." if stock.brand_value_score > 65
-   else "⚠️ Moderate brand strength - some competitive protection." if stock.brand_value_score > 50
-   else "❌ Weak brand - limited protection from competition."}
-
-🌐 Network Effects: {"Yes" if stock.network_effect_flag else "No"}
-   {"✅ Network effects make the product more valuable as more people use it." if stock.network_effect_flag
-   else "⚠️ No network effects - growth depends on traditional competitive advantages."}
-"""
-        return explanation
+        if recommendation is None:
+            recommendation = self.get_recommendation(stock, composite_score, passed_traditional, passed_adjusted)
+        
+        return FundamentalReport(
+            symbol=stock.symbol,
+            current_price=stock.current_price,
+            market_cap=stock.market_cap,
+            composite_score=composite_score,
+            passed_traditional=passed_traditional,
+            passed_adjusted=passed_adjusted,
+            recommendation=RECOMMENDATION_LABELS.index(recommendation),
+            profitability=self._profitability_block(stock, categories, i, universe),
+            stability=self._stability_block(stock, categories, i),
+            valuation=self._valuation_block(stock, categories, i),
+            growth=self._growth_block(stock, stats, i),
+            moat=self._moat_block(stock, universe, i),
+            risks=self._risk_codes(stock, stats, i, risk_masks)
+        )
     
-    def generate_full_analysis(self, stock: StockMetrics, composite_score: float, 
-                             passed_traditional: bool, passed_adjusted: bool) -> str:
+    def render(self, report: FundamentalReport) -> str:
         """
-        Generate comprehensive analysis report
+        Render a FundamentalReport as the plain-English analysis text
         """
-        recommendation = self.get_recommendation(stock, composite_score, passed_traditional, passed_adjusted)
+        recommendation = RECOMMENDATION_LABELS[report.recommendation]
         
         # Determine recommendation color and reasoning
         rec_color = {"Strong Buy": "🟢", "Buy": "🟢", "Hold": "🟡", "Sell": "🔴"}
         rec_emoji = rec_color.get(recommendation, "⚪")
         
         criteria_passed = []
-        if passed_traditional:
+        if report.passed_traditional:
             criteria_passed.append("Traditional Buffett")
-        if passed_adjusted:
+        if report.passed_adjusted:
             criteria_passed.append("2025-Adjusted")
         
         header = f"""
 {'='*80}
-{rec_emoji} FUNDAMENTAL ANALYSIS: {stock.symbol}
+{rec_emoji} FUNDAMENTAL ANALYSIS: {report.symbol}
 {'='*80}
 
 🎯 OVERALL RECOMMENDATION: {recommendation}
-📊 Composite Score: {composite_score:.3f}
+📊 Composite Score: {report.composite_score:.3f}
 ✅ Passed Criteria: {', '.join(criteria_passed)}
-💰 Current Price: ${stock.current_price:.2f}
-🏢 Market Cap: ${stock.market_cap / 1_000_000_000:.1f}B
+💰 Current Price: ${report.current_price:.2f}
+🏢 Market Cap: ${report.market_cap / 1_000_000_000:.1f}B
 
 💡 INVESTMENT THESIS:
-{self._generate_investment_thesis(stock, recommendation, composite_score)}
+{self._generate_investment_thesis(report.symbol, recommendation, report.composite_score)}
 """
         
-        # Combine all analyses
-        full_analysis = (
-            header +
-            self.explain_profitability(stock) +
-            self.explain_financial_stability(stock) +
-            self.explain_valuation(stock) +
-            self.explain_growth_consistency(stock) +
-            self.explain_competitive_moat(stock) +
-            self._generate_risk_assessment(stock) +
-            self._generate_action_plan(stock, recommendation)
-        )
+        # Combine all analyses in a single join rather than chained concatenation
+        parts = [
+            header,
+            self._render_profitability(report.profitability),
+            self._render_stability(report.stability),
+            self._render_valuation(report.valuation),
+            self._render_growth(report.growth),
+            self._render_moat(report.moat),
+            self._render_risk_assessment(report.risks),
+            self._generate_action_plan(report.symbol, recommendation)
+        ]
         
-        return full_analysis
+        return "".join(parts)
+    
+    def generate_full_analysis(self, stock: StockMetrics, composite_score: float, 
+                             passed_traditional: bool, passed_adjusted: bool,
+                             stats: Optional[UniverseStats] = None, i: Optional[int] = None,
+                             categories: Optional[Dict[str, np.ndarray]] = None,
+                             recommendation: Optional[str] = None,
+                             risk_masks: Optional[np.ndarray] = None,
+                             universe: Optional[StockUniverse] = None) -> str:
+        """
+        Generate comprehensive analysis report (analyze + render)
+
+        Args:
+            stats: Precomputed universe EPS statistics, with i the stock's row in them
+            categories: Precomputed category codes from categorize_many, indexed by i
+            recommendation: Precomputed recommendation (from recommend_many), computed here if None
+            risk_masks: Precomputed risk checks from compute_risk_masks, indexed by i
+            universe: StockUniverse with precomputed percentage columns, indexed by i
+        """
+        return self.render(self.analyze(stock, composite_score, passed_traditional, passed_adjusted,
+                                        stats, i, categories, recommendation, risk_masks, universe))
     
-    def _generate_investment_thesis(self, stock: StockMetrics, recommendation: str, score: float) -> str:
+    def _generate_investment_thesis(self, symbol: str, recommendation: str, score: float) -> str:
         """
         Generate investment thesis based on key metrics
         """
         if recommendation in ["Strong Buy", "Buy"]:
             return f"""
-   {stock.symbol} represents a high-quality company that meets Warren Buffett's investment 
+   {symbol} represents a high-quality company that meets Warren Buffett's investment 
    criteria in today's market environment. With a composite score of {score:.3f}, it demonstrates
    strong fundamentals including profitable operations, reasonable debt levels, and competitive
    advantages that should support long-term shareholder value creation.
 """
         elif recommendation == "Hold":
             return f"""
-   {stock.symbol} is a decent company that marginally meets investment criteria. While it has
+   {symbol} is a decent company that marginally meets investment criteria. While it has
    some attractive qualities with a score of {score:.3f}, investors should monitor closely
    and consider whether better opportunities exist in the market.
 """
         else:
             return f"""
-   {stock.symbol} does not currently meet the stringent criteria for quality investment.
+   {symbol} does not currently meet the stringent criteria for quality investment.
    The company may face challenges that make it unsuitable for conservative, long-term
    value investors at current price levels.
 """
     
-    def _generate_risk_assessment(self, stock: StockMetrics) -> str:
+    def _risk_codes(self, stock: StockMetrics, stats: Optional[UniverseStats] = None,
+                    i: Optional[int] = None, risk_masks: Optional[np.ndarray] = None) -> List[int]:
         """
-        Generate risk assessment
-        """
-        risks = []
+        Indices into RISK_LABELS of the risks this stock trips
         
-        if stock.debt_to_equity > 0.6:
-            risks.append("High debt levels create financial risk")
-        if stock.price_to_earnings > 30:
-            risks.append("High valuation leaves little margin of safety")
-        if stock.eps_growth_5yr and np.std(stock.eps_growth_5yr) > 0.3:
-            risks.append("Volatile earnings make future performance unpredictable")
-        if stock.operating_margin < 0.08:
-            risks.append("Low profit margins indicate competitive pressures")
+        Args:
+            risk_masks: Precomputed (N, 4) checks from compute_risk_masks, row i is used if given
+        """
+        if risk_masks is not None and i is not None:
+            risk_mask = risk_masks[i]
+            return np.flatnonzero(risk_mask).tolist() if risk_mask.any() else []
         
-        risk_level = "High" if len(risks) >= 3 else "Medium" if len(risks) >= 2 else "Low"
+        if stats is not None and i is not None:
+            eps_volatility = stats.eps_std[i]
+        else:
+            eps_volatility = _mean_std(stock.eps_growth_5yr)[1] if stock.eps_growth_5yr else 0
+        risk_mask = (
+            stock.debt_to_equity > 0.6,
+            stock.price_to_earnings > 30,
+            bool(stock.eps_growth_5yr) and eps_volatility > 0.3,
+            stock.operating_margin < 0.08
+        )
+        return [k for k, hit in enumerate(risk_mask) if hit]
+    
+    def _generate_risk_assessment(self, stock: StockMetrics, stats: Optional[UniverseStats] = None,
+                                  i: Optional[int] = None, risk_masks: Optional[np.ndarray] = None) -> str:
+        """
+        Generate risk assessment
+        """
+        return self._render_risk_assessment(self._risk_codes(stock, stats, i, risk_masks))
+    
+    def _render_risk_assessment(self, risk_codes: List[int]) -> str:
+        risk_count = len(risk_codes)
+        risk_level = "High" if risk_count >= 3 else "Medium" if risk_count >= 2 else "Low"
         
-        risk_text = f"""
+        parts = [f"""
 ⚠️ RISK ASSESSMENT: {risk_level.upper()} RISK
 
 🚨 Key Risks to Monitor:
-"""
-        if risks:
-            for i, risk in enumerate(risks, 1):
-                risk_text += f"   {i}. {risk}\n"
+"""]
+        if risk_codes:
+            parts.extend(f"   {n}. {RISK_LABELS[k]}\n" for n, k in enumerate(risk_codes, 1))
         else:
-            risk_text += "   ✅ No major red flags identified in fundamental analysis.\n"
+            parts.append("   ✅ No major red flags identified in fundamental analysis.\n")
         
-        return risk_text
+        return "".join(parts)
     
-    def _generate_action_plan(self, stock: StockMetrics, recommendation: str) -> str:
+    def _generate_action_plan(self, symbol: str, recommendation: str) -> str:
         """
         Generate specific action plan for investors
         """
-        if recommendation == "Strong Buy":
-            action = f"""
-🎯 ACTION PLAN:
-   
-   📈 IMMEDIATE: Consider building a position in {stock.symbol}
-   💰 TARGET ALLOCATION: 3-5% of portfolio for individual investors
-   📊 ENTRY STRATEGY: Can buy at current levels or on any weakness
-   🎯 PRICE TARGET: Monitor for 15-25% appreciation over 12-18 months
-   ⏰ TIMELINE: Suitable for long-term hold (3+ years)
-   
-   🔄 MONITORING: Review quarterly earnings and annual metrics
-"""
-        elif recommendation == "Buy":
-            action = f"""
-🎯 ACTION PLAN:
-   
-   📈 STRATEGY: Consider accumulating {stock.symbol} on market weakness
-   💰 TARGET ALLOCATION: 2-3% of portfolio
-   📊 ENTRY STRATEGY: Wait for 5-10% pullback or buy gradually
-   🎯 EXPECTATIONS: Modest outperformance over 2-3 years
-   ⏰ TIMELINE: Medium to long-term investment
-   
-   🔄 MONITORING: Watch quarterly results and debt levels
-"""
-        elif recommendation == "Hold":
-            action = f"""
-🎯 ACTION PLAN:
-   
-   📊 STRATEGY: Hold current position but don't add new money
-   🔍 MONITORING: Watch closely for improvement or deterioration
-   ⚖️ REVIEW: Consider selling if better opportunities arise
-   📉 EXIT TRIGGERS: Sell if fundamentals worsen or valuation becomes excessive
-   
-   🔄 DECISION POINT: Reassess in 6 months
-"""
-        else:
-            action = f"""
-🎯 ACTION PLAN:
-   
-   🚫 RECOMMENDATION: Avoid {stock.symbol} at current levels
-   📉 EXISTING POSITION: Consider reducing or exiting
-   🔍 ALTERNATIVE: Look for higher-quality companies
-   ⚠️ RISK: High probability of underperformance
-   
-   🔄 FUTURE REVIEW: Reassess if fundamentals improve significantly
-"""
-        
-        return action + "\n" + "="*80 + "\n"
+        template = self.ACTION_TEMPLATES.get(recommendation, self.ACTION_TEMPLATES["Sell"])
+        return template.format(symbol=symbol) + self.ACTION_FOOTER
+
+class RenderedAnalyses(Mapping):
+    """
+    Read-only symbol -> analysis text mapping that renders each FundamentalReport on first access
+    """
+    
+    def __init__(self, reports: Dict[str, FundamentalReport], analyzer: FundamentalAnalyzer):
+        self.reports = reports
+        self.analyzer = analyzer
+        self._rendered = {}
+    
+    def __getitem__(self, symbol: str) -> str:
+        if symbol not in self._rendered:
+            self._rendered[symbol] = self.analyzer.render(self.reports[symbol])
+        return self._rendered[symbol]
+    
+    def __iter__(self):
+        return iter(self.reports)
+    
+    def __len__(self) -> int:
+        return len(self.reports)
+
+# Below this many qualifying stocks, process start-up costs more than the analyses themselves
+ANALYSIS_POOL_MIN_STOCKS = 50
+
+# Per-process analysis state, set up once by _init_analysis_worker
+_worker_state = {}
+
+def _init_analysis_worker(universe: StockUniverse, stats: UniverseStats, categories: Dict[str, np.ndarray],
+                          risk_masks: np.ndarray, analyzer: Optional['FundamentalAnalyzer'] = None):
+    """
+    Build one FundamentalAnalyzer per worker and keep the shared universe data alongside it
+    """
+    _worker_state['analyzer'] = analyzer or FundamentalAnalyzer()
+    _worker_state['universe'] = universe
+    _worker_state['stats'] = stats
+    _worker_state['categories'] = categories
+    _worker_state['risk_masks'] = risk_masks
+
+def _analyze_in_worker(stock: StockMetrics, composite_score: float, passed_traditional: bool,
+                       passed_adjusted: bool, i: int, recommendation: str) -> FundamentalReport:
+    """
+    Build one FundamentalReport using the worker's analyzer and shared universe data
+    """
+    return _worker_state['analyzer'].analyze(
+        stock=stock,
+        composite_score=composite_score,
+        passed_traditional=passed_traditional,
+        passed_adjusted=passed_adjusted,
+        stats=_worker_state['stats'],
+        i=i,
+        categories=_worker_state['categories'],
+        recommendation=recommendation,
+        risk_masks=_worker_state['risk_masks'],
+        universe=_worker_state['universe']
+    )
 
-def run_dual_screening(stocks: List[StockMetrics]) -> Dict:
+def run_dual_screening(stocks: List[StockMetrics], generate_analyses: bool = True) -> Dict:
     """
     Run both traditional and 2025-adjusted screening on the same stock universe
+    
+    Args:
+        stocks: Stocks to screen
+        generate_analyses: If False, return only the numeric screening results and skip
+            the plain-English fundamental analyses entirely (fast path for bulk/programmatic use)
     """
     print("\n" + "="*80)
     print("DUAL SCREENING: TRADITIONAL vs 2025-ADJUSTED BUFFETT CRITERIA")
     print("="*80)
     
+    # Build the struct-of-arrays view once and share it between both screenings
+    universe = StockUniverse.from_stockmetrics(stocks)
+    stats = UniverseStats.from_universe(universe)
+    index_by_symbol = {symbol: i for i, symbol in enumerate(universe.symbols)}
+    
     # Traditional Buffett Screening
     print("\n🔴 RUNNING TRADITIONAL BUFFETT SCREENING...")
     traditional_screener = BuffettScreener(market_adjusted=False)
-    traditional_results = traditional_screener.screen_universe(stocks)
+    traditional_results = traditional_screener.screen_universe(stocks, universe, stats)
     
     # 2025 Market-Adjusted Screening
     print("\n🟢 RUNNING 2025 MARKET-ADJUSTED SCREENING...")
     adjusted_screener = BuffettScreener(market_adjusted=True)
-    adjusted_results = adjusted_screener.screen_universe(stocks)
+    adjusted_results = adjusted_screener.screen_universe(stocks, universe, stats)
+    
+    # Passed-symbol sets are shared by every report printer instead of being rebuilt there
+    traditional_results['symbol_set'] = frozenset(c['symbol'] for c in traditional_results['passed'])
+    adjusted_results['symbol_set'] = frozenset(c['symbol'] for c in adjusted_results['passed'])
+    adjusted_only = adjusted_results['symbol_set'] - traditional_results['symbol_set']
+    
+    if not generate_analyses:
+        return {
+            'traditional': traditional_results,
+            'adjusted': adjusted_results,
+            'passed_symbols_traditional': traditional_results['symbol_set'],
+            'passed_symbols_adjusted': adjusted_results['symbol_set'],
+            'adjusted_only': adjusted_only
+        }
     
     # Generate detailed analysis for all passed stocks
     analyzer = FundamentalAnalyzer()
-    detailed_analyses = {}
+    category_codes = analyzer.categorize_many(universe)
+    risk_masks = analyzer.compute_risk_masks(universe, stats)
     
     # Collect all unique stocks that passed either criteria
     all_passed_stocks = {}
+    stock_by_symbol = {s.symbol: s for s in stocks}
     
     # Add traditional passed stocks
     for result in traditional_results['passed']:
         symbol = result['symbol']
-        stock = next(s for s in stocks if s.symbol == symbol)
+        stock = stock_by_symbol[symbol]
         all_passed_stocks[symbol] = {
             'stock': stock,
             'traditional_score': result['composite_score'],
@@ -1436,7 +2141,7 @@ def run_dual_screening(stocks: List[StockMetrics]) -> Dict:
     # Add adjusted passed stocks
     for result in adjusted_results['passed']:
         symbol = result['symbol']
-        stock = next(s for s in stocks if s.symbol == symbol)
+        stock = stock_by_symbol[symbol]
         
         if symbol in all_passed_stocks:
             # Stock passed both criteria
@@ -1455,57 +2160,137 @@ def run_dual_screening(stocks: List[StockMetrics]) -> Dict:
     # Generate detailed analysis for each passed stock
     print(f"\n📋 GENERATING DETAILED ANALYSIS FOR {len(all_passed_stocks)} QUALIFYING STOCKS...")
     
+    # Recommendations for every qualifying stock in one vectorized pass
+    best_scores = np.zeros(len(universe))
+    passed_traditional_mask = np.zeros(len(universe), dtype=bool)
+    passed_adjusted_mask = np.zeros(len(universe), dtype=bool)
     for symbol, data in all_passed_stocks.items():
-        stock = data['stock']
-        best_score = data['adjusted_score'] or data['traditional_score'] or 0
-        
-        analysis = analyzer.generate_full_analysis(
-            stock=stock,
-            composite_score=best_score,
-            passed_traditional=data['passed_traditional'],
-            passed_adjusted=data['passed_adjusted']
-        )
-        
-        detailed_analyses[symbol] = analysis
+        i = index_by_symbol[symbol]
+        best_scores[i] = data['adjusted_score'] or data['traditional_score'] or 0
+        passed_traditional_mask[i] = data['passed_traditional']
+        passed_adjusted_mask[i] = data['passed_adjusted']
+    recommendation_codes = analyzer.recommend_many(universe, best_scores,
+                                                   passed_traditional_mask, passed_adjusted_mask)
+    
+    analysis_args = []
+    for symbol, data in all_passed_stocks.items():
+        i = index_by_symbol[symbol]
+        analysis_args.append((
+            data['stock'],
+            best_scores[i],
+            data['passed_traditional'],
+            data['passed_adjusted'],
+            i,
+            RECOMMENDATION_LABELS[recommendation_codes[i]]
+        ))
+    
+    # Analyses are independent string-building work, so large sets are spread across processes
+    if len(analysis_args) >= ANALYSIS_POOL_MIN_STOCKS:
+        with multiprocessing.Pool(initializer=_init_analysis_worker,
+                                  initargs=(universe, stats, category_codes, risk_masks)) as pool:
+            reports = pool.starmap(_analyze_in_worker, analysis_args, chunksize=16)
+    else:
+        _init_analysis_worker(universe, stats, category_codes, risk_masks, analyzer)
+        reports = [_analyze_in_worker(*args) for args in analysis_args]
+    
+    # Text is only rendered for the analyses that are actually printed or saved
+    reports = dict(zip(all_passed_stocks, reports))
+    detailed_analyses = RenderedAnalyses(reports, analyzer)
     
     return {
         'traditional': traditional_results,
         'adjusted': adjusted_results,
-        'detailed_analyses': detailed_analyses
+        'passed_symbols_traditional': traditional_results['symbol_set'],
+        'passed_symbols_adjusted': adjusted_results['symbol_set'],
+        'adjusted_only': adjusted_only,
+        'reports': reports,
+        'detailed_analyses': detailed_analyses,
+        'category_codes': category_codes
     }
 
-def print_buffett_top_picks(traditional_results: Dict, adjusted_results: Dict):
+@dataclass(slots=True)
+class QualifiedStock:
+    """A stock that passed either screening, as ranked for the top-picks report"""
+    symbol: str
+    score: float
+    criteria: str
+    flags: Tuple[str, ...]
+    priority: int
+    # Shared by the console table and the report files, so derived once per stock
+    recommendation: str = field(init=False)
+    flags_text_full: str = field(init=False)
+    # Filled in for the whole list at once by print_buffett_top_picks
+    flags_text_trunc: str = field(init=False)
+    
+    def __post_init__(self):
+        if self.criteria == 'Traditional Buffett' or self.score > 0.4:
+            self.recommendation = "STRONG BUY"
+        elif self.score > 0.3:
+            self.recommendation = "BUY"
+        else:
+            self.recommendation = "BUY (Watch)"
+        self.flags_text_full = '; '.join(self.flags) if self.flags else 'Clean'
+
+# Row layout shared by the top-picks console table and the winners/fails report files
+TOP_PICK_ROW_FORMAT = "{rank:<4} {symbol:<8} {score:<8.3f} {criteria:<18} {status:<12} {notes}"
+_format_top_pick_row = TOP_PICK_ROW_FORMAT.format
+
+def rank_qualified_stocks(qualified_stocks: List[QualifiedStock]) -> List[QualifiedStock]:
+    """
+    Rank qualified stocks by priority first, then by score (highest first)
+    
+    Args:
+        qualified_stocks: Entries built by print_buffett_top_picks
+    """
+    n = len(qualified_stocks)
+    priorities = np.fromiter((s.priority for s in qualified_stocks), dtype=np.int8, count=n)
+    scores = np.fromiter((s.score for s in qualified_stocks), dtype=np.float64, count=n)
+    order = np.lexsort((-scores, priorities))
+    return [qualified_stocks[i] for i in order]
+
+def print_buffett_top_picks(traditional_results: Dict, adjusted_results: Dict, month_label: Optional[str] = None):
     """
     Print Warren Buffett's top stock picks ranked by composite score
     Returns the list of top pick symbols for detailed analysis filtering
+    
+    Args:
+        traditional_results: Traditional screening results
+        adjusted_results: 2025-adjusted screening results
+        month_label: Report month shown in the header, e.g. "OCTOBER 2025" (defaults to now)
     """
+    if month_label is None:
+        month_label = datetime.now().strftime('%B %Y').upper()
+    
     # Combine all passed stocks from both criteria
     all_qualified_stocks = []
     
     # Add traditional passed stocks (highest priority)
     for stock in traditional_results['passed']:
-        all_qualified_stocks.append({
-            'symbol': stock['symbol'],
-            'score': stock['composite_score'],
-            'criteria': 'Traditional Buffett',
-            'flags': stock.get('flags', []),
-            'priority': 1  # Highest priority
-        })
+        all_qualified_stocks.append(QualifiedStock(
+            symbol=stock['symbol'],
+            score=stock['composite_score'],
+            criteria='Traditional Buffett',
+            flags=tuple(stock.get('flags', [])),
+            priority=1  # Highest priority
+        ))
     
     # Add adjusted passed stocks (if not already in traditional)
-    traditional_symbols = {s['symbol'] for s in traditional_results['passed']}
+    traditional_symbols = traditional_results['symbol_set']
     for stock in adjusted_results['passed']:
         if stock['symbol'] not in traditional_symbols:
-            all_qualified_stocks.append({
-                'symbol': stock['symbol'],
-                'score': stock['composite_score'],
-                'criteria': '2025-Adjusted',
-                'flags': stock.get('flags', []),
-                'priority': 2  # Lower priority
-            })
-    
-    # Sort by priority first, then by score
-    all_qualified_stocks.sort(key=lambda x: (x['priority'], -x['score']))
+            all_qualified_stocks.append(QualifiedStock(
+                symbol=stock['symbol'],
+                score=stock['composite_score'],
+                criteria='2025-Adjusted',
+                flags=tuple(stock.get('flags', [])),
+                priority=2  # Lower priority
+            ))
+    
+    # Truncate every flag text for the fixed-width tables in one vectorized pass
+    flag_series = pd.Series([s.flags_text_full for s in all_qualified_stocks], dtype=object)
+    flag_series = flag_series.where(flag_series.str.len() <= 20, flag_series.str.slice(0, 17) + "...")
+    for stock, flags_text in zip(all_qualified_stocks, flag_series.tolist()):
+        stock.flags_text_trunc = flags_text
     
     # Determine Buffett's recommended number of stocks
     total_qualified = len(all_qualified_stocks)
@@ -1526,88 +2311,113 @@ def print_buffett_top_picks(traditional_results: Dict, adjusted_results: Dict):
         buffett_picks = min(12, total_qualified)
         recommendation_text = f"Choose top 12 stocks - sufficient diversification without over-diversification."
     
-    print("\n" + "🎯" + "="*78 + "🎯")
-    print("🏆 WARREN BUFFETT'S TOP STOCK PICKS - OCTOBER 2025 🏆")
-    print("🎯" + "="*78 + "🎯")
-    
-    print(f"\n📊 PORTFOLIO STRATEGY:")
-    print(f"   📈 Total Qualifying Stocks: {total_qualified}")
-    print(f"   🎯 Buffett's Recommended Portfolio Size: {buffett_picks} stocks")
-    print(f"   💡 Strategy: {recommendation_text}")
+    # Only the top picks need ranking here (priority first, then score); the rest are
+    # ranked later by rank_qualified_stocks if the fails report asks for them
+    top_ranked = heapq.nsmallest(buffett_picks, enumerate(all_qualified_stocks),
+                                 key=lambda item: (item[1].priority, -item[1].score))
+    top_picks = [stock for _, stock in top_ranked]
+    selected = {i for i, _ in top_ranked}
+    remaining_stocks = [stock for i, stock in enumerate(all_qualified_stocks) if i not in selected]
+    
+    # Console output is collected and written in one call instead of line by line
+    out = []
+    out.append("\n" + "🎯" + "="*78 + "🎯")
+    out.append(f"🏆 WARREN BUFFETT'S TOP STOCK PICKS - {month_label} 🏆")
+    out.append("🎯" + "="*78 + "🎯")
+    
+    out.append(f"\n📊 PORTFOLIO STRATEGY:")
+    out.append(f"   📈 Total Qualifying Stocks: {total_qualified}")
+    out.append(f"   🎯 Buffett's Recommended Portfolio Size: {buffett_picks} stocks")
+    out.append(f"   💡 Strategy: {recommendation_text}")
     
     if buffett_picks > 0:
-        print(f"\n🏆 TOP {buffett_picks} BUFFETT PICKS (Ranked by Quality Score):")
-        print("-" * 85)
-        print(f"{'Rank':<4} {'Symbol':<8} {'Score':<8} {'Criteria':<18} {'Recommendation':<12} {'Notes'}")
-        print("-" * 85)
-        
-        for i, stock in enumerate(all_qualified_stocks[:buffett_picks], 1):
-            # Determine recommendation based on score and criteria
-            if stock['criteria'] == 'Traditional Buffett' or stock['score'] > 0.4:
-                recommendation = "STRONG BUY"
-            elif stock['score'] > 0.3:
-                recommendation = "BUY"
-            else:
-                recommendation = "BUY (Watch)"
-            
-            flags_text = '; '.join(stock['flags']) if stock['flags'] else 'Clean'
-            if len(flags_text) > 20:
-                flags_text = flags_text[:17] + "..."
-            
-            print(f"{i:<4} {stock['symbol']:<8} {stock['score']:<8.3f} {stock['criteria']:<18} {recommendation:<12} {flags_text}")
+        out.append(f"\n🏆 TOP {buffett_picks} BUFFETT PICKS (Ranked by Quality Score):")
+        out.append("-" * 85)
+        out.append(f"{'Rank':<4} {'Symbol':<8} {'Score':<8} {'Criteria':<18} {'Recommendation':<12} {'Notes'}")
+        out.append("-" * 85)
+        
+        out.extend(_format_top_pick_row(rank=i, symbol=stock.symbol, score=stock.score,
+                                        criteria=stock.criteria, status=stock.recommendation,
+                                        notes=stock.flags_text_trunc)
+                   for i, stock in enumerate(top_picks, 1))
         
         # Add allocation guidance
-        print(f"\n💰 PORTFOLIO ALLOCATION GUIDANCE:")
+        out.append(f"\n💰 PORTFOLIO ALLOCATION GUIDANCE:")
         if buffett_picks <= 5:
             allocation_per_stock = 15
-            print(f"   🎯 Concentrated Approach: ~{allocation_per_stock}% per stock ({buffett_picks * allocation_per_stock}% total equity)")
+            out.append(f"   🎯 Concentrated Approach: ~{allocation_per_stock}% per stock ({buffett_picks * allocation_per_stock}% total equity)")
         elif buffett_picks <= 8:
             allocation_per_stock = 10
-            print(f"   🎯 Focused Approach: ~{allocation_per_stock}% per stock ({buffett_picks * allocation_per_stock}% total equity)")
+            out.append(f"   🎯 Focused Approach: ~{allocation_per_stock}% per stock ({buffett_picks * allocation_per_stock}% total equity)")
         else:
             allocation_per_stock = 7
-            print(f"   🎯 Diversified Approach: ~{allocation_per_stock}% per stock ({buffett_picks * allocation_per_stock}% total equity)")
+            out.append(f"   🎯 Diversified Approach: ~{allocation_per_stock}% per stock ({buffett_picks * allocation_per_stock}% total equity)")
         
-        print(f"   💼 Reserve ~{100 - (buffett_picks * allocation_per_stock)}% for cash/bonds/opportunistic investments")
+        out.append(f"   💼 Reserve ~{100 - (buffett_picks * allocation_per_stock)}% for cash/bonds/opportunistic investments")
         
         # Market commentary
-        traditional_count = len(traditional_results['passed'])
-        adjusted_count = len(adjusted_results['passed'])
+        traditional_count = traditional_results['passed_count']
+        adjusted_count = adjusted_results['passed_count']
         
-        print(f"\n📈 MARKET COMMENTARY:")
+        out.append(f"\n📈 MARKET COMMENTARY:")
         if traditional_count == 0 and adjusted_count > 0:
-            print("   📊 Current market conditions require adjusted criteria - valuations are elevated")
-            print("   ⚠️ Traditional Buffett standards too strict for 2025 market environment")
-            print("   💡 Focus on highest-quality companies from adjusted screening")
+            out.append("   📊 Current market conditions require adjusted criteria - valuations are elevated")
+            out.append("   ⚠️ Traditional Buffett standards too strict for 2025 market environment")
+            out.append("   💡 Focus on highest-quality companies from adjusted screening")
         elif traditional_count > 0:
-            print(f"   ✅ {traditional_count} stocks meet traditional Buffett criteria - excellent opportunities available")
-            print("   🎯 Market offers genuine value opportunities for patient investors")
+            out.append(f"   ✅ {traditional_count} stocks meet traditional Buffett criteria - excellent opportunities available")
+            out.append("   🎯 Market offers genuine value opportunities for patient investors")
         else:
-            print("   🚨 Extremely challenging market - very few quality opportunities at reasonable prices")
-            print("   💰 Consider increasing cash allocation and waiting for better entry points")
+            out.append("   🚨 Extremely challenging market - very few quality opportunities at reasonable prices")
+            out.append("   💰 Consider increasing cash allocation and waiting for better entry points")
     
     else:
-        print("\n🚨 MARKET ALERT:")
-        print("   ❌ No stocks currently meet Buffett's investment criteria")
-        print("   💰 RECOMMENDATION: Increase cash position to 70-90%")
-        print("   ⏰ STRATEGY: Wait for market correction or individual stock opportunities")
-        print("   📊 MONITORING: Re-screen monthly for emerging opportunities")
+        out.append("\n🚨 MARKET ALERT:")
+        out.append("   ❌ No stocks currently meet Buffett's investment criteria")
+        out.append("   💰 RECOMMENDATION: Increase cash position to 70-90%")
+        out.append("   ⏰ STRATEGY: Wait for market correction or individual stock opportunities")
+        out.append("   📊 MONITORING: Re-screen monthly for emerging opportunities")
     
-    print("\n" + "🎯" + "="*78 + "🎯")
+    out.append("\n" + "🎯" + "="*78 + "🎯")
+    sys.stdout.write('\n'.join(out) + '\n')
     
     # Return the symbols of the top picks and portfolio strategy for detailed analysis filtering
     portfolio_strategy = {
         'total_qualified': total_qualified,
         'buffett_picks': buffett_picks,
         'recommendation_text': recommendation_text,
-        'all_qualified_stocks': all_qualified_stocks
+        'top_picks': top_picks,
+        'remaining_stocks': remaining_stocks
     }
     
     if buffett_picks > 0:
-        return [stock['symbol'] for stock in all_qualified_stocks[:buffett_picks]], portfolio_strategy
+        return [stock.symbol for stock in top_picks], portfolio_strategy
     else:
         return [], portfolio_strategy
 
+def format_candidate_table(candidates: List[Dict]) -> List[str]:
+    """
+    Format screening candidates as Rank/Symbol/Score/Notes table lines (header first)
+    
+    Args:
+        candidates: Passed screening results, already ranked
+    """
+    notes = ['; '.join(c['flags']) if c['flags'] else 'Clean' for c in candidates]
+    notes_width = max(map(len, notes))
+    table = pd.DataFrame({
+        'Rank': range(1, len(candidates) + 1),
+        'Symbol': [c['symbol'] for c in candidates],
+        'Score': [c['composite_score'] for c in candidates],
+        'Notes': notes
+    })
+    text = table.to_string(index=False, justify='left', formatters={
+        'Rank': '{:<4}'.format,
+        'Symbol': '{:<8}'.format,
+        'Score': '{:<7.3f}'.format,
+        'Notes': lambda v: f"{v:<{notes_width}}"
+    })
+    return [line.rstrip() for line in text.split('\n')]
+
 def print_dual_screening_results(dual_results: Dict, save_files: bool = True):
     """
     Print formatted dual screening results with detailed analyses
@@ -1616,118 +2426,102 @@ def print_dual_screening_results(dual_results: Dict, save_files: bool = True):
     adjusted = dual_results['adjusted']
     detailed_analyses = dual_results.get('detailed_analyses', {})
     
+    # One run time for every file name and report header
+    now = datetime.now()
+    timestamp = now.strftime('%Y%m%d_%H%M')
+    month_label = now.strftime('%B %Y').upper()
+    
     # Print Warren Buffett's Top Picks first and get the list
-    top_picks_data = print_buffett_top_picks(traditional, adjusted)
+    top_picks_data = print_buffett_top_picks(traditional, adjusted, month_label)
     top_picks_symbols, portfolio_strategy = top_picks_data
     
-    print("\n" + "="*80)
-    print("DUAL SCREENING COMPARISON RESULTS")
-    print("="*80)
+    out = []
+    out.append("\n" + "="*80)
+    out.append("DUAL SCREENING COMPARISON RESULTS")
+    out.append("="*80)
     
-    print(f"\n📊 SUMMARY COMPARISON:")
-    print(f"{'Criteria':<20} {'Passed':<8} {'Rejected':<10} {'Flagged':<8} {'Top Score':<12}")
-    print("-" * 60)
+    out.append(f"\n📊 SUMMARY COMPARISON:")
+    out.append(f"{'Criteria':<20} {'Passed':<8} {'Rejected':<10} {'Flagged':<8} {'Top Score':<12}")
+    out.append("-" * 60)
     
     trad_top_score = traditional['top_candidates'][0]['composite_score'] if traditional['top_candidates'] else 0
     adj_top_score = adjusted['top_candidates'][0]['composite_score'] if adjusted['top_candidates'] else 0
     
-    print(f"{'Traditional':<20} {len(traditional['passed']):<8} {len(traditional['rejected']):<10} {len(traditional['flagged']):<8} {trad_top_score:<12.3f}")
-    print(f"{'2025-Adjusted':<20} {len(adjusted['passed']):<8} {len(adjusted['rejected']):<10} {len(adjusted['flagged']):<8} {adj_top_score:<12.3f}")
+    out.append(f"{'Traditional':<20} {traditional['passed_count']:<8} {traditional['rejected_count']:<10} {traditional['flagged_count']:<8} {trad_top_score:<12.3f}")
+    out.append(f"{'2025-Adjusted':<20} {adjusted['passed_count']:<8} {adjusted['rejected_count']:<10} {adjusted['flagged_count']:<8} {adj_top_score:<12.3f}")
     
     # Show top candidates from both screenings
-    print(f"\n🏆 TOP TRADITIONAL BUFFETT CANDIDATES:")
+    out.append(f"\n🏆 TOP TRADITIONAL BUFFETT CANDIDATES:")
     if traditional['top_candidates']:
-        print("-" * 60)
-        print(f"{'Rank':<4} {'Symbol':<8} {'Score':<8} {'Notes'}")
-        print("-" * 60)
-        for i, candidate in enumerate(traditional['top_candidates'][:10], 1):
-            flags = '; '.join(candidate['flags']) if candidate['flags'] else 'Clean'
-            print(f"{i:<4} {candidate['symbol']:<8} {candidate['composite_score']:.3f}   {flags}")
+        header, *rows = format_candidate_table(traditional['top_candidates'][:10])
+        out.extend(["-" * 60, header, "-" * 60, *rows])
     else:
-        print("❌ No stocks passed traditional criteria")
+        out.append("❌ No stocks passed traditional criteria")
     
-    print(f"\n🎯 TOP 2025-ADJUSTED CANDIDATES:")
+    out.append(f"\n🎯 TOP 2025-ADJUSTED CANDIDATES:")
     if adjusted['top_candidates']:
-        print("-" * 60)
-        print(f"{'Rank':<4} {'Symbol':<8} {'Score':<8} {'Notes'}")
-        print("-" * 60)
-        for i, candidate in enumerate(adjusted['top_candidates'][:10], 1):
-            flags = '; '.join(candidate['flags']) if candidate['flags'] else 'Clean'
-            print(f"{i:<4} {candidate['symbol']:<8} {candidate['composite_score']:.3f}   {flags}")
+        header, *rows = format_candidate_table(adjusted['top_candidates'][:10])
+        out.extend(["-" * 60, header, "-" * 60, *rows])
     else:
-        print("❌ No stocks passed adjusted criteria")
+        out.append("❌ No stocks passed adjusted criteria")
     
     # Show stocks that passed adjusted but not traditional
-    traditional_symbols = {c['symbol'] for c in traditional['passed']}
-    adjusted_symbols = {c['symbol'] for c in adjusted['passed']}
-    adjusted_only = adjusted_symbols - traditional_symbols
+    adjusted_only = dual_results['adjusted_only']
     
     if adjusted_only:
-        print(f"\n💡 STOCKS THAT PASSED 2025-ADJUSTED BUT NOT TRADITIONAL:")
-        print("-" * 40)
+        out.append(f"\n💡 STOCKS THAT PASSED 2025-ADJUSTED BUT NOT TRADITIONAL:")
+        out.append("-" * 40)
+        adj_by_symbol = {c['symbol']: c for c in adjusted['passed']}
         for symbol in sorted(adjusted_only):
-            adj_candidate = next(c for c in adjusted['passed'] if c['symbol'] == symbol)
-            print(f"   {symbol}: Score {adj_candidate['composite_score']:.3f}")
+            adj_candidate = adj_by_symbol[symbol]
+            out.append(f"   {symbol}: Score {adj_candidate['composite_score']:.3f}")
     
     # Print detailed analyses only for top picks
     if detailed_analyses and top_picks_symbols:
-        print(f"\n📈 DETAILED FUNDAMENTAL ANALYSES:")
-        print("="*80)
-        
-        # Filter and sort analyses to only include top picks
-        top_picks_analyses = {symbol: analysis for symbol, analysis in detailed_analyses.items() 
-                            if symbol in top_picks_symbols}
-        
-        # Sort by the order they appear in top picks (already ranked by score)
-        sorted_analyses = [(symbol, top_picks_analyses[symbol]) for symbol in top_picks_symbols 
-                          if symbol in top_picks_analyses]
+        out.append(f"\n📈 DETAILED FUNDAMENTAL ANALYSES:")
+        out.append("="*80)
         
-        for symbol, analysis in sorted_analyses:
-            print(analysis)
-            print("\n" + "="*80 + "\n")
+        # Only top picks, in the order they appear in top picks (already ranked by score)
+        for symbol in top_picks_symbols:
+            if symbol not in detailed_analyses:
+                continue
+            out.append(detailed_analyses[symbol])
+            out.append("\n" + "="*80 + "\n")
+    
+    sys.stdout.write('\n'.join(out) + '\n')
     
     # Save results to files
     if save_files:
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M')
-        
         # Save traditional results
         if traditional['top_candidates']:
-            df_trad = pd.DataFrame([
-                {
-                    'symbol': c['symbol'],
-                    'composite_score': c['composite_score'],
-                    'flags': '; '.join(c['flags']) if c['flags'] else 'None',
-                    'criteria': 'Traditional'
-                }
-                for c in traditional['top_candidates']
-            ])
             trad_filename = f"buffett_traditional_{timestamp}.csv"
-            df_trad.to_csv(trad_filename, index=False)
+            with open(trad_filename, 'w', newline='', encoding='utf-8') as fh:
+                writer = csv.writer(fh, lineterminator='\n')
+                writer.writerow(['symbol', 'composite_score', 'flags', 'criteria'])
+                writer.writerows((c['symbol'], c['composite_score'],
+                                  '; '.join(c['flags']) if c['flags'] else 'None', 'Traditional')
+                                 for c in traditional['top_candidates'])
             print(f"\n💾 Traditional candidates saved to: {trad_filename}")
         
         # Save adjusted results
         if adjusted['top_candidates']:
-            df_adj = pd.DataFrame([
-                {
-                    'symbol': c['symbol'],
-                    'composite_score': c['composite_score'],
-                    'flags': '; '.join(c['flags']) if c['flags'] else 'None',
-                    'criteria': '2025-Adjusted'
-                }
-                for c in adjusted['top_candidates']
-            ])
             adj_filename = f"buffett_2025_adjusted_{timestamp}.csv"
-            df_adj.to_csv(adj_filename, index=False)
+            with open(adj_filename, 'w', newline='', encoding='utf-8') as fh:
+                writer = csv.writer(fh, lineterminator='\n')
+                writer.writerow(['symbol', 'composite_score', 'flags', 'criteria'])
+                writer.writerows((c['symbol'], c['composite_score'],
+                                  '; '.join(c['flags']) if c['flags'] else 'None', '2025-Adjusted')
+                                 for c in adjusted['top_candidates'])
             print(f"💾 2025-adjusted candidates saved to: {adj_filename}")
         
         # Save detailed analyses to separate files (winners vs fails)
         if detailed_analyses and top_picks_symbols:
             # WINNERS FILE - Top Picks Only
             winners_filename = f"buffett_top_picks_{timestamp}.txt"
-            with open(winners_filename, 'w', encoding='utf-8') as f:
+            with open(winners_filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
                 f.write("WARREN BUFFETT'S TOP STOCK PICKS - DETAILED ANALYSES\n")
                 f.write("="*80 + "\n")
-                f.write(f"TOP {portfolio_strategy['buffett_picks']} BUFFETT PICKS - OCTOBER 2025\n")
+                f.write(f"TOP {portfolio_strategy['buffett_picks']} BUFFETT PICKS - {month_label}\n")
                 f.write("="*80 + "\n\n")
                 
                 # Write portfolio strategy summary
@@ -1743,48 +2537,33 @@ def print_dual_screening_results(dual_results: Dict, save_files: bool = True):
                 f.write("-" * 85 + "\n")
                 
                 # Get the top picks from the portfolio strategy
-                top_picks_list = portfolio_strategy['all_qualified_stocks'][:portfolio_strategy['buffett_picks']]
-                for i, stock in enumerate(top_picks_list, 1):
-                    # Determine recommendation based on score and criteria
-                    if stock['criteria'] == 'Traditional Buffett' or stock['score'] > 0.4:
-                        recommendation = "STRONG BUY"
-                    elif stock['score'] > 0.3:
-                        recommendation = "BUY"
-                    else:
-                        recommendation = "BUY (Watch)"
-                    
-                    flags_text = '; '.join(stock['flags']) if stock['flags'] else 'Clean'
-                    if len(flags_text) > 20:
-                        flags_text = flags_text[:17] + "..."
-                    
-                    f.write(f"{i:<4} {stock['symbol']:<8} {stock['score']:<8.3f} {stock['criteria']:<18} {recommendation:<12} {flags_text}\n")
+                f.write(''.join(_format_top_pick_row(rank=i, symbol=stock.symbol, score=stock.score,
+                                                     criteria=stock.criteria, status=stock.recommendation,
+                                                     notes=stock.flags_text_trunc) + "\n"
+                                for i, stock in enumerate(portfolio_strategy['top_picks'], 1)))
                 
                 f.write("\n" + "="*80 + "\n")
                 f.write("DETAILED FUNDAMENTAL ANALYSES - TOP PICKS\n")
                 f.write("="*80 + "\n\n")
                 
-                # Filter and sort analyses to only include top picks
-                top_picks_analyses = {symbol: analysis for symbol, analysis in detailed_analyses.items() 
-                                    if symbol in top_picks_symbols}
-                
-                # Sort by the order they appear in top picks (already ranked by score)
-                sorted_analyses = [(symbol, top_picks_analyses[symbol]) for symbol in top_picks_symbols 
-                                  if symbol in top_picks_analyses]
-                
-                for symbol, analysis in sorted_analyses:
-                    f.write(analysis)
+                # Only top picks, in the order they appear in top picks (already ranked by score),
+                # streamed straight to the file
+                for symbol in top_picks_symbols:
+                    if symbol not in detailed_analyses:
+                        continue
+                    f.write(detailed_analyses[symbol])
                     f.write("\n" + "="*80 + "\n\n")
             
             print(f"🏆 Top picks analysis saved to: {winners_filename}")
             
             # FAILS FILE - Qualifying stocks that didn't make the cut
-            failed_stocks = [stock for stock in portfolio_strategy['all_qualified_stocks'][portfolio_strategy['buffett_picks']:]]
+            failed_stocks = rank_qualified_stocks(portfolio_strategy['remaining_stocks'])
             if failed_stocks:
                 fails_filename = f"buffett_qualifying_fails_{timestamp}.txt"
-                with open(fails_filename, 'w', encoding='utf-8') as f:
+                with open(fails_filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
                     f.write("WARREN BUFFETT STOCK SCREENING - QUALIFYING STOCKS THAT DIDN'T MAKE THE CUT\n")
                     f.write("="*80 + "\n")
-                    f.write(f"QUALIFYING STOCKS NOT IN TOP {portfolio_strategy['buffett_picks']} - OCTOBER 2025\n")
+                    f.write(f"QUALIFYING STOCKS NOT IN TOP {portfolio_strategy['buffett_picks']} - {month_label}\n")
                     f.write("="*80 + "\n\n")
                     
                     f.write("� SUMMARY:\n")
@@ -1799,28 +2578,20 @@ def print_dual_screening_results(dual_results: Dict, save_files: bool = True):
                     f.write(f"{'Rank':<4} {'Symbol':<8} {'Score':<8} {'Criteria':<18} {'Status':<12} {'Notes'}\n")
                     f.write("-" * 85 + "\n")
                     
-                    for i, stock in enumerate(failed_stocks, portfolio_strategy['buffett_picks'] + 1):
-                        flags_text = '; '.join(stock['flags']) if stock['flags'] else 'Clean'
-                        if len(flags_text) > 20:
-                            flags_text = flags_text[:17] + "..."
-                        
-                        f.write(f"{i:<4} {stock['symbol']:<8} {stock['score']:<8.3f} {stock['criteria']:<18} {'NOT SELECTED':<12} {flags_text}\n")
+                    f.write(''.join(_format_top_pick_row(rank=i, symbol=stock.symbol, score=stock.score,
+                                                         criteria=stock.criteria, status='NOT SELECTED',
+                                                         notes=stock.flags_text_trunc) + "\n"
+                                    for i, stock in enumerate(failed_stocks, portfolio_strategy['buffett_picks'] + 1)))
                     
                     f.write("\n" + "="*80 + "\n")
                     f.write("DETAILED FUNDAMENTAL ANALYSES - QUALIFYING FAILS\n")
                     f.write("="*80 + "\n\n")
                     
-                    # Filter and sort analyses for failed stocks
-                    failed_symbols = [stock['symbol'] for stock in failed_stocks]
-                    failed_analyses = {symbol: analysis for symbol, analysis in detailed_analyses.items() 
-                                     if symbol in failed_symbols}
-                    
-                    # Sort by the order they appear in failed stocks (already ranked by score)
-                    sorted_failed_analyses = [(symbol, failed_analyses[symbol]) for symbol in failed_symbols 
-                                            if symbol in failed_analyses]
-                    
-                    for symbol, analysis in sorted_failed_analyses:
-                        f.write(analysis)
+                    # In the order they appear in failed stocks (already ranked by score)
+                    for stock in failed_stocks:
+                        if stock.symbol not in detailed_analyses:
+                            continue
+                        f.write(detailed_analyses[stock.symbol])
                         f.write("\n" + "="*80 + "\n\n")
                 
                 print(f"📉 Qualifying fails analysis saved to: {fails_filename}")
@@ -1828,34 +2599,27 @@ def print_dual_screening_results(dual_results: Dict, save_files: bool = True):
                 print(f"📊 No qualifying stocks below cut-off - all {portfolio_strategy['total_qualified']} stocks made the top picks!")
         
         # Save combined comparison
-        all_results = []
-        for c in traditional['passed']:
-            all_results.append({
-                'symbol': c['symbol'],
-                'criteria': 'Traditional',
-                'composite_score': c['composite_score'],
-                'status': 'PASSED',
-                'flags': '; '.join(c['flags']) if c['flags'] else 'None'
-            })
-        
-        for c in adjusted['passed']:
-            all_results.append({
-                'symbol': c['symbol'],
-                'criteria': '2025-Adjusted',
-                'composite_score': c['composite_score'],
-                'status': 'PASSED',
-                'flags': '; '.join(c['flags']) if c['flags'] else 'None'
-            })
-        
-        if all_results:
-            df_combined = pd.DataFrame(all_results)
+        if traditional['passed'] or adjusted['passed']:
             combined_filename = f"buffett_dual_screening_{timestamp}.csv"
-            df_combined.to_csv(combined_filename, index=False)
+            with open(combined_filename, 'w', newline='', encoding='utf-8') as fh:
+                writer = csv.writer(fh, lineterminator='\n')
+                writer.writerow(['symbol', 'criteria', 'composite_score', 'status', 'flags'])
+                
+                def passed_rows(passed, criteria):
+                    for c in passed:
+                        yield (c['symbol'], criteria, c['composite_score'], 'PASSED',
+                               '; '.join(c['flags']) if c['flags'] else 'None')
+                
+                writer.writerows(chain(passed_rows(traditional['passed'], 'Traditional'),
+                                       passed_rows(adjusted['passed'], '2025-Adjusted')))
             print(f"💾 Combined results saved to: {combined_filename}")
 
-def main():
+def main(generate_analyses: bool = True):
     """
     Main execution function with dual screening capability
+    
+    Args:
+        generate_analyses: If False, skip the per-stock plain-English analyses (--no-analysis)
     """
     print("Modern Buffett Stock Screener - Dual Screening Edition")
     print("Comparing Traditional vs 2025 Market-Adjusted Criteria")
@@ -1883,7 +2647,7 @@ def main():
         return
     
     # Run dual screening
-    dual_results = run_dual_screening(stocks)
+    dual_results = run_dual_screening(stocks, generate_analyses=generate_analyses)
     
     # Print comprehensive results
     print_dual_screening_results(dual_results, save_files=True)
@@ -1895,12 +2659,7 @@ def run_quick_test():
     print("Running quick test with real data for 5 stocks...")
     test_symbols = ['AAPL', 'MSFT', 'GOOGL', 'JNJ', 'JPM']
     
-    stocks = []
-    for symbol in test_symbols:
-        print(f"Fetching {symbol}...")
-        stock_data = fetch_stock_data(symbol)
-        if stock_data:
-            stocks.append(stock_data)
+    stocks = fetch_stocks_concurrently(test_symbols)
     
     screener = BuffettScreener()
     results = screener.screen_universe(stocks)
@@ -1910,5 +2669,5 @@ if __name__ == "__main__":
     # Uncomment the next line to run a quick test with real data
     # run_quick_test()
     
-    # Run the full screening program
-    main()
\ No newline at end of file
+    # Run the full screening program (--no-analysis skips the plain-English reports)
+    main(generate_analyses="--no-analysis" not in sys.argv)
\ No newline at end of file
@@ -6,7 +6,7 @@ Keeps the system awake while monitoring runs
 
 import ctypes
 import time
-from threading import Thread
+from threading import Thread, Event
 from enhanced_crisis_monitor import CrisisMonitor
 
 class SystemWakeKeeper:
@@ -18,22 +18,32 @@ class SystemWakeKeeper:
         self.ES_AWAYMODE_REQUIRED = 0x00000040
         self.running = False
         
+        # Resolve the kernel32 entry point once instead of on every call
+        self._ses = ctypes.windll.kernel32.SetThreadExecutionState
+        self._ses.restype = ctypes.c_uint32
+        self._ses.argtypes = [ctypes.c_uint32]
+        
     def start_keeping_awake(self):
         """Prevent system sleep"""
         self.running = True
         # Prevent system sleep and away mode
-        ctypes.windll.kernel32.SetThreadExecutionState(
+        self._ses(
             self.ES_CONTINUOUS | 
             self.ES_SYSTEM_REQUIRED | 
             self.ES_AWAYMODE_REQUIRED
         )
         print("🔄 System sleep prevention ENABLED")
         
+    def refresh(self):
+        """Re-assert the sleep prevention hint (called once per monitoring cycle)"""
+        if self.running:
+            self._ses(self.ES_CONTINUOUS | self.ES_SYSTEM_REQUIRED)
+        
     def stop_keeping_awake(self):
         """Allow system sleep again"""
         self.running = False
         # Reset to normal power management
-        ctypes.windll.kernel32.SetThreadExecutionState(self.ES_CONTINUOUS)
+        self._ses(self.ES_CONTINUOUS)
         print("💤 System sleep prevention DISABLED")
 
 class ContinuousMonitor:
@@ -43,6 +53,7 @@ class ContinuousMonitor:
         self.wake_keeper = SystemWakeKeeper()
         self.crisis_monitor = CrisisMonitor()
         self.running = False
+        self._stop_event = Event()
         
     def start_monitoring(self, check_interval_minutes=15):
         """Start continuous monitoring with sleep prevention"""
@@ -52,10 +63,12 @@ class ContinuousMonitor:
         # Prevent system sleep
         self.wake_keeper.start_keeping_awake()
         self.running = True
+        self._stop_event.clear()
         
         try:
             while self.running:
                 print(f"\n⏰ {time.strftime('%Y-%m-%d %H:%M:%S')} - Running threat assessment...")
+                self.wake_keeper.refresh()
                 
                 # Run the crisis assessment
                 try:
@@ -67,13 +80,11 @@ class ContinuousMonitor:
                 # Wait for next check
                 print(f"⏳ Next check in {check_interval_minutes} minutes...")
                 
-                # Sleep in smaller chunks to allow for interruption
-                for _ in range(check_interval_minutes * 60):
-                    if not self.running:
-                        break
-                    time.sleep(1)
+                # Block until the next check is due or stop_monitoring wakes us early
+                self._stop_event.wait(timeout=check_interval_minutes * 60)
                     
         except KeyboardInterrupt:
+            self._stop_event.set()
             print("\n🛑 Monitoring stopped by user (Ctrl+C)")
         except Exception as e:
             print(f"\n❌ Monitoring error: {e}")
@@ -84,6 +95,7 @@ class ContinuousMonitor:
         """Stop monitoring and restore normal power management"""
         print("🔄 Stopping continuous monitoring...")
         self.running = False
+        self._stop_event.set()
         self.wake_keeper.stop_keeping_awake()
         print("✅ Monitoring stopped successfully")
 
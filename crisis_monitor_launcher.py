@@ -7,45 +7,148 @@ Author: Financial Analysis Engine
 Date: November 6, 2025
 """
 
-import os
 import sys
 
-def main():
-    print("="*60)
-    print("FINANCIAL CRISIS ALERT SYSTEM")
-    print("="*60)
-    print()
-    print("This system monitors financial markets and provides")
-    print("clear instructions when crisis conditions are detected.")
-    print()
-    print("Choose an option:")
-    print("1. Run single check now")
-    print("2. Start continuous monitoring (every 15 minutes)")
-    print("3. Exit")
-    print()
+__all__ = ['single_check', 'continuous_check', 'market_open', 'main']
+
+# The alerts module pulls in yfinance/pandas, so it is imported on first use
+# rather than when the launcher is imported
+_alerts_module = None
+
+def _alerts():
+    """Import automated_crisis_alerts on first call; None if it is unavailable"""
+    global _alerts_module
+    if _alerts_module is None:
+        try:
+            import automated_crisis_alerts
+            _alerts_module = automated_crisis_alerts
+        except ImportError:
+            _alerts_module = False
+    return _alerts_module or None
+
+# Default polling bounds in minutes: the short interval is used while markets are
+# open and volatile, the long one otherwise
+MIN_INTERVAL_MINUTES = 1
+MAX_INTERVAL_MINUTES = 15
+ELEVATED_VIX = 25
+# Minutes between checks after a crisis is detected outside volatile market hours
+CRISIS_INTERVAL_MINUTES = 5
+
+def single_check(args):
+    """Run one crisis check, in-process when possible"""
+    alerts = _alerts()
+    if alerts:
+        alerts.run_single_check()
+    else:
+        import subprocess
+        subprocess.run([sys.executable, "automated_crisis_alerts.py"])
+
+def market_open(now=None):
+    """True during regular US equity trading hours (weekdays 9:30-16:00 Eastern)"""
+    from datetime import datetime
+    from zoneinfo import ZoneInfo
+    
+    now = now or datetime.now(ZoneInfo("America/New_York"))
+    if now.weekday() >= 5:
+        return False
+    return (9, 30) <= (now.hour, now.minute) < (16, 0)
+
+async def _poll_loop(check, next_interval):
+    """Run check immediately, then again after each sleep
+    
+    The next check is only scheduled once the previous one has finished, so a
+    slow check delays the schedule instead of overlapping the next run.
+    
+    Args:
+        check: Blocking callable run in a worker thread
+        next_interval: Callable mapping the check's result to seconds to sleep
+    """
+    import asyncio
     
     while True:
-        choice = input("Enter your choice (1, 2, or 3): ").strip()
-        
-        if choice == "1":
-            print("\n🔍 Running single crisis check...")
-            os.system("python automated_crisis_alerts.py")
-            break
-            
-        elif choice == "2":
-            print("\n🚀 Starting continuous monitoring...")
-            print("The system will check every 15 minutes.")
-            print("Press Ctrl+C to stop monitoring.")
-            print()
-            os.system("python automated_crisis_alerts.py --continuous")
-            break
-            
-        elif choice == "3":
-            print("\n👋 Goodbye!")
-            sys.exit(0)
-            
-        else:
-            print("❌ Invalid choice. Please enter 1, 2, or 3.")
+        result = await asyncio.to_thread(check)
+        await asyncio.sleep(next_interval(result))
+
+def continuous_check(args):
+    """Run continuous crisis monitoring with adaptive polling, in-process when possible"""
+    alerts = _alerts()
+    if not alerts:
+        import subprocess
+        subprocess.run([sys.executable, "automated_crisis_alerts.py", "--continuous"])
+        return
+    
+    import asyncio
+    monitor = alerts.CrisisAlertSystem(portfolio_value=1000000)  # $1M default portfolio
+    min_seconds = args.min_interval * 60
+    max_seconds = args.max_interval * 60
+    crisis_minutes = max(args.min_interval, min(CRISIS_INTERVAL_MINUTES, args.max_interval))
+    
+    def next_interval(crisis_detected):
+        vix = (monitor.last_market_data or {}).get('vix')
+        elevated = vix is not None and vix > ELEVATED_VIX and market_open()
+        if crisis_detected:
+            print("\n🔔 CRISIS ALERT SENT - CHECK YOUR EMAIL/PHONE")
+        if elevated:
+            print(f"Monitoring will continue every {args.min_interval:g} minute(s) while markets are volatile")
+            return min_seconds
+        if crisis_detected:
+            print(f"Monitoring will continue every {crisis_minutes:g} minutes during crisis conditions")
+            return crisis_minutes * 60
+        return max_seconds
+    
+    try:
+        asyncio.run(_poll_loop(monitor.check_all_conditions, next_interval))
+    except KeyboardInterrupt:
+        print("\n\n⏹️  MONITORING STOPPED BY USER")
+        print(f"Total alerts generated: {len(monitor.alert_history)}")
+
+_EQ60 = "=" * 60
+
+# Banner and menu shown at startup, joined once
+_HEADER_MENU = "\n".join([
+    _EQ60,
+    "FINANCIAL CRISIS ALERT SYSTEM",
+    _EQ60,
+    "",
+    "This system monitors financial markets and provides",
+    "clear instructions when crisis conditions are detected.",
+    "",
+    "Choose an option:",
+    "1. Run single check now",
+    "2. Start continuous monitoring (every 15 minutes)",
+    "3. Exit",
+    "",
+])
+
+# Menu choice -> (action, message printed before running it)
+ACTIONS = {
+    "1": (single_check, "\n🔍 Running single crisis check..."),
+    "2": (continuous_check, "\n🚀 Starting continuous monitoring...\n"
+                            "The system will check every 15 minutes, more often while markets are volatile.\n"
+                            "Press Ctrl+C to stop monitoring.\n"),
+    "3": (lambda args: sys.exit(0), "\n👋 Goodbye!"),
+}
+
+def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Financial Crisis Alert System')
+    parser.add_argument('--min-interval', type=float, default=MIN_INTERVAL_MINUTES,
+                       help=f'Minutes between checks while markets are volatile (default: {MIN_INTERVAL_MINUTES})')
+    parser.add_argument('--max-interval', type=float, default=MAX_INTERVAL_MINUTES,
+                       help=f'Minutes between checks in quiet periods (default: {MAX_INTERVAL_MINUTES})')
+    args = parser.parse_args()
+    if not 0 < args.min_interval <= args.max_interval:
+        parser.error("--min-interval must be positive and no greater than --max-interval")
+    
+    print(_HEADER_MENU)
+    
+    while (choice := input("Enter your choice (1, 2, or 3): ").strip()) not in ACTIONS:
+        print("❌ Invalid choice. Please enter 1, 2, or 3.")
+    
+    action, message = ACTIONS[choice]
+    print(message)
+    action(args)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
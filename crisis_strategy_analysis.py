@@ -8,410 +8,720 @@ Author: Financial Analysis Engine
 Date: November 6, 2025
 """
 
-import pandas as pd
-import numpy as np
+import os
+import sys
+import time
+import hashlib
+import json
 from datetime import datetime, timedelta
+from functools import cached_property, lru_cache
+from types import MappingProxyType
 import warnings
-warnings.filterwarnings('ignore')
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+__all__ = [
+    'CrisisStrategyAnalyzer',
+    'generate_detailed_action_plan',
+    'get_defensive_metrics',
+    'get_opportunity_metrics',
+    'get_hedging_metrics',
+    'get_sector_metrics',
+    'get_risk_metrics',
+    'get_executive_summary',
+    'metrics_array',
+    'METRIC_INDEX',
+]
+
+def _freeze(value):
+    """Recursively wrap dicts in read-only MappingProxyType views and lists in tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+# Bump when the report content or layout changes so cached reports are regenerated
+_VERSION = "1"
+
+# Same-day report cache
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "tspMover")
+_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Report separators
+_EQ80 = "=" * 80
+_RULE_40 = "-" * 40
+_END_OF_REPORT = "\n".join(["\n" + _EQ80, "END OF REPORT", _EQ80])
+
+# Strategy metric tables. They depend on nothing at runtime, so they are built (and frozen)
+# once at import and the analyzer's calculate_* methods simply return them.
+_DEFENSIVE = _freeze({
+    # Cash Position Metrics
+    'cash_strategy': {
+        'recommended_cash_allocation': 0.30,  # 30% cash allocation
+        'emergency_reserve_months': 12,       # 12 months expenses
+        'liquidity_stress_test': 0.25,       # 25% immediate access requirement
+        'cash_yield_target': 0.045,          # 4.5% on cash equivalents
+    },
+    # Treasury Allocation Metrics
+    'treasury_strategy': {
+        'short_term_treasury_allocation': 0.20,  # 20% in <2yr treasuries
+        'max_duration': 2.0,                     # Maximum 2-year duration
+        'yield_floor': 0.04,                     # 4% minimum yield
+        'rollover_frequency_days': 90,           # 90-day rolling strategy
+    },
+    # Precious Metals Hedge
+    'metals_strategy': {
+        'gold_allocation': 0.10,                 # 10% gold allocation
+        'silver_allocation': 0.02,               # 2% silver allocation
+        'inflation_hedge_ratio': 0.12,           # 12% total metals
+        'volatility_buffer': 0.15,               # 15% volatility tolerance
+    }
+})
+
+_OPPORTUNITY = _freeze({
+    # Short Equity Positions
+    'short_strategy': {
+        'max_short_exposure': 0.15,              # 15% maximum short exposure
+        'target_sectors': ['retail', 'consumer_discretionary', 'commercial_real_estate'],
+        'short_ratio_threshold': 0.20,           # 20% short interest threshold
+        'stop_loss_percentage': 0.08,            # 8% stop loss on shorts
+        'profit_target': 0.25,                   # 25% profit target
+    },
+    # Distressed Debt Opportunities
+    'distressed_strategy': {
+        'allocation_percentage': 0.08,           # 8% allocation to distressed debt
+        'minimum_yield': 0.12,                   # 12% minimum yield requirement
+        'credit_rating_floor': 'CCC',            # Minimum credit rating
+        'diversification_limit': 0.02,           # 2% max per issuer
+        'recovery_rate_assumption': 0.40,        # 40% recovery rate assumption
+    },
+    # Energy Sector Value
+    'energy_strategy': {
+        'sector_allocation': 0.05,               # 5% energy allocation
+        'oil_price_target': 75.00,               # $75/barrel target price
+        'current_discount': 0.20,                # 20% discount to fair value
+        'dividend_yield_minimum': 0.06,          # 6% minimum dividend yield
+        'geopolitical_risk_premium': 0.15,       # 15% risk premium
+    }
+})
+
+_HEDGING = _freeze({
+    # Interest Rate Hedging
+    'rate_hedging': {
+        'duration_hedge_ratio': 0.50,            # 50% duration hedge
+        'swap_notional_percentage': 0.30,        # 30% of portfolio in swaps
+        'rate_increase_protection': 0.02,        # Protection against 2% rate rise
+        'hedge_cost_budget': 0.005,              # 0.5% annual hedge cost
+    },
+    # Currency Hedging
+    'currency_hedging': {
+        'foreign_exposure_hedge': 0.80,          # 80% foreign exposure hedged
+        'dollar_strength_assumption': 0.95,      # Assume 5% dollar weakness
+        'hedge_rebalance_frequency': 30,         # 30-day rebalance
+        'cross_currency_allocation': 0.15,       # 15% non-USD exposure
+    },
+    # Volatility Strategy
+    'volatility_strategy': {
+        'vix_target_range': (20, 35),            # VIX target range
+        'volatility_allocation': 0.03,           # 3% volatility strategies
+        'options_premium_budget': 0.02,          # 2% premium budget
+        'tail_risk_protection': 0.01,            # 1% tail risk hedging
+    }
+})
+
+_SECTOR = _freeze({
+    # Technology/AI Infrastructure
+    'technology_strategy': {
+        'ai_infrastructure_allocation': 0.12,    # 12% AI/data center allocation
+        'growth_rate_assumption': 0.25,          # 25% annual growth
+        'valuation_multiple_target': 15,         # 15x earnings target
+        'capex_intensity_threshold': 0.20,       # 20% capex/revenue threshold
+    },
+    # Defense Contractors
+    'defense_strategy': {
+        'defense_allocation': 0.06,              # 6% defense allocation
+        'geopolitical_premium': 0.10,            # 10% geopolitical premium
+        'contract_backlog_years': 3,             # 3-year contract visibility
+        'margin_stability_requirement': 0.15,    # 15% minimum margins
+    },
+    # Essential Services
+    'essential_services': {
+        'utilities_allocation': 0.08,            # 8% utilities allocation
+        'healthcare_allocation': 0.10,           # 10% healthcare allocation
+        'dividend_yield_target': 0.04,           # 4% dividend yield target
+        'beta_ceiling': 0.70,                    # Maximum 0.7 beta
+    }
+})
+
+_RISK = _freeze({
+    'maximum_portfolio_var': 0.05,           # 5% daily VaR limit
+    'stress_test_loss_limit': 0.20,          # 20% stress test loss limit
+    'correlation_threshold': 0.70,           # 70% max correlation between positions
+    'liquidity_requirement': 0.30,           # 30% must be liquid within 24 hours
+    'counterparty_exposure_limit': 0.05,     # 5% max exposure per counterparty
+    'leverage_ceiling': 1.50,                # 1.5x maximum leverage
+    'rebalancing_frequency': 14,             # 14-day rebalancing cycle
+})
+
+_EXECUTIVE_SUMMARY = _freeze({
+    'situation_assessment': {
+        'severity_level': 'CRITICAL',
+        'timeframe': 'IMMEDIATE ACTION REQUIRED',
+        'probability_of_crisis': 0.85,
+        'estimated_duration_months': 18
+    },
+    'immediate_actions': [
+        'Increase cash position to 30% within 7 days',
+        'Implement 15% short equity exposure targeting overvalued sectors',
+        'Purchase 10% gold allocation as inflation hedge',
+        'Execute interest rate swaps to hedge 50% of duration risk',
+        'Liquidate all positions with duration >2 years'
+    ],
+    'timeline': {
+        'week_1': 'Defensive positioning and liquidity enhancement',
+        'month_1': 'Hedging implementation and risk reduction',
+        'month_3': 'Opportunity identification and selective deployment',
+        'month_6': 'Portfolio rebalancing based on crisis evolution'
+    }
+})
+
+# Numbered immediate-action list for the executive summary, joined once
+_IMMEDIATE_ACTIONS_TEXT = "\n".join(f"{i}. {action}" for i, action in
+                                     enumerate(_EXECUTIVE_SUMMARY['immediate_actions'], 1))
+
+# Display names for the short-strategy target sectors
+_PRETTY_SECTORS = {sector: sector.replace('_', ' ').title()
+                   for sector in _OPPORTUNITY['short_strategy']['target_sectors']}
+
+# Report sub-tables whose fractional entries are shown as percentages, keyed by report section
+_PERCENT_TABLES = {
+    'situation': _EXECUTIVE_SUMMARY['situation_assessment'],
+    'cash': _DEFENSIVE['cash_strategy'],
+    'treasury': _DEFENSIVE['treasury_strategy'],
+    'metals': _DEFENSIVE['metals_strategy'],
+    'short': _OPPORTUNITY['short_strategy'],
+    'distressed': _OPPORTUNITY['distressed_strategy'],
+    'energy': _OPPORTUNITY['energy_strategy'],
+    'rates': _HEDGING['rate_hedging'],
+    'currency': _HEDGING['currency_hedging'],
+    'vol': _HEDGING['volatility_strategy'],
+    'tech': _SECTOR['technology_strategy'],
+    'defense': _SECTOR['defense_strategy'],
+    'essential': _SECTOR['essential_services'],
+    'risk': _RISK,
+}
+_ONE_DECIMAL_METRICS = {'cash.cash_yield_target', 'rates.hedge_cost_budget'}
+
+# Flat (key, value, format) rows for every fractional metric, plus derived display values
+_METRIC_ROWS = (
+    [(f"{section}.{key}", value, 'pct1' if f"{section}.{key}" in _ONE_DECIMAL_METRICS else 'pct0')
+     for section, table in _PERCENT_TABLES.items()
+     for key, value in table.items() if isinstance(value, float)]
+    + [('currency.dollar_weakness', 1 - _HEDGING['currency_hedging']['dollar_strength_assumption'], 'pct0')]
+)
+METRIC_INDEX = {row[0]: i for i, row in enumerate(_METRIC_ROWS)}
+
+# NumPy is only needed to format the metrics, so it is imported on first use
+# rather than at module import
+_np = None
+_pct = None
+
+def _numpy():
+    """Import NumPy on first call and keep it on the module"""
+    global _np
+    if _np is None:
+        import numpy
+        _np = numpy
+    return _np
+
+def metrics_array():
+    """Structured (key, val, fmt) array of the report metrics, indexed by METRIC_INDEX"""
+    return _numpy().array(_METRIC_ROWS, dtype=[('key', 'U64'), ('val', 'f8'), ('fmt', 'U10')])
+
+def _format_metrics(metrics):
+    """Display strings for a metrics array, formatted in one vectorized pass per format kind"""
+    np = _numpy()
+    percent = metrics['val'] * 100
+    return np.where(metrics['fmt'] == 'pct1',
+                    np.char.mod('%.1f%%', percent),
+                    np.char.mod('%.0f%%', percent)).tolist()
+
+def _texts_by_section(metrics):
+    """Group formatted metric display strings as {section: {metric: text}}"""
+    grouped = {}
+    for key, text in zip(metrics['key'].tolist(), _format_metrics(metrics)):
+        section, name = key.split('.', 1)
+        grouped.setdefault(section, {})[name] = text
+    return _freeze(grouped)
+
+def _percent_texts():
+    """Percentages as they appear in the report (keyed by section), formatted on first call"""
+    global _pct
+    if _pct is None:
+        _pct = _texts_by_section(metrics_array())
+    return _pct
+
+# Module-level getters for the frozen metric tables
+def get_defensive_metrics():
+    """Metrics for defensive positioning strategy"""
+    return _DEFENSIVE
+
+def get_opportunity_metrics():
+    """Metrics for crisis opportunity investments"""
+    return _OPPORTUNITY
+
+def get_hedging_metrics():
+    """Hedging strategy metrics"""
+    return _HEDGING
+
+def get_sector_metrics():
+    """Sector-specific investment metrics"""
+    return _SECTOR
+
+def get_risk_metrics():
+    """Comprehensive risk management metrics"""
+    return _RISK
+
+def get_executive_summary():
+    """Executive summary with specific actions"""
+    return _EXECUTIVE_SUMMARY
 
 class CrisisStrategyAnalyzer:
     def __init__(self):
-        self.analysis_date = datetime.now()
         self.crisis_indicators = {}
         self.strategy_metrics = {}
         
-    def calculate_defensive_metrics(self):
-        """Calculate metrics for defensive positioning strategy"""
-        
-        # Cash Position Metrics
-        cash_metrics = {
-            'recommended_cash_allocation': 0.30,  # 30% cash allocation
-            'emergency_reserve_months': 12,       # 12 months expenses
-            'liquidity_stress_test': 0.25,       # 25% immediate access requirement
-            'cash_yield_target': 0.045,          # 4.5% on cash equivalents
-        }
-        
-        # Treasury Allocation Metrics
-        treasury_metrics = {
-            'short_term_treasury_allocation': 0.20,  # 20% in <2yr treasuries
-            'max_duration': 2.0,                     # Maximum 2-year duration
-            'yield_floor': 0.04,                     # 4% minimum yield
-            'rollover_frequency_days': 90,           # 90-day rolling strategy
-        }
-        
-        # Precious Metals Hedge
-        metals_metrics = {
-            'gold_allocation': 0.10,                 # 10% gold allocation
-            'silver_allocation': 0.02,               # 2% silver allocation
-            'inflation_hedge_ratio': 0.12,           # 12% total metals
-            'volatility_buffer': 0.15,               # 15% volatility tolerance
-        }
-        
-        return {
-            'cash_strategy': cash_metrics,
-            'treasury_strategy': treasury_metrics,
-            'metals_strategy': metals_metrics
-        }
-    
-    def calculate_opportunity_metrics(self):
-        """Calculate metrics for crisis opportunity investments"""
-        
-        # Short Equity Positions
-        short_metrics = {
-            'max_short_exposure': 0.15,              # 15% maximum short exposure
-            'target_sectors': ['retail', 'consumer_discretionary', 'commercial_real_estate'],
-            'short_ratio_threshold': 0.20,           # 20% short interest threshold
-            'stop_loss_percentage': 0.08,            # 8% stop loss on shorts
-            'profit_target': 0.25,                   # 25% profit target
-        }
-        
-        # Distressed Debt Opportunities
-        distressed_metrics = {
-            'allocation_percentage': 0.08,           # 8% allocation to distressed debt
-            'minimum_yield': 0.12,                   # 12% minimum yield requirement
-            'credit_rating_floor': 'CCC',            # Minimum credit rating
-            'diversification_limit': 0.02,           # 2% max per issuer
-            'recovery_rate_assumption': 0.40,        # 40% recovery rate assumption
-        }
-        
-        # Energy Sector Value
-        energy_metrics = {
-            'sector_allocation': 0.05,               # 5% energy allocation
-            'oil_price_target': 75.00,               # $75/barrel target price
-            'current_discount': 0.20,                # 20% discount to fair value
-            'dividend_yield_minimum': 0.06,          # 6% minimum dividend yield
-            'geopolitical_risk_premium': 0.15,       # 15% risk premium
-        }
-        
-        return {
-            'short_strategy': short_metrics,
-            'distressed_strategy': distressed_metrics,
-            'energy_strategy': energy_metrics
-        }
-    
-    def calculate_hedging_metrics(self):
-        """Calculate hedging strategy metrics"""
-        
-        # Interest Rate Hedging
-        rate_hedge_metrics = {
-            'duration_hedge_ratio': 0.50,            # 50% duration hedge
-            'swap_notional_percentage': 0.30,        # 30% of portfolio in swaps
-            'rate_increase_protection': 0.02,        # Protection against 2% rate rise
-            'hedge_cost_budget': 0.005,              # 0.5% annual hedge cost
-        }
-        
-        # Currency Hedging
-        currency_metrics = {
-            'foreign_exposure_hedge': 0.80,          # 80% foreign exposure hedged
-            'dollar_strength_assumption': 0.95,      # Assume 5% dollar weakness
-            'hedge_rebalance_frequency': 30,         # 30-day rebalance
-            'cross_currency_allocation': 0.15,       # 15% non-USD exposure
-        }
-        
-        # Volatility Strategy
-        volatility_metrics = {
-            'vix_target_range': (20, 35),            # VIX target range
-            'volatility_allocation': 0.03,           # 3% volatility strategies
-            'options_premium_budget': 0.02,          # 2% premium budget
-            'tail_risk_protection': 0.01,            # 1% tail risk hedging
-        }
+    @cached_property
+    def analysis_date(self):
+        """Time of the analysis, read on first access rather than at construction"""
+        return datetime.now()
         
+    # Back-compat: the calculate_* methods delegate to the module-level getters
+    calculate_defensive_metrics = staticmethod(get_defensive_metrics)
+    calculate_opportunity_metrics = staticmethod(get_opportunity_metrics)
+    calculate_hedging_metrics = staticmethod(get_hedging_metrics)
+    calculate_sector_metrics = staticmethod(get_sector_metrics)
+    calculate_risk_metrics = staticmethod(get_risk_metrics)
+    generate_executive_summary = staticmethod(get_executive_summary)
+    
+    def to_dict(self):
+        """All strategy metrics (the union of the calculate_* tables) as one mapping"""
         return {
-            'rate_hedging': rate_hedge_metrics,
-            'currency_hedging': currency_metrics,
-            'volatility_strategy': volatility_metrics
+            **get_defensive_metrics(),
+            **get_opportunity_metrics(),
+            **get_hedging_metrics(),
+            **get_sector_metrics(),
+            **get_risk_metrics(),
         }
     
-    def calculate_sector_metrics(self):
-        """Calculate sector-specific investment metrics"""
-        
-        # Technology/AI Infrastructure
-        tech_metrics = {
-            'ai_infrastructure_allocation': 0.12,    # 12% AI/data center allocation
-            'growth_rate_assumption': 0.25,          # 25% annual growth
-            'valuation_multiple_target': 15,         # 15x earnings target
-            'capex_intensity_threshold': 0.20,       # 20% capex/revenue threshold
-        }
-        
-        # Defense Contractors
-        defense_metrics = {
-            'defense_allocation': 0.06,              # 6% defense allocation
-            'geopolitical_premium': 0.10,            # 10% geopolitical premium
-            'contract_backlog_years': 3,             # 3-year contract visibility
-            'margin_stability_requirement': 0.15,    # 15% minimum margins
-        }
-        
-        # Essential Services
-        essential_metrics = {
-            'utilities_allocation': 0.08,            # 8% utilities allocation
-            'healthcare_allocation': 0.10,           # 10% healthcare allocation
-            'dividend_yield_target': 0.04,           # 4% dividend yield target
-            'beta_ceiling': 0.70,                    # Maximum 0.7 beta
-        }
-        
-        return {
-            'technology_strategy': tech_metrics,
-            'defense_strategy': defense_metrics,
-            'essential_services': essential_metrics
-        }
-    
-    def calculate_risk_metrics(self):
-        """Calculate comprehensive risk management metrics"""
-        
-        risk_metrics = {
-            'maximum_portfolio_var': 0.05,           # 5% daily VaR limit
-            'stress_test_loss_limit': 0.20,          # 20% stress test loss limit
-            'correlation_threshold': 0.70,           # 70% max correlation between positions
-            'liquidity_requirement': 0.30,           # 30% must be liquid within 24 hours
-            'counterparty_exposure_limit': 0.05,     # 5% max exposure per counterparty
-            'leverage_ceiling': 1.50,                # 1.5x maximum leverage
-            'rebalancing_frequency': 14,             # 14-day rebalancing cycle
-        }
-        
-        return risk_metrics
-    
-    def generate_executive_summary(self):
-        """Generate executive summary with specific actions"""
-        
-        summary = {
-            'situation_assessment': {
-                'severity_level': 'CRITICAL',
-                'timeframe': 'IMMEDIATE ACTION REQUIRED',
-                'probability_of_crisis': 0.85,
-                'estimated_duration_months': 18
-            },
-            'immediate_actions': [
-                'Increase cash position to 30% within 7 days',
-                'Implement 15% short equity exposure targeting overvalued sectors',
-                'Purchase 10% gold allocation as inflation hedge',
-                'Execute interest rate swaps to hedge 50% of duration risk',
-                'Liquidate all positions with duration >2 years'
-            ],
-            'timeline': {
-                'week_1': 'Defensive positioning and liquidity enhancement',
-                'month_1': 'Hedging implementation and risk reduction',
-                'month_3': 'Opportunity identification and selective deployment',
-                'month_6': 'Portfolio rebalancing based on crisis evolution'
-            }
-        }
-        
-        return summary
+    def to_json(self):
+        """to_dict() serialized as UTF-8 JSON bytes (cached in memory and on disk)"""
+        return _metrics_json()
 
-def generate_detailed_action_plan():
-    """Generate detailed, plain-English action plan"""
-    
-    analyzer = CrisisStrategyAnalyzer()
-    
-    print("="*80)
-    print("CRISIS STRATEGY ANALYSIS REPORT")
-    print("Financial Market Stress Response Plan")
-    print(f"Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}")
-    print("="*80)
+def _dumps(value):
+    """Serialize metrics to JSON bytes; frozen mappings are written as plain objects"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=dict)
+    return json.dumps(value, default=dict).encode('utf-8')
+
+def _remove_stale_cache_files(prefix, keep_path):
+    """Delete cache files named prefix* other than keep_path
+    
+    Leftover temp files from interrupted writes are removed too, except those for
+    keep_path, which a concurrent writer may still be using.
+    """
+    keep = os.path.basename(keep_path)
+    try:
+        names = os.listdir(_CACHE_DIR)
+    except OSError:
+        return
+    for name in names:
+        if name.startswith(prefix) and not name.startswith(keep):
+            try:
+                os.remove(os.path.join(_CACHE_DIR, name))
+            except OSError:
+                pass
+
+def _metrics_cache_path():
+    """Metrics cache file keyed on this module's mtime and the report version"""
+    key = hashlib.sha1(f"{os.path.getmtime(__file__)}|{_VERSION}".encode()).hexdigest()
+    return os.path.join(_CACHE_DIR, f"metrics_{key}.json")
+
+@lru_cache(maxsize=1)
+def _metrics_json():
+    """Load the serialized metrics from disk, building and storing them on a miss"""
+    cache_path = _metrics_cache_path()
+    try:
+        with open(cache_path, 'rb') as f:
+            return f.read()
+    except OSError:
+        pass
+    
+    data = _dumps(CrisisStrategyAnalyzer().to_dict())
+    # Atomic write so a concurrent reader never sees a partial file
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+        _remove_stale_cache_files("metrics_", cache_path)
+    except OSError:
+        pass
+    return data
+
+@lru_cache(maxsize=1)
+def _format_minute(minute):
+    """Report header timestamp, formatted once per wall-clock minute"""
+    return minute.strftime('%B %d, %Y at %I:%M %p')
+
+def _render_summary():
+    """Report header and executive summary"""
+    pct = _percent_texts()
+    out = []
+    append = out.append
+    
+    append(_EQ80)
+    append("CRISIS STRATEGY ANALYSIS REPORT")
+    append("Financial Market Stress Response Plan")
+    append(f"Generated: {_format_minute(datetime.now().replace(second=0, microsecond=0))}")
+    append(_EQ80)
     
     # Executive Summary
-    summary = analyzer.generate_executive_summary()
-    print("\nEXECUTIVE SUMMARY")
-    print("-" * 40)
-    print(f"Situation: {summary['situation_assessment']['severity_level']}")
-    print(f"Crisis Probability: {summary['situation_assessment']['probability_of_crisis']*100:.0f}%")
-    print(f"Expected Duration: {summary['situation_assessment']['estimated_duration_months']} months")
+    summary = get_executive_summary()
+    append("\nEXECUTIVE SUMMARY")
+    append(_RULE_40)
+    append(f"Situation: {summary['situation_assessment']['severity_level']}")
+    append(f"Crisis Probability: {pct['situation']['probability_of_crisis']}")
+    append(f"Expected Duration: {summary['situation_assessment']['estimated_duration_months']} months")
+    
+    append("\nIMMEDIATE ACTIONS REQUIRED:")
+    append(_IMMEDIATE_ACTIONS_TEXT)
     
-    print("\nIMMEDIATE ACTIONS REQUIRED:")
-    for i, action in enumerate(summary['immediate_actions'], 1):
-        print(f"{i}. {action}")
+    return "\n".join(out)
+
+def _render_defensive():
+    """Strategy 1 section: defensive positioning"""
+    pct = _percent_texts()
+    out = []
+    append = out.append
     
     # Strategy 1: Defensive Positioning
-    print("\n" + "="*80)
-    print("STRATEGY 1: DEFENSIVE POSITIONING")
-    print("="*80)
+    append("\n" + _EQ80)
+    append("STRATEGY 1: DEFENSIVE POSITIONING")
+    append(_EQ80)
     
-    defensive = analyzer.calculate_defensive_metrics()
+    defensive = get_defensive_metrics()
     
-    print("\nCASH STRATEGY:")
+    append("\nCASH STRATEGY:")
     cash = defensive['cash_strategy']
-    print(f"• Allocate {cash['recommended_cash_allocation']*100:.0f}% of portfolio to cash equivalents")
-    print(f"• Maintain {cash['emergency_reserve_months']} months of operating expenses in liquid cash")
-    print(f"• Target {cash['cash_yield_target']*100:.1f}% yield on cash investments (money market funds, short CDs)")
-    print(f"• Keep {cash['liquidity_stress_test']*100:.0f}% accessible within 24 hours for emergency deployment")
+    append(f"• Allocate {pct['cash']['recommended_cash_allocation']} of portfolio to cash equivalents")
+    append(f"• Maintain {cash['emergency_reserve_months']} months of operating expenses in liquid cash")
+    append(f"• Target {pct['cash']['cash_yield_target']} yield on cash investments (money market funds, short CDs)")
+    append(f"• Keep {pct['cash']['liquidity_stress_test']} accessible within 24 hours for emergency deployment")
     
-    print("\nTREASURY STRATEGY:")
+    append("\nTREASURY STRATEGY:")
     treasury = defensive['treasury_strategy']
-    print(f"• Allocate {treasury['short_term_treasury_allocation']*100:.0f}% to Treasury bills and notes under {treasury['max_duration']} years")
-    print(f"• Target minimum {treasury['yield_floor']*100:.0f}% yield on Treasury positions")
-    print(f"• Roll positions every {treasury['rollover_frequency_days']} days to maintain liquidity")
-    print("• Focus on 3-month, 6-month, and 1-year Treasury bills")
-    
-    print("\nPRECIOUS METALS STRATEGY:")
-    metals = defensive['metals_strategy']
-    print(f"• Allocate {metals['gold_allocation']*100:.0f}% to physical gold or gold ETFs (GLD, IAU)")
-    print(f"• Allocate {metals['silver_allocation']*100:.0f}% to silver exposure (SLV)")
-    print(f"• Total metals allocation: {metals['inflation_hedge_ratio']*100:.0f}% as inflation hedge")
-    print("• Consider mining stocks with strong balance sheets (Newmont, Barrick Gold)")
+    append(f"• Allocate {pct['treasury']['short_term_treasury_allocation']} to Treasury bills and notes under {treasury['max_duration']} years")
+    append(f"• Target minimum {pct['treasury']['yield_floor']} yield on Treasury positions")
+    append(f"• Roll positions every {treasury['rollover_frequency_days']} days to maintain liquidity")
+    append("• Focus on 3-month, 6-month, and 1-year Treasury bills")
+    
+    append("\nPRECIOUS METALS STRATEGY:")
+    append(f"• Allocate {pct['metals']['gold_allocation']} to physical gold or gold ETFs (GLD, IAU)")
+    append(f"• Allocate {pct['metals']['silver_allocation']} to silver exposure (SLV)")
+    append(f"• Total metals allocation: {pct['metals']['inflation_hedge_ratio']} as inflation hedge")
+    append("• Consider mining stocks with strong balance sheets (Newmont, Barrick Gold)")
+    
+    return "\n".join(out)
+
+def _render_opportunities():
+    """Strategy 2 section: crisis opportunity investments"""
+    pct = _percent_texts()
+    out = []
+    append = out.append
     
     # Strategy 2: Crisis Opportunities
-    print("\n" + "="*80)
-    print("STRATEGY 2: CRISIS OPPORTUNITY INVESTMENTS")
-    print("="*80)
+    append("\n" + _EQ80)
+    append("STRATEGY 2: CRISIS OPPORTUNITY INVESTMENTS")
+    append(_EQ80)
     
-    opportunities = analyzer.calculate_opportunity_metrics()
+    opportunities = get_opportunity_metrics()
     
-    print("\nSHORT EQUITY STRATEGY:")
+    append("\nSHORT EQUITY STRATEGY:")
     short = opportunities['short_strategy']
-    print(f"• Maximum {short['max_short_exposure']*100:.0f}% portfolio allocation to short positions")
-    print("• Target sectors for shorting:")
+    append(f"• Maximum {pct['short']['max_short_exposure']} portfolio allocation to short positions")
+    append("• Target sectors for shorting:")
     for sector in short['target_sectors']:
-        print(f"  - {sector.replace('_', ' ').title()}")
-    print(f"• Use {short['stop_loss_percentage']*100:.0f}% stop-loss orders on all short positions")
-    print(f"• Take profits at {short['profit_target']*100:.0f}% gains")
-    print("• Consider ETF shorts: XRT (retail), XLY (consumer discretionary)")
+        append(f"  - {_PRETTY_SECTORS[sector]}")
+    append(f"• Use {pct['short']['stop_loss_percentage']} stop-loss orders on all short positions")
+    append(f"• Take profits at {pct['short']['profit_target']} gains")
+    append("• Consider ETF shorts: XRT (retail), XLY (consumer discretionary)")
     
-    print("\nDISTRESSED DEBT STRATEGY:")
+    append("\nDISTRESSED DEBT STRATEGY:")
     distressed = opportunities['distressed_strategy']
-    print(f"• Allocate {distressed['allocation_percentage']*100:.0f}% to distressed debt opportunities")
-    print(f"• Target minimum {distressed['minimum_yield']*100:.0f}% yield on distressed securities")
-    print(f"• Focus on {distressed['credit_rating_floor']} rated or better securities")
-    print(f"• Limit exposure to {distressed['diversification_limit']*100:.0f}% per individual issuer")
-    print("• Research companies with strong assets but temporary liquidity issues")
+    append(f"• Allocate {pct['distressed']['allocation_percentage']} to distressed debt opportunities")
+    append(f"• Target minimum {pct['distressed']['minimum_yield']} yield on distressed securities")
+    append(f"• Focus on {distressed['credit_rating_floor']} rated or better securities")
+    append(f"• Limit exposure to {pct['distressed']['diversification_limit']} per individual issuer")
+    append("• Research companies with strong assets but temporary liquidity issues")
     
-    print("\nENERGY SECTOR VALUE:")
+    append("\nENERGY SECTOR VALUE:")
     energy = opportunities['energy_strategy']
-    print(f"• Allocate {energy['sector_allocation']*100:.0f}% to undervalued energy companies")
-    print(f"• Target oil price assumption: ${energy['oil_price_target']}/barrel")
-    print(f"• Current {energy['current_discount']*100:.0f}% discount provides attractive entry point")
-    print(f"• Focus on companies with {energy['dividend_yield_minimum']*100:.0f}%+ dividend yields")
-    print("• Consider: XOM, CVX, COP with strong balance sheets")
+    append(f"• Allocate {pct['energy']['sector_allocation']} to undervalued energy companies")
+    append(f"• Target oil price assumption: ${energy['oil_price_target']}/barrel")
+    append(f"• Current {pct['energy']['current_discount']} discount provides attractive entry point")
+    append(f"• Focus on companies with {pct['energy']['dividend_yield_minimum']}+ dividend yields")
+    append("• Consider: XOM, CVX, COP with strong balance sheets")
+    
+    return "\n".join(out)
+
+def _render_hedging():
+    """Strategy 3 section: hedging strategies"""
+    pct = _percent_texts()
+    out = []
+    append = out.append
     
     # Strategy 3: Hedging
-    print("\n" + "="*80)
-    print("STRATEGY 3: HEDGING STRATEGIES")
-    print("="*80)
+    append("\n" + _EQ80)
+    append("STRATEGY 3: HEDGING STRATEGIES")
+    append(_EQ80)
     
-    hedging = analyzer.calculate_hedging_metrics()
+    hedging = get_hedging_metrics()
     
-    print("\nINTEREST RATE HEDGING:")
-    rates = hedging['rate_hedging']
-    print(f"• Hedge {rates['duration_hedge_ratio']*100:.0f}% of interest rate exposure")
-    print(f"• Use interest rate swaps on {rates['swap_notional_percentage']*100:.0f}% of portfolio")
-    print(f"• Protect against {rates['rate_increase_protection']*100:.0f}% rate increases")
-    print(f"• Budget {rates['hedge_cost_budget']*100:.1f}% annually for hedging costs")
-    print("• Consider TBT (inverse Treasury ETF) for rate rise protection")
+    append("\nINTEREST RATE HEDGING:")
+    append(f"• Hedge {pct['rates']['duration_hedge_ratio']} of interest rate exposure")
+    append(f"• Use interest rate swaps on {pct['rates']['swap_notional_percentage']} of portfolio")
+    append(f"• Protect against {pct['rates']['rate_increase_protection']} rate increases")
+    append(f"• Budget {pct['rates']['hedge_cost_budget']} annually for hedging costs")
+    append("• Consider TBT (inverse Treasury ETF) for rate rise protection")
     
-    print("\nCURRENCY HEDGING:")
+    append("\nCURRENCY HEDGING:")
     currency = hedging['currency_hedging']
-    print(f"• Hedge {currency['foreign_exposure_hedge']*100:.0f}% of foreign currency exposure")
-    print(f"• Assume {(1-currency['dollar_strength_assumption'])*100:.0f}% dollar weakness over 12 months")
-    print(f"• Rebalance currency hedges every {currency['hedge_rebalance_frequency']} days")
-    print("• Consider diversification into EUR, JPY, CHF, and emerging market currencies")
+    append(f"• Hedge {pct['currency']['foreign_exposure_hedge']} of foreign currency exposure")
+    append(f"• Assume {pct['currency']['dollar_weakness']} dollar weakness over 12 months")
+    append(f"• Rebalance currency hedges every {currency['hedge_rebalance_frequency']} days")
+    append("• Consider diversification into EUR, JPY, CHF, and emerging market currencies")
     
-    print("\nVOLATILITY STRATEGY:")
+    append("\nVOLATILITY STRATEGY:")
     vol = hedging['volatility_strategy']
-    print(f"• Target VIX range: {vol['vix_target_range'][0]}-{vol['vix_target_range'][1]}")
-    print(f"• Allocate {vol['volatility_allocation']*100:.0f}% to volatility strategies")
-    print(f"• Budget {vol['options_premium_budget']*100:.0f}% for options premiums")
-    print("• Use VIX calls, put spreads, and volatility ETFs (VXX, UVXY)")
+    append(f"• Target VIX range: {vol['vix_target_range'][0]}-{vol['vix_target_range'][1]}")
+    append(f"• Allocate {pct['vol']['volatility_allocation']} to volatility strategies")
+    append(f"• Budget {pct['vol']['options_premium_budget']} for options premiums")
+    append("• Use VIX calls, put spreads, and volatility ETFs (VXX, UVXY)")
+    
+    return "\n".join(out)
+
+def _render_sectors():
+    """Strategy 4 section: sector-specific investments"""
+    pct = _percent_texts()
+    out = []
+    append = out.append
     
     # Strategy 4: Sector Allocation
-    print("\n" + "="*80)
-    print("STRATEGY 4: SECTOR-SPECIFIC INVESTMENTS")
-    print("="*80)
+    append("\n" + _EQ80)
+    append("STRATEGY 4: SECTOR-SPECIFIC INVESTMENTS")
+    append(_EQ80)
     
-    sectors = analyzer.calculate_sector_metrics()
+    sectors = get_sector_metrics()
     
-    print("\nTECHNOLOGY/AI INFRASTRUCTURE:")
+    append("\nTECHNOLOGY/AI INFRASTRUCTURE:")
     tech = sectors['technology_strategy']
-    print(f"• Allocate {tech['ai_infrastructure_allocation']*100:.0f}% to AI/data center infrastructure")
-    print(f"• Target companies with {tech['growth_rate_assumption']*100:.0f}% annual growth potential")
-    print(f"• Focus on valuations under {tech['valuation_multiple_target']}x earnings")
-    print("• Consider: NVDA, AMD, data center REITs (DLR, EQIX)")
+    append(f"• Allocate {pct['tech']['ai_infrastructure_allocation']} to AI/data center infrastructure")
+    append(f"• Target companies with {pct['tech']['growth_rate_assumption']} annual growth potential")
+    append(f"• Focus on valuations under {tech['valuation_multiple_target']}x earnings")
+    append("• Consider: NVDA, AMD, data center REITs (DLR, EQIX)")
     
-    print("\nDEFENSE CONTRACTORS:")
+    append("\nDEFENSE CONTRACTORS:")
     defense = sectors['defense_strategy']
-    print(f"• Allocate {defense['defense_allocation']*100:.0f}% to defense/aerospace companies")
-    print(f"• Target companies with {defense['contract_backlog_years']}-year contract visibility")
-    print(f"• Focus on {defense['margin_stability_requirement']*100:.0f}%+ profit margins")
-    print("• Consider: LMT, RTX, NOC, GD with strong government contracts")
+    append(f"• Allocate {pct['defense']['defense_allocation']} to defense/aerospace companies")
+    append(f"• Target companies with {defense['contract_backlog_years']}-year contract visibility")
+    append(f"• Focus on {pct['defense']['margin_stability_requirement']}+ profit margins")
+    append("• Consider: LMT, RTX, NOC, GD with strong government contracts")
     
-    print("\nESSENTIAL SERVICES:")
+    append("\nESSENTIAL SERVICES:")
     essential = sectors['essential_services']
-    print(f"• Allocate {essential['utilities_allocation']*100:.0f}% to utilities")
-    print(f"• Allocate {essential['healthcare_allocation']*100:.0f}% to healthcare")
-    print(f"• Target {essential['dividend_yield_target']*100:.0f}%+ dividend yields")
-    print(f"• Focus on companies with beta under {essential['beta_ceiling']}")
-    print("• Consider: JNJ, PFE, NEE, SO for stability")
+    append(f"• Allocate {pct['essential']['utilities_allocation']} to utilities")
+    append(f"• Allocate {pct['essential']['healthcare_allocation']} to healthcare")
+    append(f"• Target {pct['essential']['dividend_yield_target']}+ dividend yields")
+    append(f"• Focus on companies with beta under {essential['beta_ceiling']}")
+    append("• Consider: JNJ, PFE, NEE, SO for stability")
+    
+    return "\n".join(out)
+
+def _render_risk():
+    """Risk management framework section"""
+    pct = _percent_texts()
+    out = []
+    append = out.append
     
     # Risk Management
-    print("\n" + "="*80)
-    print("RISK MANAGEMENT FRAMEWORK")
-    print("="*80)
-    
-    risk = analyzer.calculate_risk_metrics()
-    
-    print("\nRISK LIMITS AND CONTROLS:")
-    print(f"• Daily Value-at-Risk limit: {risk['maximum_portfolio_var']*100:.0f}%")
-    print(f"• Stress test loss limit: {risk['stress_test_loss_limit']*100:.0f}%")
-    print(f"• Maximum correlation between positions: {risk['correlation_threshold']*100:.0f}%")
-    print(f"• Liquidity requirement: {risk['liquidity_requirement']*100:.0f}% accessible within 24 hours")
-    print(f"• Maximum counterparty exposure: {risk['counterparty_exposure_limit']*100:.0f}%")
-    print(f"• Leverage ceiling: {risk['leverage_ceiling']}x")
-    print(f"• Portfolio rebalancing every {risk['rebalancing_frequency']} days")
-    
-    # Implementation Timeline
-    print("\n" + "="*80)
-    print("IMPLEMENTATION TIMELINE")
-    print("="*80)
-    
-    timeline = summary['timeline']
-    print("\nWEEK 1: IMMEDIATE DEFENSIVE ACTIONS")
-    print("• Sell illiquid positions and raise cash to 30%")
-    print("• Purchase 3-month Treasury bills")
-    print("• Buy gold ETF (GLD) for 10% allocation")
-    print("• Review and reduce counterparty exposures")
-    
-    print("\nMONTH 1: HEDGING IMPLEMENTATION")
-    print("• Execute interest rate swaps")
-    print("• Implement currency hedging for foreign exposure")
-    print("• Purchase VIX calls for volatility protection")
-    print("• Begin short positions in overvalued sectors")
-    
-    print("\nMONTH 3: OPPORTUNITY DEPLOYMENT")
-    print("• Research distressed debt opportunities")
-    print("• Selectively add energy sector positions")
-    print("• Increase AI/data center infrastructure exposure")
-    print("• Add defense contractor positions")
-    
-    print("\nMONTH 6: PORTFOLIO OPTIMIZATION")
-    print("• Rebalance based on crisis evolution")
-    print("• Adjust hedge ratios as volatility changes")
-    print("• Harvest tax losses where appropriate")
-    print("• Prepare for potential recovery phase")
-    
-    # Warning Indicators
-    print("\n" + "="*80)
-    print("CRITICAL WARNING INDICATORS TO MONITOR")
-    print("="*80)
-    
-    print("\nDAILY MONITORING:")
-    print("• SOFR vs Fed Funds Rate spread (stress indicator)")
-    print("• Repo market volumes and rates")
-    print("• VIX levels and term structure")
-    print("• Dollar strength index (DXY)")
-    print("• Treasury yield curve movements")
-    
-    print("\nWEEKLY MONITORING:")
-    print("• Bank credit default swap spreads")
-    print("• Corporate earnings revisions")
-    print("• Economic data releases")
-    print("• Federal Reserve communications")
-    
-    print("\nEMERGENCY TRIGGERS:")
-    print("• VIX above 40 (increase cash to 50%)")
-    print("• 10-year Treasury yield above 5% (reduce duration)")
-    print("• S&P 500 decline >20% (deploy opportunity capital)")
-    print("• Major bank failure (increase precious metals to 20%)")
-    
-    print("\n" + "="*80)
-    print("END OF REPORT")
-    print("="*80)
+    append("\n" + _EQ80)
+    append("RISK MANAGEMENT FRAMEWORK")
+    append(_EQ80)
+    
+    risk = get_risk_metrics()
+    
+    append("\nRISK LIMITS AND CONTROLS:")
+    append(f"• Daily Value-at-Risk limit: {pct['risk']['maximum_portfolio_var']}")
+    append(f"• Stress test loss limit: {pct['risk']['stress_test_loss_limit']}")
+    append(f"• Maximum correlation between positions: {pct['risk']['correlation_threshold']}")
+    append(f"• Liquidity requirement: {pct['risk']['liquidity_requirement']} accessible within 24 hours")
+    append(f"• Maximum counterparty exposure: {pct['risk']['counterparty_exposure_limit']}")
+    append(f"• Leverage ceiling: {risk['leverage_ceiling']}x")
+    append(f"• Portfolio rebalancing every {risk['rebalancing_frequency']} days")
+    
+    return "\n".join(out)
+
+# Static report sections, joined once at import
+_TIMELINE_TEXT = "\n".join([
+    "\n" + _EQ80,
+    "IMPLEMENTATION TIMELINE",
+    _EQ80,
+    "\nWEEK 1: IMMEDIATE DEFENSIVE ACTIONS",
+    "• Sell illiquid positions and raise cash to 30%",
+    "• Purchase 3-month Treasury bills",
+    "• Buy gold ETF (GLD) for 10% allocation",
+    "• Review and reduce counterparty exposures",
+    "\nMONTH 1: HEDGING IMPLEMENTATION",
+    "• Execute interest rate swaps",
+    "• Implement currency hedging for foreign exposure",
+    "• Purchase VIX calls for volatility protection",
+    "• Begin short positions in overvalued sectors",
+    "\nMONTH 3: OPPORTUNITY DEPLOYMENT",
+    "• Research distressed debt opportunities",
+    "• Selectively add energy sector positions",
+    "• Increase AI/data center infrastructure exposure",
+    "• Add defense contractor positions",
+    "\nMONTH 6: PORTFOLIO OPTIMIZATION",
+    "• Rebalance based on crisis evolution",
+    "• Adjust hedge ratios as volatility changes",
+    "• Harvest tax losses where appropriate",
+    "• Prepare for potential recovery phase",
+])
+
+_WARNINGS_TEXT = "\n".join([
+    "\n" + _EQ80,
+    "CRITICAL WARNING INDICATORS TO MONITOR",
+    _EQ80,
+    "\nDAILY MONITORING:",
+    "• SOFR vs Fed Funds Rate spread (stress indicator)",
+    "• Repo market volumes and rates",
+    "• VIX levels and term structure",
+    "• Dollar strength index (DXY)",
+    "• Treasury yield curve movements",
+    "\nWEEKLY MONITORING:",
+    "• Bank credit default swap spreads",
+    "• Corporate earnings revisions",
+    "• Economic data releases",
+    "• Federal Reserve communications",
+    "\nEMERGENCY TRIGGERS:",
+    "• VIX above 40 (increase cash to 50%)",
+    "• 10-year Treasury yield above 5% (reduce duration)",
+    "• S&P 500 decline >20% (deploy opportunity capital)",
+    "• Major bank failure (increase precious metals to 20%)",
+    _END_OF_REPORT,
+])
+
+def _render_timeline():
+    """Implementation timeline section"""
+    return _TIMELINE_TEXT
+
+def _render_warnings():
+    """Warning indicators section and report footer"""
+    return _WARNINGS_TEXT
+
+# Independent report sections, in report order
+_SECTION_RENDERERS = (
+    _render_defensive,
+    _render_opportunities,
+    _render_hedging,
+    _render_sectors,
+    _render_risk,
+    _render_timeline,
+    _render_warnings,
+)
+
+def _call(renderer):
+    """Pool helper: run one section renderer"""
+    return renderer()
+
+def _render_sections(parallel=False):
+    """Build the report body: every section after the header and summary
+    
+    Args:
+        parallel: Render the independent sections in a process pool
+    """
+    if parallel and len(_SECTION_RENDERERS) >= 4:
+        import multiprocessing
+        with multiprocessing.get_context("spawn").Pool(min(len(_SECTION_RENDERERS), os.cpu_count() or 1)) as pool:
+            sections = pool.map(_call, _SECTION_RENDERERS)
+    else:
+        sections = [renderer() for renderer in _SECTION_RENDERERS]
+    return "\n".join(sections)
+
+def _render_report(parallel=False, body=None):
+    """Build the full action plan report text
+    
+    Args:
+        parallel: Render the independent sections in a process pool
+        body: Previously rendered sections to reuse; the header is always rendered fresh
+    """
+    if body is None:
+        body = _render_sections(parallel)
+    # Sections are joined once so the whole report is written in a single call
+    return "\n".join([_render_summary(), body]) + "\n"
+
+def _report_cache_path():
+    """Cache file for the report body, keyed on this module's mtime and the report version
+    
+    Freshness is checked against _CACHE_TTL_SECONDS when the file is read.
+    """
+    key = hashlib.sha1(f"{os.path.getmtime(__file__)}|{_VERSION}".encode()).hexdigest()
+    return os.path.join(_CACHE_DIR, f"report_{key}.txt")
+
+def generate_detailed_action_plan(file=None, use_cache=True, parallel=False):
+    """Generate detailed, plain-English action plan
+    
+    Args:
+        file: Stream to write the report to (defaults to sys.stdout)
+        use_cache: Reuse report sections rendered in the last 24 hours and store freshly rendered ones
+        parallel: Render the report sections in a process pool (see _render_sections)
+    """
+    cache_path = _report_cache_path()
+    body = None
+    
+    if use_cache:
+        try:
+            if time.time() - os.path.getmtime(cache_path) < _CACHE_TTL_SECONDS:
+                with open(cache_path, encoding='utf-8') as f:
+                    body = f.read()
+        except OSError:
+            body = None
+    
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        if body is None:
+            body = _render_sections(parallel)
+            # Atomic write so a concurrent reader never sees a partial report
+            if use_cache:
+                try:
+                    os.makedirs(_CACHE_DIR, exist_ok=True)
+                    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+                    with open(tmp_path, 'w', encoding='utf-8') as f:
+                        f.write(body)
+                    os.replace(tmp_path, cache_path)
+                    _remove_stale_cache_files("report_", cache_path)
+                except OSError:
+                    pass
+        report = _render_report(body=body)
+    
+    (file or sys.stdout).write(report)
 
 if __name__ == "__main__":
     generate_detailed_action_plan()
\ No newline at end of file
@@ -17,14 +17,177 @@ import pandas as pd
 import numpy as np
 import yfinance as yf
 import requests
+from requests.adapters import HTTPAdapter
 import json
-from datetime import datetime, timedelta
-from flask import Flask, render_template, jsonify
+import heapq
+from operator import itemgetter
+from io import BytesIO
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from flask import Flask, Response, render_template, jsonify
 import plotly.graph_objs as go
 import plotly.utils
 from typing import Dict, List, Tuple, Optional
 import warnings
-warnings.filterwarnings('ignore')
+
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+try:
+    from waitress import serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
+try:
+    import pyarrow
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# pandas CSV engine for the FRED downloads
+CSV_ENGINE = 'pyarrow' if PYARROW_AVAILABLE else 'c'
+
+# Dollar-index symbols tried (in order) for the USD-correlation component
+USD_INDEX_SYMBOLS = ('DX-Y.NYB', 'UUP')
+
+# Minimum overlapping daily returns needed to trust an asset's USD correlation
+MIN_CORRELATION_OBSERVATIONS = 30
+
+# Seconds a computed analysis is reused by the API routes
+ANALYSIS_CACHE_SECONDS = 300
+
+# HTTP responses (FRED CSVs) are cached for 6 hours when requests-cache is installed
+HTTP_CACHE_SECONDS = 6 * 60 * 60
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _score_kernel(close):
+    """Raw debasement score inputs for one float64 close-price array (at least 30 prices).
+    
+    One pass over the prices for the daily-return statistics, plus running sums
+    over the last 20/50 closes for the trend check.
+    
+    Returns:
+        (annual_return, volatility, recent_perf, trend_up)
+    """
+    n = close.shape[0]
+    
+    # Daily returns: mean and sample standard deviation, skipping NaN returns
+    count = 0
+    total = 0.0
+    for i in range(1, n):
+        r = close[i] / close[i - 1] - 1.0
+        if not np.isnan(r):
+            count += 1
+            total += r
+    mean = total / count if count > 0 else np.nan
+    sq = 0.0
+    for i in range(1, n):
+        r = close[i] / close[i - 1] - 1.0
+        if not np.isnan(r):
+            sq += (r - mean) * (r - mean)
+    volatility = np.sqrt(sq / (count - 1)) * np.sqrt(252.0) if count > 1 else np.nan
+    
+    # (last / first) ** (252 / n) - 1, via log/expm1 (accurate for returns near zero)
+    annual_return = np.expm1(np.log(close[n - 1] / close[0]) * (252.0 / n))
+    recent_perf = close[n - 1] / close[n - 30] - 1.0
+    
+    # Price above a rising SMA20 > SMA50 stack (SMA50 undefined below 50 prices)
+    sum_20 = 0.0
+    for i in range(max(n - 20, 0), n):
+        sum_20 += close[i]
+    sma_20 = sum_20 / min(n, 20)
+    trend_up = False
+    if n >= 50:
+        sum_50 = 0.0
+        for i in range(n - 50, n):
+            sum_50 += close[i]
+        trend_up = close[n - 1] > sma_20 and sma_20 > sum_50 / 50.0
+    
+    return annual_return, volatility, recent_perf, trend_up
+
+if NUMBA_AVAILABLE:
+    _score_kernel = njit(cache=True)(_score_kernel)
+
+class _IncompleteData(Exception):
+    """Raised by _cached_history so lru_cache does not memoize a failed download
+    
+    yfinance returns empty (or all-NaN) frames instead of raising when Yahoo is
+    unreachable; the frame is carried on the exception for callers to use as-is.
+    """
+    def __init__(self, data: pd.DataFrame):
+        super().__init__("incomplete price data")
+        self.data = data
+
+# Yahoo price histories are memoized per calendar day; the day is part of the key
+# so the caches roll over on their own. Empty or incomplete results are not cached.
+# Only closing prices are used downstream, so the other OHLCV columns are dropped
+# before anything is cached
+@lru_cache(maxsize=256)
+def _cached_history(symbol: str, period: str, day: str) -> pd.DataFrame:
+    """Ticker closing-price history for symbol, cached for the given day"""
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', FutureWarning)
+        data = yf.Ticker(symbol).history(period=period)
+    data = data[['Close']] if 'Close' in data.columns else data
+    if data.empty or data.isna().all().all():
+        raise _IncompleteData(data)
+    return data
+
+# Batched downloads are memoized per symbol, so one ticker Yahoo keeps failing on
+# does not stop the rest of the batch from being cached
+# {(symbol, period, day): closing-price DataFrame}
+_download_cache: Dict[Tuple[str, str, str], pd.DataFrame] = {}
+_download_lock = threading.Lock()
+
+def _cached_download(symbols: Tuple[str, ...], period: str, day: str) -> Dict[str, Optional[pd.DataFrame]]:
+    """Batched yfinance closing prices for symbols, cached per symbol for the given day
+    
+    Only symbols not already cached are downloaded; symbols that come back without
+    data are left uncached (and returned as None) so the next call retries just those.
+    """
+    with _download_lock:
+        # Drop entries from earlier days
+        for key in [key for key in _download_cache if key[2] != day]:
+            del _download_cache[key]
+        missing = [symbol for symbol in symbols if (symbol, period, day) not in _download_cache]
+    
+    if missing:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', FutureWarning)
+            bulk = yf.download(missing, period=period, group_by='ticker', threads=True,
+                               progress=False, auto_adjust=True)
+        if isinstance(bulk.columns, pd.MultiIndex):
+            bulk = bulk.loc[:, bulk.columns.get_level_values(1) == 'Close']
+            fetched = set(bulk.columns.get_level_values(0))
+        else:
+            fetched = set()
+        with _download_lock:
+            for symbol in missing:
+                closes = bulk[symbol].dropna(how='all') if symbol in fetched else None
+                if closes is not None and len(closes):
+                    _download_cache[(symbol, period, day)] = closes
+    
+    with _download_lock:
+        return {symbol: _download_cache.get((symbol, period, day)) for symbol in symbols}
+
+def _clear_price_caches():
+    """Forget all memoized Yahoo price data"""
+    _cached_history.cache_clear()
+    with _download_lock:
+        _download_cache.clear()
 
 class DebasementDashboard:
     def __init__(self):
@@ -32,6 +195,27 @@ class DebasementDashboard:
         self.data = {}
         self.analysis_date = datetime.now()
         
+        # Worker threads shared by every request handled by this process
+        self.executor = ThreadPoolExecutor(max_workers=8)
+        
+        # Last analysis served by the API routes (see _get_analysis)
+        self._cached_analysis = None
+        self._cached_at = 0
+        self._analysis_lock = threading.Lock()
+        # Encoded /api/analysis response body and the analysis it was built from
+        self._cached_json = None
+        self._cached_json_analysis = None
+        
+        if REQUESTS_CACHE_AVAILABLE:
+            self.session = requests_cache.CachedSession('fred_cache', backend='sqlite',
+                                                        expire_after=HTTP_CACHE_SECONDS)
+        else:
+            self.session = requests.Session()
+        # Keep HTTPS connections pooled so repeated FRED requests skip the TLS handshake.
+        # yfinance is not given this session: it already shares one curl_cffi session
+        # across all Tickers and rejects caching sessions.
+        self.session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32))
+        
         # Asset categories for debasement protection analysis
         self.asset_categories = {
             'precious_metals': {
@@ -86,6 +270,14 @@ class DebasementDashboard:
             'HYG': 'High Yield Corporate Bonds'
         }
         
+        # Score components and their composite weights, in matching order
+        self._component_keys = ('real_returns', 'risk_adjusted', 'usd_correlation',
+                                'trend_strength', 'recent_performance')
+        self._weights = np.array([0.35, 0.25, 0.15, 0.15, 0.10], dtype=np.float64)
+        
+        # Every tracked asset symbol, flattened once for the batched download
+        self._all_symbols = [symbol for assets in self.asset_categories.values() for symbol in assets]
+        
         self.setup_routes()
     
     def fetch_fred_data(self, series_id: str, years_back: int = 5) -> Optional[pd.Series]:
@@ -96,32 +288,28 @@ class DebasementDashboard:
             
             # Using a simple CSV approach since FRED API requires key
             url = f"https://fred.stlouisfed.org/graph/fredgraph.csv?id={series_id}"
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
-                from io import StringIO
-                df = pd.read_csv(StringIO(response.text))
+                # Parse the raw bytes directly (no decoded-text copy); FRED CSVs are
+                # always <date>,<series> so the first column is parsed as dates
+                df = pd.read_csv(BytesIO(response.content), engine=CSV_ENGINE, parse_dates=[0])
+                date_col = df.columns[0]
                 
-                # Handle different potential column names
-                date_col = None
-                for col in df.columns:
-                    if 'date' in col.lower():
-                        date_col = col
-                        break
-                
-                if date_col is None:
+                if 'date' not in date_col.lower():
                     print(f"No date column found for {series_id}")
                     return None
                 
-                df[date_col] = pd.to_datetime(df[date_col], errors='coerce')
-                df = df.dropna(subset=[date_col])
-                df = df.set_index(date_col)
-                df = df[df.index >= start_date]
-                
                 # Get the data column (should be the remaining column)
                 data_cols = [col for col in df.columns if col != date_col]
                 if data_cols:
-                    return df[data_cols[0]].dropna()
+                    # FRED rows are in ascending date order, so the start of the window
+                    # is found by binary search and sliced off in one step
+                    dates = df[date_col].to_numpy()
+                    start = np.searchsorted(dates, np.datetime64(start_date))
+                    return pd.Series(df[data_cols[0]].to_numpy()[start:],
+                                     index=pd.DatetimeIndex(dates[start:], name=date_col),
+                                     name=data_cols[0]).dropna()
                 else:
                     print(f"No data column found for {series_id}")
                     return None
@@ -135,61 +323,116 @@ class DebasementDashboard:
     def fetch_asset_data(self, symbol: str, period: str = "2y") -> Optional[pd.DataFrame]:
         """Fetch asset price data"""
         try:
-            ticker = yf.Ticker(symbol)
-            data = ticker.history(period=period)
-            return data
+            return _cached_history(symbol, period, date.today().isoformat())
+        except _IncompleteData as e:
+            return e.data
         except Exception as e:
             print(f"Error fetching data for {symbol}: {e}")
             return None
     
-    def calculate_debasement_score(self, symbol: str, asset_data: pd.DataFrame) -> Dict:
-        """Calculate comprehensive debasement protection score"""
+    def fetch_bulk_asset_data(self, symbols: List[str], period: str = "2y") -> Dict[str, Optional[pd.DataFrame]]:
+        """Fetch price data for many symbols in one batched yfinance download
+        
+        Args:
+            symbols: Ticker symbols to fetch
+            period: yfinance history period
+        
+        Returns:
+            {symbol: closing-price DataFrame}, with None for symbols that returned no data
+        """
+        try:
+            return _cached_download(tuple(symbols), period, date.today().isoformat())
+        except Exception as e:
+            print(f"Error in bulk download: {e}")
+            return {symbol: None for symbol in symbols}
+    
+    def calculate_usd_correlations(self, asset_data: Dict[str, Optional[pd.DataFrame]],
+                                   usd_data: Optional[pd.DataFrame]) -> Dict[str, float]:
+        """Correlation of each asset's daily log returns with the dollar index
+        
+        All assets are handled in one pass: the closes are aligned on the dollar-index
+        dates into a (T, N) matrix, and the cross products with the dollar returns are a
+        single matrix-vector multiply. Each correlation uses the dates on which that
+        asset has data (pairwise-complete Pearson).
+        
+        Args:
+            asset_data: {symbol: price DataFrame or None}
+            usd_data: Dollar-index price DataFrame (None if unavailable)
+        
+        Returns:
+            {symbol: correlation} for assets with enough overlapping history
+        """
+        symbols = [symbol for symbol, data in asset_data.items() if data is not None and len(data)]
+        if usd_data is None or len(usd_data) <= MIN_CORRELATION_OBSERVATIONS or not symbols:
+            return {}
+        
+        usd_close = usd_data['Close']
+        closes = pd.concat({symbol: asset_data[symbol]['Close'] for symbol in symbols}, axis=1)
+        closes = closes.reindex(usd_close.index).to_numpy(dtype=np.float64)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            asset_returns = np.diff(np.log(closes), axis=0)                          # (T, N)
+            usd_returns = np.diff(np.log(usd_close.to_numpy(dtype=np.float64)))      # (T,)
+        
+        usd_valid = np.isfinite(usd_returns)
+        usd_returns = np.where(usd_valid, usd_returns, 0.0)
+        valid = np.isfinite(asset_returns) & usd_valid[:, None]
+        x = np.where(valid, asset_returns, 0.0)
+        valid = valid.astype(np.float64)
+        
+        # Pairwise sums; products with the dollar returns go through BLAS
+        n = valid.sum(axis=0)
+        sum_x = x.sum(axis=0)
+        sum_xx = (x * x).sum(axis=0)
+        sum_y = usd_returns @ valid
+        sum_yy = (usd_returns * usd_returns) @ valid
+        sum_xy = usd_returns @ x
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = (n * sum_xy - sum_x * sum_y) / np.sqrt((n * sum_xx - sum_x ** 2) * (n * sum_yy - sum_y ** 2))
+        
+        return {symbol: float(c) for symbol, c, count in zip(symbols, corr, n)
+                if count >= MIN_CORRELATION_OBSERVATIONS and np.isfinite(c)}
+    
+    def calculate_debasement_score(self, symbol: str, asset_data: pd.DataFrame,
+                                   usd_correlation: Optional[float] = None) -> Dict:
+        """Calculate comprehensive debasement protection score
+        
+        Args:
+            symbol: Asset symbol
+            asset_data: Price history for the asset
+            usd_correlation: Correlation of the asset's returns with the dollar index, if known
+        """
         try:
             if asset_data is None or len(asset_data) < 30:
                 return {'score': 0, 'components': {}, 'error': 'Insufficient data'}
             
-            # Calculate returns
-            returns = asset_data['Close'].pct_change().dropna()
+            close = asset_data['Close'].to_numpy(dtype=np.float64)
+            annual_return, volatility, recent_perf, trend_up = _score_kernel(close)
             
             # 1. Real returns vs money supply growth (proxy: 5-7% annual inflation expectation)
-            annual_return = (asset_data['Close'].iloc[-1] / asset_data['Close'].iloc[0]) ** (252/len(asset_data)) - 1
             real_return = annual_return - 0.06  # Assuming 6% debasement rate
             real_return_score = min(max((real_return + 0.1) * 50, 0), 100)
             
             # 2. Volatility-adjusted returns (Sharpe-like ratio)
-            volatility = returns.std() * np.sqrt(252)
             sharpe_score = min(max((annual_return / max(volatility, 0.01)) * 20 + 50, 0), 100)
             
             # 3. Correlation to USD strength (negative correlation is good)
-            correlation_score = 50  # Default if no DXY data
+            if usd_correlation is None:
+                correlation_score = 50  # Default if no DXY data
+            else:
+                correlation_score = min(max((1 - usd_correlation) * 50, 0), 100)
             
             # 4. Momentum and trend strength
-            sma_20 = asset_data['Close'].rolling(20).mean()
-            sma_50 = asset_data['Close'].rolling(50).mean()
-            trend_score = 100 if asset_data['Close'].iloc[-1] > sma_20.iloc[-1] > sma_50.iloc[-1] else 30
+            trend_score = 100 if trend_up else 30
             
             # 5. Recent performance vs long-term trend
-            recent_perf = (asset_data['Close'].iloc[-1] / asset_data['Close'].iloc[-30]) - 1
             recent_score = min(max((recent_perf + 0.05) * 200 + 50, 0), 100)
             
             # Weighted composite score
-            components = {
-                'real_returns': real_return_score,
-                'risk_adjusted': sharpe_score,
-                'usd_correlation': correlation_score,
-                'trend_strength': trend_score,
-                'recent_performance': recent_score
-            }
-            
-            weights = {
-                'real_returns': 0.35,
-                'risk_adjusted': 0.25,
-                'usd_correlation': 0.15,
-                'trend_strength': 0.15,
-                'recent_performance': 0.10
-            }
-            
-            composite_score = sum(components[key] * weights[key] for key in components)
+            scores = (real_return_score, sharpe_score, correlation_score, trend_score, recent_score)
+            components = dict(zip(self._component_keys, scores))
+            composite_score = float(np.array(scores, dtype=np.float64) @ self._weights)
             
             return {
                 'score': round(composite_score, 1),
@@ -198,7 +441,7 @@ class DebasementDashboard:
                     'annual_return': round(annual_return * 100, 2),
                     'real_return': round(real_return * 100, 2),
                     'volatility': round(volatility * 100, 2),
-                    'current_price': round(asset_data['Close'].iloc[-1], 2),
+                    'current_price': round(close[-1], 2),
                     'monthly_change': round(recent_perf * 100, 2)
                 }
             }
@@ -294,30 +537,61 @@ class DebasementDashboard:
                 'debasement_pressure': 'Medium'
             }
     
+    @staticmethod
+    def _usd_data(asset_data: Dict[str, Optional[pd.DataFrame]]) -> Optional[pd.DataFrame]:
+        """First dollar-index series in USD_INDEX_SYMBOLS order that returned data"""
+        return next((asset_data[symbol] for symbol in USD_INDEX_SYMBOLS
+                     if asset_data.get(symbol) is not None and len(asset_data[symbol])), None)
+    
+    def _analyze_category(self, category: str, assets: Dict[str, str],
+                          asset_data: Optional[Dict[str, Optional[pd.DataFrame]]] = None,
+                          usd_correlations: Optional[Dict[str, float]] = None) -> Dict:
+        """Score the assets of one category
+        
+        Args:
+            category: Category name (for progress output)
+            assets: {symbol: name} for the category
+            asset_data: Prices already fetched for these symbols; when omitted only this
+                category's symbols (plus the dollar index) are downloaded
+            usd_correlations: {symbol: USD correlation} matching asset_data
+        """
+        if asset_data is None:
+            asset_data = self.fetch_bulk_asset_data(list(assets) + list(USD_INDEX_SYMBOLS))
+            usd_correlations = self.calculate_usd_correlations(
+                {symbol: asset_data[symbol] for symbol in assets}, self._usd_data(asset_data))
+        usd_correlations = usd_correlations or {}
+        
+        print(f"Processing {category}...")
+        return {
+            symbol: {
+                'name': name,
+                'symbol': symbol,
+                **self.calculate_debasement_score(symbol, asset_data[symbol],
+                                                  usd_correlations.get(symbol))
+            }
+            for symbol, name in assets.items()
+        }
+    
     def analyze_all_assets(self) -> Dict:
         """Analyze all asset categories for debasement protection"""
         results = {}
         
+        # All assets come from one batched download; the macro analysis (FRED and
+        # dollar-index requests) runs alongside it in a worker thread
         print("Analyzing macro environment...")
-        macro_env = self.analyze_macro_environment()
+        macro_future = self.executor.submit(self.analyze_macro_environment)
         
         print("Analyzing asset categories...")
+        print(f"  Fetching data for {len(self._all_symbols)} assets")
+        asset_data = self.fetch_bulk_asset_data(self._all_symbols + list(USD_INDEX_SYMBOLS))
+        
+        macro_env = macro_future.result()
+        
+        usd_correlations = self.calculate_usd_correlations(
+            {symbol: asset_data[symbol] for symbol in self._all_symbols}, self._usd_data(asset_data))
+        
         for category, assets in self.asset_categories.items():
-            print(f"Processing {category}...")
-            category_results = {}
-            
-            for symbol, name in assets.items():
-                print(f"  Fetching data for {symbol} ({name})")
-                asset_data = self.fetch_asset_data(symbol)
-                score_data = self.calculate_debasement_score(symbol, asset_data)
-                
-                category_results[symbol] = {
-                    'name': name,
-                    'symbol': symbol,
-                    **score_data
-                }
-            
-            results[category] = category_results
+            results[category] = self._analyze_category(category, assets, asset_data, usd_correlations)
         
         # Calculate category averages
         category_scores = {}
@@ -336,24 +610,51 @@ class DebasementDashboard:
             'analysis_timestamp': self.analysis_date.isoformat()
         }
     
+    def _get_analysis(self, max_age: float = ANALYSIS_CACHE_SECONDS) -> Dict:
+        """Return the cached analysis, recomputing it once it is older than max_age seconds
+        
+        The lock makes concurrent requests wait for a single recomputation.
+        """
+        with self._analysis_lock:
+            if not self._analysis_is_fresh(max_age):
+                self._cached_analysis = self.analyze_all_assets()
+                self._cached_at = time.time()
+            return self._cached_analysis
+    
+    def _get_analysis_json(self) -> bytes:
+        """/api/analysis response body, encoded once per cached analysis"""
+        analysis = self._get_analysis()
+        with self._analysis_lock:
+            if self._cached_json is None or self._cached_json_analysis is not analysis:
+                self._cached_json = jsonify({
+                    'success': True,
+                    'analysis': analysis,
+                    'recommendations': self.get_top_recommendations(analysis)
+                }).get_data()
+                self._cached_json_analysis = analysis
+            return self._cached_json
+    
+    def _analysis_is_fresh(self, max_age: float = ANALYSIS_CACHE_SECONDS) -> bool:
+        """True if a cached analysis exists and is younger than max_age seconds"""
+        return self._cached_analysis is not None and time.time() - self._cached_at < max_age
+    
     def get_top_recommendations(self, analysis_data: Dict, top_n: int = 10) -> List[Dict]:
         """Get top debasement protection recommendations"""
-        all_assets = []
-        
-        for category, assets in analysis_data['categories'].items():
-            for symbol, data in assets.items():
-                if data['score'] > 0:
-                    all_assets.append({
-                        'symbol': symbol,
-                        'name': data['name'],
-                        'category': category.replace('_', ' ').title(),
-                        'score': data['score'],
-                        'metrics': data.get('metrics', {})
-                    })
-        
-        # Sort by debasement protection score
-        all_assets.sort(key=lambda x: x['score'], reverse=True)
-        return all_assets[:top_n]
+        def scored_assets():
+            for category, assets in analysis_data['categories'].items():
+                category_name = category.replace('_', ' ').title()
+                for symbol, data in assets.items():
+                    if data['score'] > 0:
+                        yield {
+                            'symbol': symbol,
+                            'name': data['name'],
+                            'category': category_name,
+                            'score': data['score'],
+                            'metrics': data.get('metrics', {})
+                        }
+        
+        # Top-N by debasement protection score (same order as a stable descending sort)
+        return heapq.nlargest(top_n, scored_assets(), key=itemgetter('score'))
     
     def setup_routes(self):
         """Setup Flask routes"""
@@ -365,14 +666,7 @@ class DebasementDashboard:
         @self.app.route('/api/analysis')
         def get_analysis():
             try:
-                analysis = self.analyze_all_assets()
-                recommendations = self.get_top_recommendations(analysis)
-                
-                return jsonify({
-                    'success': True,
-                    'analysis': analysis,
-                    'recommendations': recommendations
-                })
+                return Response(self._get_analysis_json(), mimetype='application/json')
             except Exception as e:
                 return jsonify({
                     'success': False,
@@ -382,8 +676,18 @@ class DebasementDashboard:
         @self.app.route('/api/category/<category>')
         def get_category_detail(category):
             try:
-                analysis = self.analyze_all_assets()
-                category_data = analysis['categories'].get(category, {})
+                # Reuse a fresh full analysis; otherwise score just this category
+                # (no macro analysis, only its own symbols fetched). The cache is read
+                # without the lock, which _get_analysis holds for a whole recompute.
+                analysis = self._cached_analysis
+                if analysis is not None and time.time() - self._cached_at >= ANALYSIS_CACHE_SECONDS:
+                    analysis = None
+                if analysis is not None:
+                    category_data = analysis['categories'].get(category, {})
+                elif category in self.asset_categories:
+                    category_data = self._analyze_category(category, self.asset_categories[category])
+                else:
+                    category_data = {}
                 
                 return jsonify({
                     'success': True,
@@ -395,16 +699,33 @@ class DebasementDashboard:
                     'success': False,
                     'error': str(e)
                 })
+        
+        @self.app.route('/api/refresh', methods=['POST'])
+        def refresh_analysis():
+            # Drop the cached analysis and price data; the next API request refetches and recomputes it
+            _clear_price_caches()
+            with self._analysis_lock:
+                self._cached_analysis = None
+                self._cached_at = 0
+                self._cached_json = None
+                self._cached_json_analysis = None
+            return jsonify({'success': True})
     
-    def run(self, host='localhost', port=5002, debug=True):
-        """Run the dashboard"""
+    def run(self, host='localhost', port=5002, debug=False):
+        """Run the dashboard
+        
+        Args:
+            host: Interface to bind
+            port: Port to listen on
+            debug: Use Flask's debug server (debugger, no reloader) instead of waitress
+        """
         print(f"Starting Debasement Protection Dashboard...")
         print(f"Dashboard will be available at: http://{host}:{port}")
         print("\nAnalyzing assets for USD debasement protection...")
         
         # Run initial analysis
         try:
-            analysis = self.analyze_all_assets()
+            analysis = self._get_analysis()
             recommendations = self.get_top_recommendations(analysis)
             
             print(f"\n{'='*60}")
@@ -436,7 +757,13 @@ class DebasementDashboard:
         except Exception as e:
             print(f"Error in initial analysis: {e}")
         
-        self.app.run(host=host, port=port, debug=debug)
+        # The reloader is kept off so the startup analysis is not repeated in a child
+        # process; outside debug mode waitress serves requests when it is installed
+        if WAITRESS_AVAILABLE and not debug:
+            serve(self.app, host=host, port=port, threads=16)
+        else:
+            # Threaded server: a slow analysis request does not block other clients
+            self.app.run(host=host, port=port, debug=debug, use_reloader=False, threaded=True)
 
 if __name__ == '__main__':
     dashboard = DebasementDashboard()
@@ -9,12 +9,8 @@ def run_detailed_analysis():
     # Get a few stocks for detailed analysis
     test_symbols = ['AAPL', 'MSFT', 'GOOGL', 'ADBE', 'PG', 'JNJ', 'JPM', 'V', 'UNH', 'HD']
     
-    stocks = []
-    for symbol in test_symbols:
-        print(f"Fetching {symbol}...")
-        stock_data = fetch_stock_data(symbol)
-        if stock_data:
-            stocks.append(stock_data)
+    # Network-bound fetches run concurrently, one thread per symbol
+    stocks = fetch_stocks_concurrently(test_symbols, max_workers=len(test_symbols))
     
     print(f"\nLoaded {len(stocks)} stocks for analysis")
     
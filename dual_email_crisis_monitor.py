@@ -6,15 +6,25 @@ Sends two types of emails:
 2. Alert-only emails when immediate action is needed
 """
 
-import yfinance as yf
-from datetime import datetime, timedelta
+from datetime import datetime
+import json
+import os
+import sys
 import numpy as np
-import pandas as pd
 import argparse
-from scipy.stats import pearsonr
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from string import Template
 import warnings
 warnings.filterwarnings("ignore")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import both enhanced system and email capabilities
 from enhanced_threat_assessment_v2 import EnhancedThreatAssessmentV2
 
@@ -26,6 +36,420 @@ except ImportError:
     EMAIL_AVAILABLE = False
     print("📧 Email alerts not available - email_alerter.py not found")
 
+# Plain-English explanation templates per metric, formatted on demand for the
+# metric's current level only (placeholders take the metric value)
+_METRIC_TEMPLATES = {
+    'yield_spread_10y3m': {
+        'name': 'NY Fed Recession Indicator (10-Year vs 3-Month Treasury)',
+        'fmt': '{value:+.2f}%',
+        'levels': {
+            'CONCERNING': 'The yield curve is nearly inverted ({value:+.2f}%). This means investors expect the Fed to cut rates soon, which usually happens during recessions. Historically, when 10-year rates fall below 3-month rates, a recession follows within 6-18 months.',
+            'DANGEROUS': 'The yield curve is inverted ({value:+.2f}%). This is the most reliable recession predictor - it has preceded every recession since 1969. Markets are pricing in economic trouble ahead.',
+            'SEVERE': 'The yield curve is deeply inverted ({value:+.2f}%). This level of inversion suggests markets expect a severe economic downturn and aggressive Fed rate cuts.',
+            'EXTREME': 'The yield curve is extremely inverted ({value:+.2f}%). This level historically occurs only during major financial crises or severe recessions.'
+        }
+    },
+    'credit_spread_hy': {
+        'name': 'High-Yield (Junk Bond) Credit Spreads',
+        'fmt': '{value:.1f}%',
+        'levels': {
+            'CONCERNING': 'High-yield bond spreads are widening to {value:.1f}%. This means investors are demanding higher returns to lend to risky companies, signaling growing concern about defaults and economic weakness.',
+            'DANGEROUS': 'High-yield spreads have reached {value:.1f}%. Banks and investors are becoming very worried about companies going bankrupt. This often precedes broader economic problems as lending tightens.',
+            'SEVERE': 'High-yield spreads are at crisis levels ({value:.1f}%). Credit markets are severely stressed, meaning many companies will struggle to get loans. This can trigger a recession through reduced business investment.',
+            'EXTREME': 'High-yield spreads are at extreme crisis levels ({value:.1f}%). The credit system is essentially seizing up, similar to 2008. This threatens the entire economy as businesses cannot finance operations.'
+        }
+    },
+    'vix': {
+        'name': 'VIX Fear Index (Market Volatility)',
+        'fmt': '{value:.1f}',
+        'levels': {
+            'CONCERNING': 'The VIX is elevated at {value:.1f}. Markets are showing increased nervousness and uncertainty. Expect larger daily price swings and more emotional trading decisions.',
+            'DANGEROUS': 'The VIX has reached {value:.1f}, indicating high fear in markets. Investors are panic-buying protection against crashes. This level often coincides with significant market declines.',
+            'SEVERE': 'The VIX is at crisis levels ({value:.1f}). Extreme fear is driving markets. This level historically occurs during major crashes like 2008 or 2020, with potential for 20%+ market declines.',
+            'EXTREME': 'The VIX is at extreme panic levels ({value:.1f}). This represents historic fear not seen outside of major financial crises. Markets may be in free-fall with potential for catastrophic losses.'
+        }
+    },
+    'credit_spread_ig': {
+        'name': 'Investment Grade Corporate Credit Spreads',
+        'fmt': '{value:.1f}%',
+        'levels': {
+            'CONCERNING': 'Investment grade credit spreads are widening to {value:.1f}%. Even safe companies are seeing borrowing costs rise as investors become more cautious about corporate debt.',
+            'DANGEROUS': 'Investment grade spreads have reached {value:.1f}%. Investors are worried even about high-quality companies. This suggests broad economic concerns and tighter credit conditions ahead.',
+            'SEVERE': 'Investment grade spreads are at stress levels ({value:.1f}%). Credit markets are showing severe strain even for the safest corporate borrowers, indicating systemic financial stress.',
+            'EXTREME': 'Investment grade spreads are at crisis levels ({value:.1f}%). Even the best companies face borrowing difficulties, suggesting a complete breakdown in credit markets like 2008.'
+        }
+    },
+    'sp500_weekly_change': {
+        'name': 'S&P 500 Stock Market Performance',
+        'fmt': '{value:+.1f}%',
+        'levels': {
+            'CONCERNING': 'Stocks have declined {value:.1f}% this week. Markets are showing weakness as investors become more cautious about economic prospects.',
+            'DANGEROUS': 'Stocks have fallen {value:.1f}% this week. This represents a significant decline suggesting investors are fleeing to safety amid growing economic concerns.',
+            'SEVERE': 'Stocks have crashed {value:.1f}% this week. This level of decline indicates panic selling and suggests a potential bear market or recession may be beginning.',
+            'EXTREME': 'Stocks have collapsed {value:.1f}% this week. This represents a market crash level decline, historically seen only during major financial crises or the start of severe recessions.'
+        }
+    },
+    'sector_divergence': {
+        'name': 'Sector Rotation Analysis (Tech vs Industrial Performance)',
+        'fmt': '{value:.1f}',
+        'levels': {
+            'CONCERNING': 'Sector divergence score of {value:.1f} indicates unusual rotation between sectors. Different parts of the economy are performing very differently, suggesting uncertainty about future direction.',
+            'DANGEROUS': 'High sector divergence ({value:.1f}) shows major rotation between tech and industrial stocks. This often happens when investors are uncertain about economic direction and are rapidly shifting strategies.',
+            'SEVERE': 'Extreme sector divergence ({value:.1f}) indicates market structure breakdown. Normal relationships between sectors are breaking down, suggesting major regime change or crisis conditions.',
+            'EXTREME': 'Massive sector divergence ({value:.1f}) shows complete breakdown of normal market relationships. This level historically occurs only during major financial crises when correlations collapse.'
+        }
+    },
+    'treasury_10yr': {
+        'name': '10-Year Treasury Bond Yield',
+        'fmt': '{value:.2f}%',
+        'levels': {
+            'CONCERNING': '10-year Treasury yields are at {value:.2f}%, which may be impacting borrowing costs for mortgages and corporate debt, potentially slowing economic growth.',
+            'DANGEROUS': '10-year yields have reached {value:.2f}%, creating significant pressure on borrowing costs. High rates can trigger recessions by making debt service expensive.',
+            'SEVERE': '10-year yields are at stress levels ({value:.2f}%). These high rates are likely causing significant economic pain through expensive mortgages and corporate borrowing.',
+            'EXTREME': '10-year yields are at crisis levels ({value:.2f}%). Rates this high have historically triggered severe recessions as borrowing becomes prohibitively expensive.'
+        }
+    },
+    'dollar_index': {
+        'name': 'US Dollar Strength Index',
+        'fmt': '{value:.1f}',
+        'levels': {
+            'CONCERNING': 'The dollar is strong at {value:.1f}. While this helps Americans buy foreign goods cheaply, it can hurt US exports and emerging market countries with dollar-denominated debt.',
+            'DANGEROUS': 'The dollar is very strong at {value:.1f}. This can create significant stress for global trade and emerging markets, potentially triggering international financial problems.',
+            'SEVERE': 'The dollar is at crisis-level strength ({value:.1f}). This can cause severe problems for global trade and may trigger emerging market crises that spread back to the US.',
+            'EXTREME': 'The dollar is at extreme strength ({value:.1f}). This level historically creates global financial instability and can trigger worldwide economic crises.'
+        }
+    },
+    'oil_price': {
+        'name': 'Oil Price (Economic Demand Indicator)',
+        'fmt': '${value:.2f}',
+        'levels': {
+            'CONCERNING': 'Oil prices at ${value:.2f} suggest weakening economic demand. Lower oil prices can indicate slowing global growth and reduced industrial activity.',
+            'DANGEROUS': 'Oil has fallen to ${value:.2f}, indicating significant weakness in global economic demand. This level suggests a potential recession as businesses and consumers reduce activity.',
+            'SEVERE': 'Oil prices at ${value:.2f} indicate severe economic weakness. This level historically coincides with recessions as global economic activity contracts sharply.',
+            'EXTREME': 'Oil has collapsed to ${value:.2f}, indicating economic crisis conditions. This level suggests severe global recession with massive reduction in economic activity.'
+        }
+    }
+}
+
+# One-sentence summaries per metric and level
+_METRIC_SUMMARIES = {
+    'yield_spread_10y3m': {
+        'CONCERNING': 'The most reliable recession predictor is approaching dangerous territory',
+        'DANGEROUS': 'The yield curve has inverted - recessions typically follow within 6-18 months',
+        'SEVERE': 'Deep yield curve inversion signals high recession probability',
+        'EXTREME': 'Extreme yield curve inversion indicates potential financial crisis'
+    },
+    'credit_spread_hy': {
+        'CONCERNING': 'Risky companies are finding it harder and more expensive to borrow money',
+        'DANGEROUS': 'Credit markets are stressed - businesses may struggle to get loans',
+        'SEVERE': 'Credit crisis developing - could trigger recession through reduced lending',
+        'EXTREME': 'Credit markets seizing up - threatens entire economy like 2008'
+    },
+    'vix': {
+        'CONCERNING': 'Markets are nervous - expect increased volatility and price swings',
+        'DANGEROUS': 'High market fear - significant declines may be coming',
+        'SEVERE': 'Extreme market panic - potential for major crash conditions',
+        'EXTREME': 'Historic panic levels - markets may be in free-fall'
+    },
+    'credit_spread_ig': {
+        'CONCERNING': 'Even safe companies face higher borrowing costs',
+        'DANGEROUS': 'Credit tightening for all companies signals economic trouble',
+        'SEVERE': 'Severe credit stress threatens business investment',
+        'EXTREME': 'Credit system breakdown threatens economic stability'
+    },
+    'sp500_weekly_change': {
+        'CONCERNING': 'Stock market showing weakness and investor caution',
+        'DANGEROUS': 'Significant market decline suggests growing economic fears',
+        'SEVERE': 'Market crash conditions - bear market may be starting',
+        'EXTREME': 'Stock market collapse - crisis-level conditions'
+    },
+    'sector_divergence': {
+        'CONCERNING': 'Different sectors performing unusually - market uncertainty',
+        'DANGEROUS': 'Major sector rotation indicates confused investor sentiment',
+        'SEVERE': 'Market structure breakdown - normal relationships failing',
+        'EXTREME': 'Complete market breakdown - crisis-level disruption'
+    }
+}
+
+
+# Explanation text only changes with the metric's level and value, which usually repeat
+# between consecutive cycles and between the HTML and text versions of one alert
+@lru_cache(maxsize=256)
+def _explain_metric(metric_name, level, value):
+    """(name, current value, explanation) strings for a metric in _METRIC_TEMPLATES"""
+    tpl = _METRIC_TEMPLATES[metric_name]
+    explanation = tpl['levels'].get(level)
+    return (
+        tpl['name'],
+        tpl['fmt'].format(value=value),
+        explanation.format(value=value) if explanation else f'This metric is at {level} level.'
+    )
+
+@lru_cache(maxsize=256)
+def _simple_summary(metric_name, level):
+    """One-sentence summary for a metric level"""
+    return _METRIC_SUMMARIES.get(metric_name, {}).get(level, f'{metric_name} is at {level} level')
+
+@dataclass(frozen=True)
+class ScoreTable:
+    """Columnar view of a scores dict: one array per field, rows in the dict's order"""
+    names: tuple
+    index: dict
+    values: np.ndarray
+    filtered: np.ndarray
+    weights: np.ndarray
+    levels: tuple
+    
+    @classmethod
+    def from_scores(cls, scores):
+        """Build the table from calculate_enhanced_weighted_score's scores dict"""
+        names = tuple(scores)
+        metrics = scores.values()
+        count = len(names)
+        return cls(
+            names=names,
+            index={name: i for i, name in enumerate(names)},
+            values=np.fromiter((m['value'] for m in metrics), dtype=np.float64, count=count),
+            filtered=np.fromiter((m['filtered_score'] for m in metrics), dtype=np.float64, count=count),
+            weights=np.fromiter((m['weight'] for m in metrics), dtype=np.float64, count=count),
+            levels=tuple(m['level'] for m in metrics)
+        )
+    
+    def filtered_score(self, name):
+        """Filtered score for one metric, -inf if it was not scored"""
+        i = self.index.get(name)
+        return self.filtered[i] if i is not None else -np.inf
+    
+    def concerning(self, threshold=4.0):
+        """Row positions whose filtered score is at or above threshold"""
+        return np.flatnonzero(self.filtered >= threshold)
+
+# Display format spec for each market reading shown in the email bodies
+_MARKET_FORMATS = {
+    'sp500_level': ',.0f',
+    'sp500_weekly_change': '+.1f',
+    'nasdaq_weekly_change': '+.1f',
+    'dow_weekly_change': '+.1f',
+    'treasury_10yr': '.2f',
+    'dollar_index': '.1f',
+    'oil_price': '.2f',
+    'vix': '.1f',
+    'yield_spread_10y3m': '+.2f',
+    'credit_spread_hy': '.1f'
+}
+
+# "Next Key Thresholds" table: (data key, default reading), danger level, (label, description)
+_KEY_THRESHOLD_DEFAULTS = (('yield_spread_10y3m', 0), ('credit_spread_hy', 8), ('vix', 20))
+_KEY_THRESHOLD_LEVELS = np.array([0.0, 10.0, 30.0])
+_KEY_THRESHOLD_LABELS = (
+    ('NY Fed Indicator', 'Inversion'),
+    ('High-Yield Spreads', 'Crisis Level'),
+    ('VIX Fear Index', 'High Volatility')
+)
+
+# Fallback (color, emoji) for threat levels missing from threat_ranges
+_DEFAULT_THREAT_STYLE = ('#FFC107', '🟡')
+
+# Email HTML templates, parsed once at import and filled in per report
+_DAILY_REPORT_HEAD = Template("""
+        <html>
+        <head>
+            <style>
+                body { font-family: 'Segoe UI', Arial, sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; }
+                .container { max-width: 1000px; margin: 0 auto; background: white; border-radius: 12px; box-shadow: 0 4px 12px rgba(0,0,0,0.1); }
+                .header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; border-radius: 12px 12px 0 0; text-align: center; }
+                .content { padding: 30px; }
+                .metric-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; margin: 25px 0; }
+                .metric-card { background: #f8f9fa; border-left: 4px solid #007bff; padding: 20px; border-radius: 8px; }
+                .threat-badge { display: inline-block; padding: 8px 16px; border-radius: 20px; color: white; font-weight: bold; background-color: $color; }
+                .progress-bar { background: #e9ecef; border-radius: 10px; overflow: hidden; height: 20px; margin: 10px 0; }
+                .progress-fill { height: 100%; background: $color; transition: width 0.3s ease; }
+                .analysis-section { background: #e8f4fd; border-left: 4px solid #17a2b8; padding: 20px; margin: 20px 0; border-radius: 8px; }
+                .alert-section { background: #fff3cd; border-left: 4px solid #ffc107; padding: 20px; margin: 20px 0; border-radius: 8px; }
+                .metric-table { width: 100%; border-collapse: collapse; margin: 20px 0; }
+                .metric-table th, .metric-table td { padding: 12px; text-align: left; border-bottom: 1px solid #dee2e6; }
+                .metric-table th { background-color: #f8f9fa; font-weight: 600; }
+                .footer { background: #f8f9fa; padding: 20px; text-align: center; color: #6c757d; font-size: 12px; border-radius: 0 0 12px 12px; }
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <div class="header">
+                    <h1>📊 Daily Finance View</h1>
+                    <h2>$date_str</h2>
+                    <p>Comprehensive Financial Threat Assessment & Market Analysis</p>
+                </div>
+                
+                <div class="content">
+                    <div style="text-align: center; margin: 30px 0;">
+                        <h2>Overall Market Threat Level</h2>
+                        <div class="threat-badge">$emoji $threat_level ($composite_score/7.00)</div>
+                        <div class="progress-bar" style="width: 300px; margin: 20px auto;">
+                            <div class="progress-fill" style="width: $score_pct%"></div>
+                        </div>
+                    </div>
+        
+                    <h3>🔴 Primary Early Warning Indicators</h3>
+                    <div class="metric-grid">
+        """)
+
+_DAILY_METRIC_CARD = Template("""
+                        <div class="metric-card">
+                            <h4>$metric_emoji $display_name</h4>
+                            <p><strong>Value:</strong> $value$unit</p>
+                            <p><strong>Level:</strong> $level</p>
+                            <p><strong>Weight:</strong> $weight</p>
+                            <div class="progress-bar">
+                                <div class="progress-fill" style="background-color: $metric_color; width: $score_pct%"></div>
+                            </div>
+                        </div>
+                """)
+
+_DAILY_MARKET_TABLE = Template("""</div>
+                    <h3>📈 Current Market Readings</h3>
+                    <table class="metric-table">
+                        <thead>
+                            <tr><th>Indicator</th><th>Current Value</th><th>Status</th><th>Trend</th></tr>
+                        </thead>
+                        <tbody>
+                            <tr><td>S&P 500 Level</td><td>$sp500_level</td><td>$sp500_status</td><td>$sp500_trend</td></tr>
+                            <tr><td>NASDAQ Weekly</td><td>$nasdaq_weekly%</td><td>Tech Sector</td><td>$nasdaq_trend</td></tr>
+                            <tr><td>Dow Jones Weekly</td><td>$dow_weekly%</td><td>Industrial</td><td>$dow_trend</td></tr>
+                            <tr><td>10-Year Treasury</td><td>$treasury_10yr%</td><td>$treasury_status</td><td>$treasury_trend</td></tr>
+                            <tr><td>US Dollar Index</td><td>$dollar_index</td><td>$dollar_status</td><td>$dollar_trend</td></tr>
+                            <tr><td>Oil Price (WTI)</td><td>$$$oil_price</td><td>$oil_status</td><td>$oil_trend</td></tr>
+                        </tbody>
+                    </table>
+        
+                    <div class="analysis-section">
+                        <h3>🧠 Enhanced Market Analysis</h3>
+        """)
+
+_DAILY_THRESHOLDS_HEAD = """</div>
+                    <h3>⏭️ Next Key Thresholds to Watch</h3>
+                    <table class="metric-table">
+                        <thead>
+                            <tr><th>Indicator</th><th>Current</th><th>Next Danger Level</th><th>Distance</th></tr>
+                        </thead>
+                        <tbody>
+        """
+
+_DAILY_REPORT_FOOTER = Template("""
+                        </tbody>
+                    </table>
+                </div>
+                
+                <div class="footer">
+                    <p>Enhanced Financial Crisis Monitoring System v2.0<br>
+                    Generated: $timestamp<br>
+                    Next assessment in 15 minutes</p>
+                </div>
+            </div>
+        </body>
+        </html>
+        """)
+
+_ALERT_EMAIL_HEAD = Template("""
+        <html>
+        <head>
+            <style>
+                body { font-family: Arial, sans-serif; margin: 0; padding: 20px; background-color: #fff5f5; }
+                .alert-container { max-width: 800px; margin: 0 auto; background: white; border: 3px solid #dc3545; border-radius: 12px; }
+                .alert-header { background: #dc3545; color: white; padding: 25px; text-align: center; border-radius: 9px 9px 0 0; }
+                .alert-content { padding: 25px; }
+                .urgent-box { background: #f8d7da; border: 2px solid #dc3545; padding: 20px; margin: 20px 0; border-radius: 8px; }
+                .action-box { background: #fff3cd; border: 2px solid #ffc107; padding: 20px; margin: 20px 0; border-radius: 8px; }
+                .metric-detail { background: #fff; border: 1px solid #ddd; padding: 15px; margin: 10px 0; border-radius: 6px; }
+                .metric-summary { color: #dc3545; font-weight: bold; margin-bottom: 10px; }
+                .metric-explanation { color: #333; line-height: 1.4; }
+            </style>
+        </head>
+        <body>
+            <div class="alert-container">
+                <div class="alert-header">
+                    <h1>🚨 FINANCE ALERT: IMMEDIATE ACTION REQUIRED 🚨</h1>
+                    <h2>Threat Level: $threat_level ($composite_score/7.00)</h2>
+                    <p>$timestamp</p>
+                </div>
+                
+                <div class="alert-content">
+                    <div class="urgent-box">
+                        <h3>🚨 CRITICAL CONDITIONS DETECTED:</h3>
+                        <p><strong>Summary:</strong> $concerning_count financial indicators are now at concerning levels that historically signal increased recession risk.</p>
+        """)
+
+_ALERT_TRIGGER_BREAKDOWN = Template("""
+                        </div>
+                        
+                        <div style="background: #f8f9fa; border: 2px solid #dee2e6; padding: 25px; margin: 25px 0; border-radius: 12px;">
+                            <h2 style="color: #dc3545; border-bottom: 2px solid #dc3545; padding-bottom: 10px;">
+                                � TRIGGER ANALYSIS: $title
+                            </h2>
+                            
+                            <div style="background: #fff3cd; padding: 15px; margin: 15px 0; border-radius: 8px; border-left: 5px solid #ffc107;">
+                                <p style="font-size: 18px; margin: 0;"><strong>This metric is signaling $condition — but let's unpack what it really means and how much weight to give it.</strong></p>
+                            </div>
+                            
+                            <hr style="border: 1px solid #dee2e6; margin: 20px 0;">
+                            
+                            <div style="line-height: 1.6; color: #333;">
+                                $what_it_measures
+                                
+                                <hr style="border: 1px solid #dee2e6; margin: 20px 0;">
+                                
+                                $interpretation
+                                
+                                <hr style="border: 1px solid #dee2e6; margin: 20px 0;">
+                                
+                                $assessment
+                                
+                                <hr style="border: 1px solid #dee2e6; margin: 20px 0;">
+                                
+                                $practical_view
+                            </div>
+                        </div>
+                        
+                        <div class="urgent-box">
+                """)
+
+_ALERT_EMAIL_FOOTER = Template("""
+                    </div>
+                    
+                    <div class="action-box">
+                        <h3>⚡ IMMEDIATE ACTIONS REQUIRED:</h3>
+                        <ol>
+                            <li><strong>REVIEW PORTFOLIO ALLOCATION NOW</strong> - Assess your risk exposure based on the above analysis</li>
+                            <li><strong>Consider defensive positioning</strong> - Increase cash, bonds, or defensive stocks if appropriate</li>
+                            <li><strong>Monitor Fed communications closely</strong> - Watch for policy changes that could affect these indicators</li>
+                            <li><strong>Prepare for increased volatility</strong> - Review stop losses and position sizing</li>
+                            <li><strong>Don't panic, but do take action</strong> - These are warning signals, not guaranteed crashes</li>
+                        </ol>
+                        
+                        <p style="background: #e8f4fd; padding: 15px; border-radius: 8px; margin-top: 20px;">
+                            <strong>📊 Remember:</strong> These indicators have high historical accuracy but don't guarantee immediate market crashes. 
+                            Use them as <strong>early warning signals</strong> to adjust your risk profile appropriately, not as reasons to panic.
+                        </p>
+                    </div>
+                    
+                    <h3>📊 Key Market Levels:</h3>
+        
+                    <ul>
+                        <li><strong>S&P 500:</strong> $sp500_level ($sp500_weekly% weekly)</li>
+                        <li><strong>VIX Fear Index:</strong> $vix_value</li>
+                        <li><strong>10Y-3M Spread:</strong> $spread_10y3m%</li>
+                        <li><strong>High-Yield Spreads:</strong> $hy_spreads%</li>
+                    </ul>
+                    
+                    <p style="text-align: center; color: #dc3545; font-weight: bold;">
+                        This is an automated alert. Review your financial strategy immediately.
+                    </p>
+                </div>
+            </div>
+        </body>
+        </html>
+        """)
+
+
 class DualEmailCrisisMonitor(EnhancedThreatAssessmentV2):
     def __init__(self):
         super().__init__()
@@ -39,9 +463,41 @@ class DualEmailCrisisMonitor(EnhancedThreatAssessmentV2):
         }
         # State file for tracking threat level changes
         self.state_file = 'threat_level_state.json'
+        # (color, emoji) per threat level, resolved once for the HTML builders. Keyed by both
+        # the lowercase threat_ranges names and the uppercase names the scorer emits, so the
+        # usual lookup is a direct hit without lowercasing the level first
+        self.threat_styles = {}
+        for level, info in self.threat_ranges.items():
+            style = (info.get('color', _DEFAULT_THREAT_STYLE[0]), info.get('emoji', _DEFAULT_THREAT_STYLE[1]))
+            self.threat_styles[level] = style
+            self.threat_styles.setdefault(sys.intern(level.upper()), style)
+    
+    def get_threat_style(self, level):
+        """Return the (color, emoji) pair for a threat level name (any case)"""
+        style = self.threat_styles.get(level)
+        if style is None:
+            style = self.threat_styles.get(level.lower(), _DEFAULT_THREAT_STYLE)
+        return style
     
     def should_send_alert_email(self, composite_score, scores, data):
         """Determine if an immediate action alert should be sent"""
+        table = ScoreTable.from_scores(scores)
+        return self._alert_triggers(composite_score, table, table.concerning())
+    
+    def evaluate_alerts(self, composite_score, scores):
+        """Alert triggers and concerning-metric explanations from a single scan of scores
+        
+        Returns:
+            (alert_triggers, concerning_metrics) as from should_send_alert_email and
+            get_detailed_concerning_metrics
+        """
+        table = ScoreTable.from_scores(scores)
+        concerning = table.concerning()
+        return (self._alert_triggers(composite_score, table, concerning),
+                self._explain_rows(table, concerning, scores))
+    
+    def _alert_triggers(self, composite_score, table, concerning):
+        """Alert trigger messages for a ScoreTable and its concerning row positions"""
         alert_triggers = []
         
         # Check composite score threshold
@@ -49,23 +505,20 @@ class DualEmailCrisisMonitor(EnhancedThreatAssessmentV2):
             alert_triggers.append(f"Composite threat score: {composite_score:.2f}/7.00 (DANGEROUS+)")
         
         # Check number of concerning indicators
-        concerning_count = sum(1 for metric in scores.values() if metric['filtered_score'] >= 4.0)
+        concerning_count = len(concerning)
         if concerning_count >= self.alert_thresholds['critical_indicators']:
             alert_triggers.append(f"{concerning_count} metrics in concerning territory")
         
         # Check NY Fed recession indicator
-        if ('yield_spread_10y3m' in scores and 
-            scores['yield_spread_10y3m']['filtered_score'] >= 4.0):
+        if table.filtered_score('yield_spread_10y3m') >= 4.0:
             alert_triggers.append("NY Fed recession indicator inverted (10Y-3M)")
         
         # Check high-yield credit stress
-        if ('credit_spread_hy' in scores and 
-            scores['credit_spread_hy']['filtered_score'] >= self.alert_thresholds['credit_stress']):
+        if table.filtered_score('credit_spread_hy') >= self.alert_thresholds['credit_stress']:
             alert_triggers.append("High-yield credit markets in severe stress")
         
         # Check VIX extreme levels
-        if ('vix' in scores and 
-            scores['vix']['filtered_score'] >= self.alert_thresholds['vix_extreme']):
+        if table.filtered_score('vix') >= self.alert_thresholds['vix_extreme']:
             alert_triggers.append("Market volatility reaching crisis levels")
         
         return alert_triggers
@@ -73,12 +526,11 @@ class DualEmailCrisisMonitor(EnhancedThreatAssessmentV2):
     def load_previous_threat_state(self):
         """Load previous threat level from state file"""
         try:
-            import json
-            import os
             if os.path.exists(self.state_file):
-                with open(self.state_file, 'r') as f:
-                    state = json.load(f)
-                    return state.get('composite_score', 0.0), state.get('threat_level', 'EXCELLENT')
+                with open(self.state_file, 'rb') as f:
+                    raw = f.read()
+                state = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+                return state.get('composite_score', 0.0), state.get('threat_level', 'EXCELLENT')
             return 0.0, 'EXCELLENT'  # Default to lowest threat if no previous state
         except Exception as e:
             print(f"Warning: Could not load previous threat state: {e}")
@@ -87,16 +539,19 @@ class DualEmailCrisisMonitor(EnhancedThreatAssessmentV2):
     def save_current_threat_state(self, composite_score, threat_level):
         """Save current threat level to state file"""
         try:
-            import json
-            from datetime import datetime
             state = {
                 'composite_score': composite_score,
                 'threat_level': threat_level,
                 'timestamp': datetime.now().isoformat(),
                 'last_updated': datetime.now().strftime('%B %d, %Y at %I:%M %p')
             }
-            with open(self.state_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            if ORJSON_AVAILABLE:
+                # OPT_SERIALIZE_NUMPY covers a composite score that arrives as a NumPy float
+                raw = orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+            else:
+                raw = json.dumps(state, indent=2).encode('utf-8')
+            with open(self.state_file, 'wb') as f:
+                f.write(raw)
         except Exception as e:
             print(f"Warning: Could not save threat state: {e}")
     
@@ -132,14 +587,12 @@ class DualEmailCrisisMonitor(EnhancedThreatAssessmentV2):
     
     def get_detailed_concerning_metrics(self, scores):
         """Get detailed explanations of concerning metrics in plain English"""
-        concerning_metrics = []
-        
-        for metric_name, metric_data in scores.items():
-            if metric_data['filtered_score'] >= 4.0:
-                explanation = self.get_metric_explanation(metric_name, metric_data)
-                concerning_metrics.append(explanation)
-        
-        return concerning_metrics
+        table = ScoreTable.from_scores(scores)
+        return self._explain_rows(table, table.concerning(), scores)
+    
+    def _explain_rows(self, table, rows, scores):
+        """Plain English explanations for the given ScoreTable row positions"""
+        return [self.get_metric_explanation(table.names[i], scores[table.names[i]]) for i in rows]
     
     def get_metric_explanation(self, metric_name, metric_data):
         """Get plain English explanation of what a metric level means"""
@@ -147,106 +600,12 @@ class DualEmailCrisisMonitor(EnhancedThreatAssessmentV2):
         level = metric_data['level']
         score = metric_data['filtered_score']
         
-        explanations = {
-            'yield_spread_10y3m': {
-                'name': 'NY Fed Recession Indicator (10-Year vs 3-Month Treasury)',
-                'current': f'{value:+.2f}%',
-                'explanation': {
-                    'CONCERNING': f'The yield curve is nearly inverted ({value:+.2f}%). This means investors expect the Fed to cut rates soon, which usually happens during recessions. Historically, when 10-year rates fall below 3-month rates, a recession follows within 6-18 months.',
-                    'DANGEROUS': f'The yield curve is inverted ({value:+.2f}%). This is the most reliable recession predictor - it has preceded every recession since 1969. Markets are pricing in economic trouble ahead.',
-                    'SEVERE': f'The yield curve is deeply inverted ({value:+.2f}%). This level of inversion suggests markets expect a severe economic downturn and aggressive Fed rate cuts.',
-                    'EXTREME': f'The yield curve is extremely inverted ({value:+.2f}%). This level historically occurs only during major financial crises or severe recessions.'
-                }
-            },
-            'credit_spread_hy': {
-                'name': 'High-Yield (Junk Bond) Credit Spreads',
-                'current': f'{value:.1f}%',
-                'explanation': {
-                    'CONCERNING': f'High-yield bond spreads are widening to {value:.1f}%. This means investors are demanding higher returns to lend to risky companies, signaling growing concern about defaults and economic weakness.',
-                    'DANGEROUS': f'High-yield spreads have reached {value:.1f}%. Banks and investors are becoming very worried about companies going bankrupt. This often precedes broader economic problems as lending tightens.',
-                    'SEVERE': f'High-yield spreads are at crisis levels ({value:.1f}%). Credit markets are severely stressed, meaning many companies will struggle to get loans. This can trigger a recession through reduced business investment.',
-                    'EXTREME': f'High-yield spreads are at extreme crisis levels ({value:.1f}%). The credit system is essentially seizing up, similar to 2008. This threatens the entire economy as businesses cannot finance operations.'
-                }
-            },
-            'vix': {
-                'name': 'VIX Fear Index (Market Volatility)',
-                'current': f'{value:.1f}',
-                'explanation': {
-                    'CONCERNING': f'The VIX is elevated at {value:.1f}. Markets are showing increased nervousness and uncertainty. Expect larger daily price swings and more emotional trading decisions.',
-                    'DANGEROUS': f'The VIX has reached {value:.1f}, indicating high fear in markets. Investors are panic-buying protection against crashes. This level often coincides with significant market declines.',
-                    'SEVERE': f'The VIX is at crisis levels ({value:.1f}). Extreme fear is driving markets. This level historically occurs during major crashes like 2008 or 2020, with potential for 20%+ market declines.',
-                    'EXTREME': f'The VIX is at extreme panic levels ({value:.1f}). This represents historic fear not seen outside of major financial crises. Markets may be in free-fall with potential for catastrophic losses.'
-                }
-            },
-            'credit_spread_ig': {
-                'name': 'Investment Grade Corporate Credit Spreads',
-                'current': f'{value:.1f}%',
-                'explanation': {
-                    'CONCERNING': f'Investment grade credit spreads are widening to {value:.1f}%. Even safe companies are seeing borrowing costs rise as investors become more cautious about corporate debt.',
-                    'DANGEROUS': f'Investment grade spreads have reached {value:.1f}%. Investors are worried even about high-quality companies. This suggests broad economic concerns and tighter credit conditions ahead.',
-                    'SEVERE': f'Investment grade spreads are at stress levels ({value:.1f}%). Credit markets are showing severe strain even for the safest corporate borrowers, indicating systemic financial stress.',
-                    'EXTREME': f'Investment grade spreads are at crisis levels ({value:.1f}%). Even the best companies face borrowing difficulties, suggesting a complete breakdown in credit markets like 2008.'
-                }
-            },
-            'sp500_weekly_change': {
-                'name': 'S&P 500 Stock Market Performance',
-                'current': f'{value:+.1f}%',
-                'explanation': {
-                    'CONCERNING': f'Stocks have declined {value:.1f}% this week. Markets are showing weakness as investors become more cautious about economic prospects.',
-                    'DANGEROUS': f'Stocks have fallen {value:.1f}% this week. This represents a significant decline suggesting investors are fleeing to safety amid growing economic concerns.',
-                    'SEVERE': f'Stocks have crashed {value:.1f}% this week. This level of decline indicates panic selling and suggests a potential bear market or recession may be beginning.',
-                    'EXTREME': f'Stocks have collapsed {value:.1f}% this week. This represents a market crash level decline, historically seen only during major financial crises or the start of severe recessions.'
-                }
-            },
-            'sector_divergence': {
-                'name': 'Sector Rotation Analysis (Tech vs Industrial Performance)',
-                'current': f'{value:.1f}',
-                'explanation': {
-                    'CONCERNING': f'Sector divergence score of {value:.1f} indicates unusual rotation between sectors. Different parts of the economy are performing very differently, suggesting uncertainty about future direction.',
-                    'DANGEROUS': f'High sector divergence ({value:.1f}) shows major rotation between tech and industrial stocks. This often happens when investors are uncertain about economic direction and are rapidly shifting strategies.',
-                    'SEVERE': f'Extreme sector divergence ({value:.1f}) indicates market structure breakdown. Normal relationships between sectors are breaking down, suggesting major regime change or crisis conditions.',
-                    'EXTREME': f'Massive sector divergence ({value:.1f}) shows complete breakdown of normal market relationships. This level historically occurs only during major financial crises when correlations collapse.'
-                }
-            },
-            'treasury_10yr': {
-                'name': '10-Year Treasury Bond Yield',
-                'current': f'{value:.2f}%',
-                'explanation': {
-                    'CONCERNING': f'10-year Treasury yields are at {value:.2f}%, which may be impacting borrowing costs for mortgages and corporate debt, potentially slowing economic growth.',
-                    'DANGEROUS': f'10-year yields have reached {value:.2f}%, creating significant pressure on borrowing costs. High rates can trigger recessions by making debt service expensive.',
-                    'SEVERE': f'10-year yields are at stress levels ({value:.2f}%). These high rates are likely causing significant economic pain through expensive mortgages and corporate borrowing.',
-                    'EXTREME': f'10-year yields are at crisis levels ({value:.2f}%). Rates this high have historically triggered severe recessions as borrowing becomes prohibitively expensive.'
-                }
-            },
-            'dollar_index': {
-                'name': 'US Dollar Strength Index',
-                'current': f'{value:.1f}',
-                'explanation': {
-                    'CONCERNING': f'The dollar is strong at {value:.1f}. While this helps Americans buy foreign goods cheaply, it can hurt US exports and emerging market countries with dollar-denominated debt.',
-                    'DANGEROUS': f'The dollar is very strong at {value:.1f}. This can create significant stress for global trade and emerging markets, potentially triggering international financial problems.',
-                    'SEVERE': f'The dollar is at crisis-level strength ({value:.1f}). This can cause severe problems for global trade and may trigger emerging market crises that spread back to the US.',
-                    'EXTREME': f'The dollar is at extreme strength ({value:.1f}). This level historically creates global financial instability and can trigger worldwide economic crises.'
-                }
-            },
-            'oil_price': {
-                'name': 'Oil Price (Economic Demand Indicator)',
-                'current': f'${value:.2f}',
-                'explanation': {
-                    'CONCERNING': f'Oil prices at ${value:.2f} suggest weakening economic demand. Lower oil prices can indicate slowing global growth and reduced industrial activity.',
-                    'DANGEROUS': f'Oil has fallen to ${value:.2f}, indicating significant weakness in global economic demand. This level suggests a potential recession as businesses and consumers reduce activity.',
-                    'SEVERE': f'Oil prices at ${value:.2f} indicate severe economic weakness. This level historically coincides with recessions as global economic activity contracts sharply.',
-                    'EXTREME': f'Oil has collapsed to ${value:.2f}, indicating economic crisis conditions. This level suggests severe global recession with massive reduction in economic activity.'
-                }
-            }
-        }
-        
-        if metric_name in explanations:
-            metric_info = explanations[metric_name]
-            explanation_text = metric_info['explanation'].get(level, f'This metric is at {level} level.')
+        if metric_name in _METRIC_TEMPLATES:
+            name, current_value, explanation_text = _explain_metric(metric_name, level, value)
             
             return {
-                'name': metric_info['name'],
-                'current_value': metric_info['current'],
+                'name': name,
+                'current_value': current_value,
                 'level': level,
                 'score': f'{score:.1f}/7.0',
                 'explanation': explanation_text,
@@ -264,46 +623,7 @@ class DualEmailCrisisMonitor(EnhancedThreatAssessmentV2):
     
     def get_simple_summary(self, metric_name, level):
         """Get a simple one-sentence summary of what the metric means"""
-        summaries = {
-            'yield_spread_10y3m': {
-                'CONCERNING': 'The most reliable recession predictor is approaching dangerous territory',
-                'DANGEROUS': 'The yield curve has inverted - recessions typically follow within 6-18 months',
-                'SEVERE': 'Deep yield curve inversion signals high recession probability',
-                'EXTREME': 'Extreme yield curve inversion indicates potential financial crisis'
-            },
-            'credit_spread_hy': {
-                'CONCERNING': 'Risky companies are finding it harder and more expensive to borrow money',
-                'DANGEROUS': 'Credit markets are stressed - businesses may struggle to get loans',
-                'SEVERE': 'Credit crisis developing - could trigger recession through reduced lending',
-                'EXTREME': 'Credit markets seizing up - threatens entire economy like 2008'
-            },
-            'vix': {
-                'CONCERNING': 'Markets are nervous - expect increased volatility and price swings',
-                'DANGEROUS': 'High market fear - significant declines may be coming',
-                'SEVERE': 'Extreme market panic - potential for major crash conditions',
-                'EXTREME': 'Historic panic levels - markets may be in free-fall'
-            },
-            'credit_spread_ig': {
-                'CONCERNING': 'Even safe companies face higher borrowing costs',
-                'DANGEROUS': 'Credit tightening for all companies signals economic trouble',
-                'SEVERE': 'Severe credit stress threatens business investment',
-                'EXTREME': 'Credit system breakdown threatens economic stability'
-            },
-            'sp500_weekly_change': {
-                'CONCERNING': 'Stock market showing weakness and investor caution',
-                'DANGEROUS': 'Significant market decline suggests growing economic fears',
-                'SEVERE': 'Market crash conditions - bear market may be starting',
-                'EXTREME': 'Stock market collapse - crisis-level conditions'
-            },
-            'sector_divergence': {
-                'CONCERNING': 'Different sectors performing unusually - market uncertainty',
-                'DANGEROUS': 'Major sector rotation indicates confused investor sentiment',
-                'SEVERE': 'Market structure breakdown - normal relationships failing',
-                'EXTREME': 'Complete market breakdown - crisis-level disruption'
-            }
-        }
-        
-        return summaries.get(metric_name, {}).get(level, f'{metric_name} is at {level} level')
+        return _simple_summary(metric_name, level)
     
     def get_friendly_metric_title(self, metric_name, metric_data):
         """Convert technical metric names to user-friendly titles"""
@@ -707,69 +1027,34 @@ An even-handed interpretation:
             'practical_view': f'### 🧭 Practical View\n\nConsider adjusting risk exposure based on this signal.'
         })
     
-    def create_daily_report_html(self, data, composite_score, threat_level, scores):
-        """Create comprehensive daily report HTML"""
-        timestamp = datetime.now().strftime('%B %d, %Y at %I:%M %p')
-        date_str = datetime.now().strftime('%m/%d/%Y')
-        
-        # Pre-format values for HTML template
-        sp500_level = self.safe_format(data.get('sp500_level'), ',.0f')
-        sp500_weekly = self.safe_format(data.get('sp500_weekly_change'), '+.1f')
-        nasdaq_weekly = self.safe_format(data.get('nasdaq_weekly_change'), '+.1f')
-        dow_weekly = self.safe_format(data.get('dow_weekly_change'), '+.1f')
-        treasury_10yr = self.safe_format(data.get('treasury_10yr'), '.2f')
-        dollar_index = self.safe_format(data.get('dollar_index'), '.1f')
-        oil_price = self.safe_format(data.get('oil_price'), '.2f')
-        
-        # Get threat level info
-        threat_info = self.threat_ranges.get(threat_level.lower(), {})
-        color = threat_info.get('color', '#FFC107')
-        emoji = threat_info.get('emoji', '🟡')
+    def email_timestamps(self, now=None):
+        """Return the (long timestamp, MM/DD/YYYY date) strings stamped on the emails
         
-        html = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: 'Segoe UI', Arial, sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; }}
-                .container {{ max-width: 1000px; margin: 0 auto; background: white; border-radius: 12px; box-shadow: 0 4px 12px rgba(0,0,0,0.1); }}
-                .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; border-radius: 12px 12px 0 0; text-align: center; }}
-                .content {{ padding: 30px; }}
-                .metric-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; margin: 25px 0; }}
-                .metric-card {{ background: #f8f9fa; border-left: 4px solid #007bff; padding: 20px; border-radius: 8px; }}
-                .threat-badge {{ display: inline-block; padding: 8px 16px; border-radius: 20px; color: white; font-weight: bold; background-color: {color}; }}
-                .progress-bar {{ background: #e9ecef; border-radius: 10px; overflow: hidden; height: 20px; margin: 10px 0; }}
-                .progress-fill {{ height: 100%; background: {color}; transition: width 0.3s ease; }}
-                .analysis-section {{ background: #e8f4fd; border-left: 4px solid #17a2b8; padding: 20px; margin: 20px 0; border-radius: 8px; }}
-                .alert-section {{ background: #fff3cd; border-left: 4px solid #ffc107; padding: 20px; margin: 20px 0; border-radius: 8px; }}
-                .metric-table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
-                .metric-table th, .metric-table td {{ padding: 12px; text-align: left; border-bottom: 1px solid #dee2e6; }}
-                .metric-table th {{ background-color: #f8f9fa; font-weight: 600; }}
-                .footer {{ background: #f8f9fa; padding: 20px; text-align: center; color: #6c757d; font-size: 12px; border-radius: 0 0 12px 12px; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>📊 Daily Finance View</h1>
-                    <h2>{date_str}</h2>
-                    <p>Comprehensive Financial Threat Assessment & Market Analysis</p>
-                </div>
-                
-                <div class="content">
-                    <div style="text-align: center; margin: 30px 0;">
-                        <h2>Overall Market Threat Level</h2>
-                        <div class="threat-badge">{emoji} {threat_level} ({composite_score:.2f}/7.00)</div>
-                        <div class="progress-bar" style="width: 300px; margin: 20px auto;">
-                            <div class="progress-fill" style="width: {(composite_score/7)*100:.1f}%"></div>
-                        </div>
-                    </div>
+        Args:
+            now: Time of the assessment cycle (defaults to the current time)
         """
+        now = now or datetime.now()
+        return now.strftime('%B %d, %Y at %I:%M %p'), now.strftime('%m/%d/%Y')
+    
+    def create_daily_report_html(self, data, composite_score, threat_level, scores, now=None):
+        """Create comprehensive daily report HTML
         
-        # Primary Indicators Section
-        html += """
-                    <h3>🔴 Primary Early Warning Indicators</h3>
-                    <div class="metric-grid">
+        Args:
+            now: Time of the assessment cycle, shared with the alert email (defaults to the current time)
         """
+        timestamp, date_str = self.email_timestamps(now)
+        
+        # Get threat level info
+        color, emoji = self.get_threat_style(threat_level)
+        
+        parts = [_DAILY_REPORT_HEAD.substitute(
+            color=color,
+            date_str=date_str,
+            emoji=emoji,
+            threat_level=threat_level,
+            composite_score=f'{composite_score:.2f}',
+            score_pct=f'{(composite_score/7)*100:.1f}'
+        )]
         
         primary_metrics = [
             ('yield_spread_10y3m', 'NY Fed Recession Indicator (10Y-3M)', '%'),
@@ -777,247 +1062,147 @@ An even-handed interpretation:
             ('vix', 'Market Fear Index (VIX)', '')
         ]
         
+        table = ScoreTable.from_scores(scores)
         for metric_key, display_name, unit in primary_metrics:
-            if metric_key in scores:
-                metric = scores[metric_key]
-                metric_color = self.threat_ranges.get(metric['level'].lower(), {}).get('color', '#FFC107')
-                metric_emoji = self.threat_ranges.get(metric['level'].lower(), {}).get('emoji', '🟡')
+            i = table.index.get(metric_key)
+            if i is not None:
+                metric_color, metric_emoji = self.get_threat_style(table.levels[i])
                 
-                html += f"""
-                        <div class="metric-card">
-                            <h4>{metric_emoji} {display_name}</h4>
-                            <p><strong>Value:</strong> {metric['value']:.2f}{unit}</p>
-                            <p><strong>Level:</strong> {metric['level']}</p>
-                            <p><strong>Weight:</strong> {metric['weight']:.0%}</p>
-                            <div class="progress-bar">
-                                <div class="progress-fill" style="background-color: {metric_color}; width: {(metric['filtered_score']/7)*100:.1f}%"></div>
-                            </div>
-                        </div>
-                """
+                parts.append(_DAILY_METRIC_CARD.substitute(
+                    metric_emoji=metric_emoji,
+                    display_name=display_name,
+                    value=f"{table.values[i]:.2f}",
+                    unit=unit,
+                    level=table.levels[i],
+                    weight=f"{table.weights[i]:.0%}",
+                    metric_color=metric_color,
+                    score_pct=f"{(table.filtered[i]/7)*100:.1f}"
+                ))
         
-        html += "</div>"
+        # Market Data Table (pre-format values for the HTML template)
+        values = self.format_market_values(data)
+        parts.append(_DAILY_MARKET_TABLE.substitute(
+            sp500_level=values['sp500_level'],
+            sp500_status=scores.get('sp500_weekly_change', {}).get('level', 'N/A'),
+            sp500_trend='📈 Rising' if data.get('sp500_weekly_change', 0) > 0 else '📉 Declining',
+            nasdaq_weekly=values['nasdaq_weekly_change'],
+            nasdaq_trend='📈 Tech Gaining' if data.get('nasdaq_weekly_change', 0) > 0 else '📉 Tech Selling',
+            dow_weekly=values['dow_weekly_change'],
+            dow_trend='📈 Industrial Up' if data.get('dow_weekly_change', 0) > 0 else '📉 Industrial Down',
+            treasury_10yr=values['treasury_10yr'],
+            treasury_status=scores.get('treasury_10yr', {}).get('level', 'N/A'),
+            treasury_trend='📈 Rates Rising' if data.get('treasury_10yr', 0) > 4.0 else '📉 Rates Steady',
+            dollar_index=values['dollar_index'],
+            dollar_status=scores.get('dollar_index', {}).get('level', 'N/A'),
+            dollar_trend='💪 Dollar Strong' if data.get('dollar_index', 0) > 100 else '📉 Dollar Weak',
+            oil_price=values['oil_price'],
+            oil_status=scores.get('oil_price', {}).get('level', 'N/A'),
+            oil_trend='⛽ Energy Rising' if data.get('oil_price', 0) > 70 else '📉 Energy Soft'
+        ))
         
-        # Market Data Table
-        html += f"""
-                    <h3>📈 Current Market Readings</h3>
-                    <table class="metric-table">
-                        <thead>
-                            <tr><th>Indicator</th><th>Current Value</th><th>Status</th><th>Trend</th></tr>
-                        </thead>
-                        <tbody>
-                            <tr><td>S&P 500 Level</td><td>{sp500_level}</td><td>{scores.get('sp500_weekly_change', {}).get('level', 'N/A')}</td><td>{'📈 Rising' if data.get('sp500_weekly_change', 0) > 0 else '📉 Declining'}</td></tr>
-                            <tr><td>NASDAQ Weekly</td><td>{nasdaq_weekly}%</td><td>Tech Sector</td><td>{'📈 Tech Gaining' if data.get('nasdaq_weekly_change', 0) > 0 else '📉 Tech Selling'}</td></tr>
-                            <tr><td>Dow Jones Weekly</td><td>{dow_weekly}%</td><td>Industrial</td><td>{'📈 Industrial Up' if data.get('dow_weekly_change', 0) > 0 else '📉 Industrial Down'}</td></tr>
-                            <tr><td>10-Year Treasury</td><td>{treasury_10yr}%</td><td>{scores.get('treasury_10yr', {}).get('level', 'N/A')}</td><td>{'📈 Rates Rising' if data.get('treasury_10yr', 0) > 4.0 else '📉 Rates Steady'}</td></tr>
-                            <tr><td>US Dollar Index</td><td>{dollar_index}</td><td>{scores.get('dollar_index', {}).get('level', 'N/A')}</td><td>{'💪 Dollar Strong' if data.get('dollar_index', 0) > 100 else '📉 Dollar Weak'}</td></tr>
-                            <tr><td>Oil Price (WTI)</td><td>${oil_price}</td><td>{scores.get('oil_price', {}).get('level', 'N/A')}</td><td>{'⛽ Energy Rising' if data.get('oil_price', 0) > 70 else '📉 Energy Soft'}</td></tr>
-                        </tbody>
-                    </table>
-        """
-        
-        # Enhanced Analysis Section
-        html += """
-                    <div class="analysis-section">
-                        <h3>🧠 Enhanced Market Analysis</h3>
-        """
         
         # Add historical context
         closest_match = self.find_closest_historical_match(data, scores)
         if closest_match:
-            html += f"<p><strong>📚 Historical Pattern:</strong> Current conditions most similar to {closest_match}</p>"
+            parts.append(f"<p><strong>📚 Historical Pattern:</strong> Current conditions most similar to {closest_match}</p>")
         
         # Add sector analysis
         if data.get('sector_divergence', 0) > 1.0:
-            html += "<p><strong>🔄 Sector Rotation:</strong> Significant divergence detected between tech and industrial sectors</p>"
+            parts.append("<p><strong>🔄 Sector Rotation:</strong> Significant divergence detected between tech and industrial sectors</p>")
         
         # Add correlation analysis
         if data.get('correlation_breakdown', False):
-            html += "<p><strong>💥 Market Structure:</strong> Cross-asset correlations breaking down - systematic risk elevated</p>"
+            parts.append("<p><strong>💥 Market Structure:</strong> Cross-asset correlations breaking down - systematic risk elevated</p>")
         
         # Check exit signals
         exit_signals = self.check_enhanced_exit_signals(composite_score, scores)
         if exit_signals:
-            html += "<div class='alert-section'><h4>🚨 Exit Signals Detected:</h4><ul>"
+            parts.append("<div class='alert-section'><h4>🚨 Exit Signals Detected:</h4><ul>")
             for signal in exit_signals:
-                html += f"<li>{signal}</li>"
-            html += "</ul></div>"
-        
-        html += "</div>"
-        
+                parts.append(f"<li>{signal}</li>")
+            parts.append("</ul></div>")
         # Next Thresholds Section
-        html += """
-                    <h3>⏭️ Next Key Thresholds to Watch</h3>
-                    <table class="metric-table">
-                        <thead>
-                            <tr><th>Indicator</th><th>Current</th><th>Next Danger Level</th><th>Distance</th></tr>
-                        </thead>
-                        <tbody>
-        """
+        parts.append(_DAILY_THRESHOLDS_HEAD)
         
-        # Add threshold monitoring
-        key_thresholds = [
-            ('yield_spread_10y3m', 'NY Fed Indicator', data.get('yield_spread_10y3m', 0), 0.0, 'Inversion'),
-            ('credit_spread_hy', 'High-Yield Spreads', data.get('credit_spread_hy', 8), 10.0, 'Crisis Level'),
-            ('vix', 'VIX Fear Index', data.get('vix', 20), 30.0, 'High Volatility')
-        ]
+        # Add threshold monitoring; readings present but None are skipped
+        readings = [data.get(key, default) for key, default in _KEY_THRESHOLD_DEFAULTS]
+        present = np.array([reading is not None for reading in readings])
+        currents = np.array([reading if reading is not None else np.nan for reading in readings], dtype=np.float64)
+        distances = np.abs(_KEY_THRESHOLD_LEVELS - currents)
+        close = distances < _KEY_THRESHOLD_LEVELS * 0.1
         
-        for key, name, current, threshold, description in key_thresholds:
-            if current is not None:
-                distance = abs(threshold - current)
-                status = "⚠️ CLOSE" if distance < (threshold * 0.1) else "✅ Safe"
-                html += f"<tr><td>{name}</td><td>{current:.2f}</td><td>{threshold:.2f} ({description})</td><td>{status} ({distance:.2f})</td></tr>"
+        for i in np.flatnonzero(present):
+            name, description = _KEY_THRESHOLD_LABELS[i]
+            status = "⚠️ CLOSE" if close[i] else "✅ Safe"
+            parts.append(f"<tr><td>{name}</td><td>{currents[i]:.2f}</td><td>{_KEY_THRESHOLD_LEVELS[i]:.2f} ({description})</td><td>{status} ({distances[i]:.2f})</td></tr>")
         
-        html += """
-                        </tbody>
-                    </table>
-                </div>
-                
-                <div class="footer">
-                    <p>Enhanced Financial Crisis Monitoring System v2.0<br>
-                    Generated: {timestamp}<br>
-                    Next assessment in 15 minutes</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """.format(timestamp=timestamp)
+        parts.append(_DAILY_REPORT_FOOTER.substitute(timestamp=timestamp))
         
-        return html
+        return "".join(parts)
     
-    def create_alert_email_html(self, alert_triggers, data, composite_score, threat_level, scores):
-        """Create immediate action alert HTML with detailed metric explanations"""
-        timestamp = datetime.now().strftime('%B %d, %Y at %I:%M %p')
-        
-        # Get detailed explanations for concerning metrics
-        concerning_metrics = self.get_detailed_concerning_metrics(scores)
+    def create_alert_email_html(self, alert_triggers, data, composite_score, threat_level, scores, now=None,
+                                concerning_metrics=None):
+        """Create immediate action alert HTML with detailed metric explanations
         
-        html = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 0; padding: 20px; background-color: #fff5f5; }}
-                .alert-container {{ max-width: 800px; margin: 0 auto; background: white; border: 3px solid #dc3545; border-radius: 12px; }}
-                .alert-header {{ background: #dc3545; color: white; padding: 25px; text-align: center; border-radius: 9px 9px 0 0; }}
-                .alert-content {{ padding: 25px; }}
-                .urgent-box {{ background: #f8d7da; border: 2px solid #dc3545; padding: 20px; margin: 20px 0; border-radius: 8px; }}
-                .action-box {{ background: #fff3cd; border: 2px solid #ffc107; padding: 20px; margin: 20px 0; border-radius: 8px; }}
-                .metric-detail {{ background: #fff; border: 1px solid #ddd; padding: 15px; margin: 10px 0; border-radius: 6px; }}
-                .metric-summary {{ color: #dc3545; font-weight: bold; margin-bottom: 10px; }}
-                .metric-explanation {{ color: #333; line-height: 1.4; }}
-            </style>
-        </head>
-        <body>
-            <div class="alert-container">
-                <div class="alert-header">
-                    <h1>🚨 FINANCE ALERT: IMMEDIATE ACTION REQUIRED 🚨</h1>
-                    <h2>Threat Level: {threat_level} ({composite_score:.2f}/7.00)</h2>
-                    <p>{timestamp}</p>
-                </div>
-                
-                <div class="alert-content">
-                    <div class="urgent-box">
-                        <h3>🚨 CRITICAL CONDITIONS DETECTED:</h3>
-                        <p><strong>Summary:</strong> {len(concerning_metrics)} financial indicators are now at concerning levels that historically signal increased recession risk.</p>
+        Args:
+            now: Time of the assessment cycle, shared with the daily report (defaults to the current time)
+            concerning_metrics: Explanations already built by evaluate_alerts (built here if omitted)
         """
+        timestamp, _ = self.email_timestamps(now)
         
-        # Add comprehensive trigger breakdowns
-        for metric_name, metric_data in scores.items():
-            if metric_data['filtered_score'] >= 4.0:  # Only for concerning metrics
-                breakdown = self.get_comprehensive_trigger_breakdown(metric_name, metric_data, data)
-                
-                html += f"""
-                        </div>
-                        
-                        <div style="background: #f8f9fa; border: 2px solid #dee2e6; padding: 25px; margin: 25px 0; border-radius: 12px;">
-                            <h2 style="color: #dc3545; border-bottom: 2px solid #dc3545; padding-bottom: 10px;">
-                                � TRIGGER ANALYSIS: {breakdown['title']}
-                            </h2>
-                            
-                            <div style="background: #fff3cd; padding: 15px; margin: 15px 0; border-radius: 8px; border-left: 5px solid #ffc107;">
-                                <p style="font-size: 18px; margin: 0;"><strong>This metric is signaling {breakdown['condition']} — but let's unpack what it really means and how much weight to give it.</strong></p>
-                            </div>
-                            
-                            <hr style="border: 1px solid #dee2e6; margin: 20px 0;">
-                            
-                            <div style="line-height: 1.6; color: #333;">
-                                {self.markdown_to_html(breakdown['what_it_measures'])}
-                                
-                                <hr style="border: 1px solid #dee2e6; margin: 20px 0;">
-                                
-                                {self.markdown_to_html(breakdown['interpretation'])}
-                                
-                                <hr style="border: 1px solid #dee2e6; margin: 20px 0;">
-                                
-                                {self.markdown_to_html(breakdown['assessment'])}
-                                
-                                <hr style="border: 1px solid #dee2e6; margin: 20px 0;">
-                                
-                                {self.markdown_to_html(breakdown['practical_view'])}
-                            </div>
-                        </div>
-                        
-                        <div class="urgent-box">
-                """
+        # Get detailed explanations for concerning metrics
+        if concerning_metrics is None:
+            concerning_metrics = self.get_detailed_concerning_metrics(scores)
         
-        html += """
-                    </div>
-                    
-                    <div class="action-box">
-                        <h3>⚡ IMMEDIATE ACTIONS REQUIRED:</h3>
-                        <ol>
-                            <li><strong>REVIEW PORTFOLIO ALLOCATION NOW</strong> - Assess your risk exposure based on the above analysis</li>
-                            <li><strong>Consider defensive positioning</strong> - Increase cash, bonds, or defensive stocks if appropriate</li>
-                            <li><strong>Monitor Fed communications closely</strong> - Watch for policy changes that could affect these indicators</li>
-                            <li><strong>Prepare for increased volatility</strong> - Review stop losses and position sizing</li>
-                            <li><strong>Don't panic, but do take action</strong> - These are warning signals, not guaranteed crashes</li>
-                        </ol>
-                        
-                        <p style="background: #e8f4fd; padding: 15px; border-radius: 8px; margin-top: 20px;">
-                            <strong>📊 Remember:</strong> These indicators have high historical accuracy but don't guarantee immediate market crashes. 
-                            Use them as <strong>early warning signals</strong> to adjust your risk profile appropriately, not as reasons to panic.
-                        </p>
-                    </div>
-                    
-                    <h3>📊 Key Market Levels:</h3>
-        """
+        parts = [_ALERT_EMAIL_HEAD.substitute(
+            threat_level=threat_level,
+            composite_score=f'{composite_score:.2f}',
+            timestamp=timestamp,
+            concerning_count=len(concerning_metrics)
+        )]
         
-        # Format the market data values before inserting into template
-        sp500_level = self.safe_format(data.get('sp500_level'), ',.0f')
-        sp500_weekly = self.safe_format(data.get('sp500_weekly_change'), '+.1f')
-        vix_value = self.safe_format(data.get('vix'), '.1f')
-        spread_10y3m = self.safe_format(data.get('yield_spread_10y3m'), '+.2f')
-        hy_spreads = self.safe_format(data.get('credit_spread_hy'), '.1f')
+        # Add comprehensive trigger breakdowns (only for concerning metrics)
+        table = ScoreTable.from_scores(scores)
+        for i in table.concerning():
+            metric_name = table.names[i]
+            breakdown = self.get_comprehensive_trigger_breakdown(metric_name, scores[metric_name], data)
+            
+            parts.append(_ALERT_TRIGGER_BREAKDOWN.substitute(
+                title=breakdown['title'],
+                condition=breakdown['condition'],
+                what_it_measures=self.markdown_to_html(breakdown['what_it_measures']),
+                interpretation=self.markdown_to_html(breakdown['interpretation']),
+                assessment=self.markdown_to_html(breakdown['assessment']),
+                practical_view=self.markdown_to_html(breakdown['practical_view'])
+            ))
         
-        html += f"""
-                    <ul>
-                        <li><strong>S&P 500:</strong> {sp500_level} ({sp500_weekly}% weekly)</li>
-                        <li><strong>VIX Fear Index:</strong> {vix_value}</li>
-                        <li><strong>10Y-3M Spread:</strong> {spread_10y3m}%</li>
-                        <li><strong>High-Yield Spreads:</strong> {hy_spreads}%</li>
-                    </ul>
-                    
-                    <p style="text-align: center; color: #dc3545; font-weight: bold;">
-                        This is an automated alert. Review your financial strategy immediately.
-                    </p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        # Format the market data values before inserting into template
+        values = self.format_market_values(data)
+        parts.append(_ALERT_EMAIL_FOOTER.substitute(
+            sp500_level=values['sp500_level'],
+            sp500_weekly=values['sp500_weekly_change'],
+            vix_value=values['vix'],
+            spread_10y3m=values['yield_spread_10y3m'],
+            hy_spreads=values['credit_spread_hy']
+        ))
         
-        return html
+        return "".join(parts)
     
     def safe_format(self, value, format_spec):
-        """Safely format a value, handling None and non-numeric values"""
+        """Safely format a value, handling None, NaN and non-numeric values"""
         if value is None:
             return 'N/A'
+        if isinstance(value, (int, float)):
+            # value != value is the NaN check
+            return 'N/A' if value != value else format(value, format_spec)
         try:
-            if isinstance(value, (int, float)):
-                return format(value, format_spec)
-            else:
-                return format(float(value), format_spec)
+            return format(float(value), format_spec)
         except (ValueError, TypeError):
-            return str(value) if value is not None else 'N/A'
+            return str(value)
+    
+    def format_market_values(self, data):
+        """Format every market reading in _MARKET_FORMATS for display in one pass"""
+        return {key: self.safe_format(data.get(key), spec) for key, spec in _MARKET_FORMATS.items()}
     
     def run_dual_email_assessment(self, daily_report=False, email_only=False):
         """Run assessment with dual email system"""
@@ -1044,8 +1229,9 @@ An even-handed interpretation:
             try:
                 alerter = EmailAlerter()
                 
-                # Check if we should send an immediate action alert
-                alert_triggers = self.should_send_alert_email(composite_score, scores, data)
+                # Check if we should send an immediate action alert; the concerning-metric
+                # explanations from the same scan are reused by both alert bodies
+                alert_triggers, concerning_metrics = self.evaluate_alerts(composite_score, scores)
                 
                 # Check if threat level is escalating (only send alert if increasing)
                 should_alert, escalation_reason = self.should_send_escalation_alert(composite_score, threat_level, alert_triggers)
@@ -1053,48 +1239,42 @@ An even-handed interpretation:
                 # Save current state for next comparison
                 self.save_current_threat_state(composite_score, threat_level)
                 
-                # Send daily report (only if explicitly requested)
+                # Pre-format market values for the text versions of both emails
+                values = self.format_market_values(data)
+                # Both emails of this cycle carry the same timestamp
+                now = datetime.now()
+                
+                # Build every email due this cycle first, then send them concurrently:
+                # each send spends most of its time in the SMTP/TLS handshake
+                emails = {}
+                
+                # Daily report (only if explicitly requested)
                 if daily_report:
-                    date_str = datetime.now().strftime('%m/%d/%Y')
+                    _, date_str = self.email_timestamps(now)
                     daily_subject = f"Daily Finance View: {date_str}"
-                    daily_html = self.create_daily_report_html(data, composite_score, threat_level, scores)
-                    
-                    # Pre-format values for text template
-                    sp500_level = self.safe_format(data.get('sp500_level'), ',.0f')
-                    sp500_weekly = self.safe_format(data.get('sp500_weekly_change'), '+.1f')
-                    vix_value = self.safe_format(data.get('vix'), '.1f')
-                    spread_10y3m = self.safe_format(data.get('yield_spread_10y3m'), '+.2f')
+                    daily_html = self.create_daily_report_html(data, composite_score, threat_level, scores, now=now)
                     
                     # Create simple text version for daily report
                     daily_text = f"""
 Daily Finance View - {date_str}
 
 Threat Level: {threat_level} ({composite_score:.2f}/7.00)
-S&P 500: {sp500_level} ({sp500_weekly}%)
-VIX: {vix_value}
-NY Fed Indicator: {spread_10y3m}%
+S&P 500: {values['sp500_level']} ({values['sp500_weekly_change']}%)
+VIX: {values['vix']}
+NY Fed Indicator: {values['yield_spread_10y3m']}%
 
 Full analysis available in HTML version of this email.
                     """
                     
-                    success = alerter.send_email(daily_subject, daily_html, daily_text)
-                    if success:
-                        print(f"✅ Daily finance report sent: {date_str}")
-                    else:
-                        print(f"❌ Failed to send daily report")
+                    emails['daily'] = (daily_subject, daily_html, daily_text)
                 
-                # Send immediate action alert if triggers are met AND threat is escalating
+                # Immediate action alert if triggers are met AND threat is escalating
                 if should_alert:
                     alert_subject = "Finance Alert: Immediate Action"
-                    alert_html = self.create_alert_email_html(alert_triggers, data, composite_score, threat_level, scores)
-                    
-                    # Pre-format values for alert text template
-                    sp500_level = self.safe_format(data.get('sp500_level'), ',.0f')
-                    vix_value = self.safe_format(data.get('vix'), '.1f')
+                    alert_html = self.create_alert_email_html(alert_triggers, data, composite_score, threat_level, scores, now=now,
+                                                              concerning_metrics=concerning_metrics)
                     
                     # Create text version for alert
-                    concerning_metrics = self.get_detailed_concerning_metrics(scores)
-                    
                     alert_text = f"""
 🚨 FINANCE ALERT: IMMEDIATE ACTION REQUIRED
 
@@ -1120,12 +1300,26 @@ IMMEDIATE ACTIONS:
 4. Prepare for increased volatility
 
 Key Levels:
-S&P 500: {sp500_level}
-VIX: {vix_value}
+S&P 500: {values['sp500_level']}
+VIX: {values['vix']}
                     """
                     
-                    success = alerter.send_email(alert_subject, alert_html, alert_text)
-                    if success:
+                    emails['alert'] = (alert_subject, alert_html, alert_text)
+                
+                sent = {}
+                if emails:
+                    with ThreadPoolExecutor(max_workers=len(emails)) as executor:
+                        futures = {kind: executor.submit(alerter.send_email, *email) for kind, email in emails.items()}
+                    sent = {kind: future.result() for kind, future in futures.items()}
+                
+                if daily_report:
+                    if sent['daily']:
+                        print(f"✅ Daily finance report sent: {date_str}")
+                    else:
+                        print(f"❌ Failed to send daily report")
+                
+                if should_alert:
+                    if sent['alert']:
                         print(f"🚨 IMMEDIATE ACTION ALERT SENT - {escalation_reason}")
                         print(f"   Triggers: {len(alert_triggers)} metrics concerning")
                         for trigger in alert_triggers:
@@ -6,11 +6,17 @@ Uses Gmail SMTP - completely free!
 
 import smtplib
 import json
+from email import charset
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
 import os
 
+# The email bodies are mostly ASCII with a few emoji. Quoted-printable keeps ASCII bytes
+# as-is, while the default base64 body encoding inflates every byte by 4/3.
+_UTF8_QP = charset.Charset('utf-8')
+_UTF8_QP.body_encoding = charset.QP
+
 class EmailAlerter:
     def __init__(self, config_file='email_config.json'):
         self.config_file = config_file
@@ -204,8 +210,8 @@ Generated: {timestamp}
             msg['To'] = email_config['to_email']
             
             # Add text and HTML parts
-            text_part = MIMEText(text_body, 'plain')
-            html_part = MIMEText(html_body, 'html')
+            text_part = MIMEText(text_body, 'plain', _UTF8_QP)
+            html_part = MIMEText(html_body, 'html', _UTF8_QP)
             
             msg.attach(text_part)
             msg.attach(html_part)
@@ -8,12 +8,14 @@ Implements proven early warning indicators based on institutional research:
 - Multi-timeframe persistence filters (reduce false signals)
 """
 
-import yfinance as yf
+import hashlib
+import os
+import time
 from datetime import datetime, timedelta
 import numpy as np
 import pandas as pd
 import argparse
-from scipy.stats import pearsonr
+import math
 import warnings
 warnings.filterwarnings("ignore")
 
@@ -25,6 +27,133 @@ except ImportError:
     EMAIL_AVAILABLE = False
     print("📧 Email alerts not available - email_alerter.py not found")
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _pearson(x, y):
+    """Pearson correlation of two equal-length float64 arrays (NaN if either is constant)"""
+    n = x.shape[0]
+    mx = 0.0
+    my = 0.0
+    for i in range(n):
+        mx += x[i]
+        my += y[i]
+    mx /= n
+    my /= n
+    
+    num = 0.0
+    sx = 0.0
+    sy = 0.0
+    for i in range(n):
+        dx = x[i] - mx
+        dy = y[i] - my
+        num += dx * dy
+        sx += dx * dx
+        sy += dy * dy
+    if sx == 0.0 or sy == 0.0:
+        return np.nan
+    return num / math.sqrt(sx * sy)
+
+if NUMBA_AVAILABLE:
+    _pearson = njit(cache=True)(_pearson)
+
+def pearson_with_pvalue(x, y):
+    """Pearson r and its two-sided p-value, matching scipy.stats.pearsonr
+    
+    Args:
+        x, y: Equal-length sequences of observations
+    """
+    from scipy.special import betainc
+    
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    n = x.shape[0]
+    r = _pearson(x, y)
+    if np.isnan(r):
+        return r, np.nan
+    r = max(min(r, 1.0), -1.0)
+    if n < 3:
+        return r, 1.0
+    # Two-sided t-test p-value with n - 2 degrees of freedom, written as a regularized
+    # incomplete beta function of 1 - r^2
+    return r, float(betainc((n - 2) / 2, 0.5, 1.0 - r * r))
+
+# Symbols fetched by get_enhanced_data, grouped by history period
+_SYMBOLS_5D = ("^VIX", "^TNX", "^IRX", "DX-Y.NYB", "CL=F", "HYG")
+_SYMBOLS_7D = ("^GSPC", "^IXIC", "^DJI")
+
+# On-disk yfinance history cache shared by consecutive monitor runs
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "tspMover", "yfinance")
+HISTORY_CACHE_SECONDS = 15 * 60  # matches the monitor's assessment interval
+
+def _history_cache_path(symbol, period):
+    """Cache file for one symbol/period history request"""
+    key = hashlib.sha1(f"{symbol}|{period}".encode()).hexdigest()
+    return os.path.join(_CACHE_DIR, f"history_{key}.pkl")
+
+def _read_cached_history(symbol, period):
+    """Cached history for symbol/period, or None if missing or older than HISTORY_CACHE_SECONDS"""
+    cache_path = _history_cache_path(symbol, period)
+    try:
+        if time.time() - os.path.getmtime(cache_path) < HISTORY_CACHE_SECONDS:
+            return pd.read_pickle(cache_path)
+    except Exception:
+        pass
+    return None
+
+def _write_cached_history(symbol, period, history):
+    """Store a non-empty history; atomic so a concurrent run never reads a partial file"""
+    if history.empty:
+        return
+    cache_path = _history_cache_path(symbol, period)
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        history.to_pickle(tmp_path)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+def cached_histories(symbols, period):
+    """Price histories for symbols; cache misses are fetched together in one threaded yf.download
+    
+    Args:
+        symbols: Ticker symbols to fetch
+        period: yfinance history period
+    
+    Returns:
+        Dict mapping each symbol to its history (an empty DataFrame if Yahoo returned nothing)
+    """
+    histories = {}
+    missing = []
+    for symbol in symbols:
+        history = _read_cached_history(symbol, period)
+        if history is None:
+            missing.append(symbol)
+        else:
+            histories[symbol] = history
+    
+    if missing:
+        # Imported here so runs served entirely from the cache never load yfinance
+        import yfinance as yf
+        
+        bulk = yf.download(missing, period=period, group_by='ticker', threads=True,
+                           progress=False, auto_adjust=True)
+        for symbol in missing:
+            if isinstance(bulk.columns, pd.MultiIndex):
+                history = bulk[symbol] if symbol in bulk.columns.get_level_values(0) else pd.DataFrame()
+            else:
+                history = bulk
+            # The batch shares one date index; drop the days this symbol did not trade
+            history = history.dropna(how='all')
+            _write_cached_history(symbol, period, history)
+            histories[symbol] = history
+    return histories
+
 class EnhancedThreatAssessmentV2:
     def __init__(self):
         # Historical crisis data points for calibration (enhanced with new metrics)
@@ -132,9 +261,12 @@ class EnhancedThreatAssessmentV2:
             # Basic market data
             data = {}
             
+            # One batched request per history period instead of one per symbol
+            history = cached_histories(_SYMBOLS_5D, "5d")
+            history.update(cached_histories(_SYMBOLS_7D, "7d"))
+            
             # VIX
-            vix = yf.Ticker("^VIX")
-            vix_data = vix.history(period="5d")  # Get more history for trends
+            vix_data = history["^VIX"]  # Get more history for trends
             data['vix'] = vix_data['Close'].iloc[-1] if not vix_data.empty else 20.0
             data['vix_trend'] = self.calculate_trend(vix_data['Close']) if len(vix_data) > 1 else 0
             
@@ -142,20 +274,17 @@ class EnhancedThreatAssessmentV2:
             print("   📊 Fetching treasury rates...")
             
             # 10-Year Treasury
-            tnx = yf.Ticker("^TNX")
-            tnx_data = tnx.history(period="5d")
+            tnx_data = history["^TNX"]
             data['treasury_10yr'] = tnx_data['Close'].iloc[-1] if not tnx_data.empty else 4.0
             
             # 2-Year Treasury
-            irx_2y = yf.Ticker("^IRX")  # Actually 13-week, but close approximation
-            irx_2y_data = irx_2y.history(period="5d")
+            irx_2y_data = history["^IRX"]  # Actually 13-week, but close approximation
             data['treasury_2yr'] = irx_2y_data['Close'].iloc[-1] if not irx_2y_data.empty else 4.5
             
             # 3-Month Treasury (NY Fed's preferred indicator)
             try:
                 # Try to get 3-month treasury
-                treasury_3m = yf.Ticker("^IRX")  # 13-week treasury bill
-                treasury_3m_data = treasury_3m.history(period="5d")
+                treasury_3m_data = history["^IRX"]  # 13-week treasury bill
                 data['treasury_3m'] = treasury_3m_data['Close'].iloc[-1] if not treasury_3m_data.empty else 4.8
             except:
                 data['treasury_3m'] = data['treasury_2yr'] + 0.3  # Approximation
@@ -167,8 +296,7 @@ class EnhancedThreatAssessmentV2:
             print("   📈 Fetching equity indices...")
             
             # S&P 500
-            sp500 = yf.Ticker("^GSPC")
-            sp500_data = sp500.history(period="7d")
+            sp500_data = history["^GSPC"]
             if len(sp500_data) >= 2:
                 data['sp500_weekly_change'] = ((sp500_data['Close'].iloc[-1] / sp500_data['Close'].iloc[0]) - 1) * 100
                 data['sp500_level'] = sp500_data['Close'].iloc[-1]
@@ -177,16 +305,14 @@ class EnhancedThreatAssessmentV2:
                 data['sp500_level'] = 6700
                 
             # NASDAQ (tech-heavy for sector analysis)
-            nasdaq = yf.Ticker("^IXIC")
-            nasdaq_data = nasdaq.history(period="7d")
+            nasdaq_data = history["^IXIC"]
             if len(nasdaq_data) >= 2:
                 data['nasdaq_weekly_change'] = ((nasdaq_data['Close'].iloc[-1] / nasdaq_data['Close'].iloc[0]) - 1) * 100
             else:
                 data['nasdaq_weekly_change'] = -2.0
                 
             # Dow Jones (industrial focus)
-            dow = yf.Ticker("^DJI")
-            dow_data = dow.history(period="7d")
+            dow_data = history["^DJI"]
             if len(dow_data) >= 2:
                 data['dow_weekly_change'] = ((dow_data['Close'].iloc[-1] / dow_data['Close'].iloc[0]) - 1) * 100
             else:
@@ -202,13 +328,11 @@ class EnhancedThreatAssessmentV2:
             print("   💰 Fetching currency and commodities...")
             
             # Dollar Index
-            dxy = yf.Ticker("DX-Y.NYB")
-            dxy_data = dxy.history(period="5d")
+            dxy_data = history["DX-Y.NYB"]
             data['dollar_index'] = dxy_data['Close'].iloc[-1] if not dxy_data.empty else 100.0
             
             # Oil price
-            oil = yf.Ticker("CL=F")
-            oil_data = oil.history(period="5d")
+            oil_data = history["CL=F"]
             data['oil_price'] = oil_data['Close'].iloc[-1] if not oil_data.empty else 60.0
             
             print("   🏦 Fetching credit market data...")
@@ -220,8 +344,7 @@ class EnhancedThreatAssessmentV2:
             # High-yield (junk) bonds - early warning indicator
             try:
                 # Try to get high-yield ETF as proxy
-                hy_etf = yf.Ticker("HYG")  # iShares High Yield Corporate Bond ETF
-                hy_data = hy_etf.history(period="5d")
+                hy_data = history["HYG"]  # iShares High Yield Corporate Bond ETF
                 treasury_data = tnx_data['Close'].iloc[-1] if not tnx_data.empty else 4.0
                 
                 # Approximate high-yield spread (simplified calculation)
@@ -296,7 +419,7 @@ class EnhancedThreatAssessmentV2:
             sp500_aligned = sp500_returns.iloc[-min_length:]
             nasdaq_aligned = nasdaq_returns.iloc[-min_length:]
             
-            correlation, p_value = pearsonr(sp500_aligned, nasdaq_aligned)
+            correlation, p_value = pearson_with_pvalue(sp500_aligned.to_numpy(), nasdaq_aligned.to_numpy())
             
             # Correlation breakdown if correlation drops below 0.7
             return correlation < 0.7 and p_value < 0.05
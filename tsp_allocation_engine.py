@@ -11,6 +11,46 @@ from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _score_kernel(values, red, yellow, green):
+    """Score each metric value against its red/yellow/green thresholds (0-100 scale).
+    
+    Applied to aligned float64 arrays; TSPAllocationEngine.score_metric calls it with one element.
+    """
+    scores = np.empty(values.shape[0])
+    for k in range(values.shape[0]):
+        value = values[k]
+        if red[k] > green[k]:
+            # Higher values are bad (most metrics)
+            if value >= red[k]:
+                scores[k] = 100.0
+            elif value >= yellow[k]:
+                scores[k] = 50 + 50 * (value - yellow[k]) / (red[k] - yellow[k])
+            elif value >= green[k]:
+                scores[k] = 50 * (value - green[k]) / (yellow[k] - green[k])
+            else:
+                scores[k] = 0.0
+        else:
+            # Higher values are good (like GDP growth)
+            if value <= red[k]:
+                scores[k] = 100.0
+            elif value <= yellow[k]:
+                scores[k] = 50 + 50 * (yellow[k] - value) / (yellow[k] - red[k])
+            elif value <= green[k]:
+                scores[k] = 50 * (green[k] - value) / (green[k] - yellow[k])
+            else:
+                scores[k] = 0.0
+    return scores
+
+if NUMBA_AVAILABLE:
+    _score_kernel = njit(cache=True)(_score_kernel)
+
 class TSPAllocationEngine:
     def __init__(self, years_to_retirement=None):
         """Initialize the TSP Allocation Engine with metric weights and thresholds.
@@ -1091,34 +1131,11 @@ class TSPAllocationEngine:
     def score_metric(self, value, metric_name):
         """Score a metric based on thresholds (0-100 scale)."""
         thresholds = self.THRESHOLDS[metric_name]
-        red_threshold = thresholds['red']
-        yellow_threshold = thresholds['yellow']
-        green_threshold = thresholds['green']
-        
-        # Determine if higher values are bad (most metrics) or good
-        higher_is_bad = red_threshold > green_threshold
-        
-        if higher_is_bad:
-            if value >= red_threshold:
-                return 100  # Maximum recession risk
-            elif value >= yellow_threshold:
-                # Linear interpolation between yellow and red
-                return 50 + 50 * (value - yellow_threshold) / (red_threshold - yellow_threshold)
-            elif value >= green_threshold:
-                # Linear interpolation between green and yellow
-                return 50 * (value - green_threshold) / (yellow_threshold - green_threshold)
-            else:
-                return 0  # Minimum recession risk
-        else:
-            # For metrics where higher is better (like GDP growth)
-            if value <= red_threshold:
-                return 100
-            elif value <= yellow_threshold:
-                return 50 + 50 * (yellow_threshold - value) / (yellow_threshold - red_threshold)
-            elif value <= green_threshold:
-                return 50 * (green_threshold - value) / (green_threshold - yellow_threshold)
-            else:
-                return 0
+        # One-element call so single metrics and calculate_recession_score share _score_kernel's rules
+        return float(_score_kernel(np.array([value], dtype=np.float64),
+                                   np.array([thresholds['red']], dtype=np.float64),
+                                   np.array([thresholds['yellow']], dtype=np.float64),
+                                   np.array([thresholds['green']], dtype=np.float64))[0])
     
     def calculate_recession_score(self):
         """Calculate overall recession probability score."""
@@ -1144,9 +1161,16 @@ class TSPAllocationEngine:
         
         total_score = 0.0
         
-        for metric_name, (value, description) in metrics.items():
-            # Score the metric (0-100)
-            metric_score = self.score_metric(value, metric_name)
+        # Score every metric (0-100) in one kernel call over aligned arrays
+        names = list(metrics)
+        values = np.array([metrics[name][0] for name in names], dtype=np.float64)
+        red = np.array([self.THRESHOLDS[name]['red'] for name in names], dtype=np.float64)
+        yellow = np.array([self.THRESHOLDS[name]['yellow'] for name in names], dtype=np.float64)
+        green = np.array([self.THRESHOLDS[name]['green'] for name in names], dtype=np.float64)
+        metric_scores = _score_kernel(values, red, yellow, green)
+        
+        for k, (metric_name, (value, description)) in enumerate(metrics.items()):
+            metric_score = float(metric_scores[k])
             
             # Weight the score
             weighted_score = metric_score * self.METRIC_WEIGHTS[metric_name]